@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+from datetime import timedelta
+
+from django.core.management import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from benchmarks.utils import summarize
+from schedules.models import ExamSchedule
+
+
+class Command(BaseCommand):
+    help = "Compare concurrent confirm throughput on a single schedule row versus striped capacity counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=16, help="Number of concurrent worker threads")
+        parser.add_argument("--operations", type=int, default=200, help="Capacity increments per worker")
+        parser.add_argument("--shards", type=int, default=16, help="Number of stripes for the striped scenario")
+        parser.add_argument(
+            "--hold-ms",
+            type=float,
+            default=5.0,
+            help="Time each transaction keeps running after the capacity update (rest of the confirm request)",
+        )
+        parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            raise CommandError("An in-memory SQLite database cannot be shared between worker threads.")
+        if connection.vendor != "postgresql":
+            self.stderr.write(
+                self.style.WARNING(f"{connection.vendor} locks the whole database; results are only indicative.")
+            )
+
+        result = {
+            "vendor": connection.vendor,
+            "workers": options["workers"],
+            "operations_per_worker": options["operations"],
+            "hold_ms": options["hold_ms"],
+            "scenarios": {
+                "single_row": self._run_scenario(0, options),
+                "striped": self._run_scenario(options["shards"], options),
+            },
+        }
+
+        output = json.dumps(result, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Result written to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def _run_scenario(self, shard_count, options):
+        now = timezone.now()
+        schedule = ExamSchedule.objects.create(
+            title="benchmark: capacity contention",
+            start_time=now + timedelta(days=365),
+            end_time=now + timedelta(days=365, hours=2),
+        )
+        if shard_count:
+            schedule.configure_capacity_shards(shard_count)
+
+        latencies, errors = [], []
+        barrier = threading.Barrier(options["workers"] + 1)
+        workers = [
+            threading.Thread(
+                target=self._worker,
+                args=(schedule.id, options["operations"], options["hold_ms"] / 1000, barrier, latencies, errors),
+            )
+            for _ in range(options["workers"])
+        ]
+
+        try:
+            for worker in workers:
+                worker.start()
+            barrier.wait()
+            started = time.perf_counter()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+
+            schedule.refresh_from_db()
+            return {
+                "shards": shard_count,
+                "elapsed_s": round(elapsed, 3),
+                "throughput_ops": round(len(latencies) / elapsed, 1),
+                "errors": len(errors),
+                "confirmed_participants": schedule.get_confirmed_participants(),
+                "latency": summarize(latencies),
+            }
+        finally:
+            schedule.delete()
+
+    @staticmethod
+    def _worker(schedule_id, operations, hold, barrier, latencies, errors):
+        try:
+            barrier.wait()
+            for _ in range(operations):
+                started = time.perf_counter()
+                try:
+                    with transaction.atomic():
+                        ExamSchedule.change_confirmed_participants(schedule_id, 1)
+                        if hold:
+                            time.sleep(hold)
+                except (ValueError, DatabaseError) as e:
+                    errors.append(e)
+                    continue
+                latencies.append(time.perf_counter() - started)
+        finally:
+            connection.close()
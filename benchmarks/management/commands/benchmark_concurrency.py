@@ -0,0 +1,128 @@
+import asyncio
+import json
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+
+from benchmarks.utils import summarize
+from users.serializers.jwt import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test a running server with many concurrent slow clients to compare concurrency limits "
+        "(e.g. gunicorn sync workers on config.wsgi versus an ASGI server on config.asgi)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000/api/exam-schedules/", help="URL to request")
+        parser.add_argument("--username", required=True, help="User whose access token is sent with each request")
+        parser.add_argument(
+            "--concurrency",
+            default="50,200,1000",
+            help="Comma separated numbers of concurrent clients (raise `ulimit -n` for large values)",
+        )
+        parser.add_argument("--requests", type=int, default=5, help="Requests per client at each level")
+        parser.add_argument(
+            "--slow-ms",
+            type=float,
+            default=200.0,
+            help="Delay between sending the request line and the headers (slow client)",
+        )
+        parser.add_argument("--timeout", type=float, default=30.0, help="Per request timeout in seconds")
+        parser.add_argument("--label", default="", help="Label stored in the result (e.g. wsgi, asgi)")
+        parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        url = urlsplit(options["url"])
+        if url.scheme != "http":
+            raise CommandError("Only http:// URLs are supported.")
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist as e:
+            raise CommandError(f"User {options['username']} does not exist.") from e
+
+        token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+        target = {
+            "host": url.hostname,
+            "port": url.port or 80,
+            "path": url.path + (f"?{url.query}" if url.query else ""),
+            "token": token,
+        }
+        levels = [int(level) for level in options["concurrency"].split(",")]
+
+        result = {
+            "label": options["label"],
+            "url": options["url"],
+            "requests_per_client": options["requests"],
+            "slow_ms": options["slow_ms"],
+            "levels": [asyncio.run(self._run_level(target, level, options)) for level in levels],
+        }
+
+        output = json.dumps(result, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Result written to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    async def _run_level(self, target, concurrency, options):
+        latencies, outcomes = [], Counter()
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(self._client(target, options, latencies, outcomes) for _ in range(concurrency)),
+        )
+        elapsed = time.perf_counter() - started
+        return {
+            "concurrency": concurrency,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_rps": round(outcomes["200"] / elapsed, 1),
+            "outcomes": dict(outcomes),
+            "latency": summarize(latencies),
+        }
+
+    async def _client(self, target, options, latencies, outcomes):
+        for _ in range(options["requests"]):
+            started = time.perf_counter()
+            try:
+                status_code = await asyncio.wait_for(self._request(target, options["slow_ms"]), options["timeout"])
+            except TimeoutError:
+                outcomes["timeout"] += 1
+                continue
+            except OSError as e:
+                outcomes[type(e).__name__] += 1
+                continue
+            outcomes[status_code] += 1
+            if status_code == "200":
+                latencies.append(time.perf_counter() - started)
+
+    @staticmethod
+    async def _request(target, slow_ms):
+        reader, writer = await asyncio.open_connection(target["host"], target["port"])
+        try:
+            writer.write(f"GET {target['path']} HTTP/1.1\r\n".encode())
+            await writer.drain()
+            # 느린 클라이언트: 요청 줄을 보낸 뒤 헤더를 늦게 보내 서버의 연결 처리 자원을 점유합니다.
+            await asyncio.sleep(slow_ms / 1000)
+            writer.write(
+                (
+                    f"Host: {target['host']}:{target['port']}\r\n"
+                    f"Authorization: Bearer {target['token']}\r\n"
+                    "Accept: application/json\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+            )
+            await writer.drain()
+
+            status_line = await reader.readline()
+            await reader.read()
+            parts = status_line.split()
+            return parts[1].decode() if len(parts) > 1 else "invalid_response"
+        finally:
+            writer.close()
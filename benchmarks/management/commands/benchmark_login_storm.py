@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from benchmarks.utils import summarize
+from schedules.models import ExamSchedule
+from users.hashers import hashing_executor
+
+User = get_user_model()
+
+USERNAME = "benchmark-login-storm"
+PASSWORD = "benchmark-password"
+
+
+class Command(BaseCommand):
+    help = "Measure exam schedule list latency during a login storm with and without the password hashing pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run each scenario")
+        parser.add_argument("--readers", type=int, default=4, help="Threads requesting the schedule list")
+        parser.add_argument("--logins", type=int, default=32, help="Threads requesting tokens (login storm)")
+        parser.add_argument("--pool-size", type=int, default=2, help="Hashing processes for the pooled scenario")
+        parser.add_argument("--queue-depth", type=int, default=4, help="Hashing queue depth for the pooled scenario")
+        parser.add_argument(
+            "--retry-after-ms", type=float, default=100.0, help="Time a login client waits after a 503 response"
+        )
+        parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            raise CommandError("An in-memory SQLite database cannot be shared between worker threads.")
+
+        user = User.objects.create_user(username=USERNAME, password=PASSWORD)
+        now = timezone.now()
+        schedules = ExamSchedule.objects.bulk_create(
+            ExamSchedule(
+                title=f"benchmark: login storm {index}",
+                start_time=now + timedelta(days=365),
+                end_time=now + timedelta(days=365, hours=2),
+            )
+            for index in range(20)
+        )
+        token = str(RefreshToken.for_user(user).access_token)
+
+        # 응답 캐시 없이 목록 조회 자체의 지연 시간을 측정합니다.
+        test_settings = override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], EXAM_SCHEDULE_CACHE_TIMEOUT=0
+        )
+        try:
+            with test_settings:
+                scenarios = {
+                    "baseline": self._run_scenario(token, 0, 0, 0, options),
+                    "storm_inline": self._run_scenario(token, options["logins"], 0, 0, options),
+                    "storm_pooled": self._run_scenario(
+                        token, options["logins"], options["pool_size"], options["queue_depth"], options
+                    ),
+                }
+        finally:
+            hashing_executor.shutdown()
+            ExamSchedule.objects.filter(id__in=[schedule.id for schedule in schedules]).delete()
+            user.delete()
+
+        result = {
+            "vendor": connection.vendor,
+            "duration_s": options["duration"],
+            "readers": options["readers"],
+            "logins": options["logins"],
+            "scenarios": scenarios,
+        }
+
+        output = json.dumps(result, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Result written to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    def _run_scenario(self, token, logins, pool_size, queue_depth, options):
+        with override_settings(PASSWORD_HASHING_POOL_SIZE=pool_size, PASSWORD_HASHING_QUEUE_DEPTH=queue_depth):
+            if pool_size:
+                # 프로세스 시작 시간이 측정에 포함되지 않도록 풀을 미리 만듭니다.
+                User(username=USERNAME).set_password(PASSWORD)
+
+            stop = threading.Event()
+            read_latencies, login_latencies, login_statuses = [], [], []
+            threads = [
+                threading.Thread(target=self._reader, args=(token, stop, read_latencies))
+                for _ in range(options["readers"])
+            ]
+            threads += [
+                threading.Thread(
+                    target=self._login,
+                    args=(stop, options["retry_after_ms"] / 1000, login_latencies, login_statuses),
+                )
+                for _ in range(logins)
+            ]
+
+            for thread in threads:
+                thread.start()
+            time.sleep(options["duration"])
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        return {
+            "pool_size": pool_size,
+            "queue_depth": queue_depth,
+            "schedule_list": summarize(read_latencies),
+            "login": summarize(login_latencies),
+            "login_statuses": dict(Counter(login_statuses)),
+        }
+
+    @staticmethod
+    def _reader(token, stop, latencies):
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+        url = reverse("schedules:exam-schedules-list")
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                client.get(url)
+                latencies.append(time.perf_counter() - started)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _login(stop, retry_after, latencies, statuses):
+        client = Client()
+        url = reverse("users:token_obtain_pair")
+        try:
+            while not stop.is_set():
+                started = time.perf_counter()
+                response = client.post(url, {"username": USERNAME, "password": PASSWORD})
+                statuses.append(response.status_code)
+                if response.status_code == 503:
+                    stop.wait(retry_after)
+                    continue
+                latencies.append(time.perf_counter() - started)
+        finally:
+            connection.close()
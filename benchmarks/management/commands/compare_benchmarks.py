@@ -0,0 +1,67 @@
+import json
+
+from django.core.management import BaseCommand, CommandError
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "mean_ms")
+
+
+class Command(BaseCommand):
+    help = "Compare two run_benchmarks results and report regressions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("baseline", help="JSON result of the baseline run")
+        parser.add_argument("current", help="JSON result of the run to check")
+        parser.add_argument("--metric", choices=METRICS, default="p95_ms", help="Latency metric to compare")
+        parser.add_argument(
+            "--threshold", type=float, default=10.0, help="Slowdown in percent that counts as a regression"
+        )
+        parser.add_argument(
+            "--fail-on-regression", action="store_true", help="Exit with an error if any benchmark regressed"
+        )
+
+    def handle(self, *args, **options):
+        baseline, current = self._load(options["baseline"]), self._load(options["current"])
+        if baseline["meta"].get("vendor") != current["meta"].get("vendor"):
+            self.stderr.write(
+                self.style.WARNING(
+                    f"Comparing different databases: {baseline['meta'].get('vendor')} "
+                    f"vs {current['meta'].get('vendor')}"
+                )
+            )
+
+        metric, threshold = options["metric"], options["threshold"]
+        regressions = []
+        self.stdout.write(f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'change':>9}  queries")
+        for name, result in current["results"].items():
+            base = baseline["results"].get(name)
+            if base is None or base.get(metric) is None or result.get(metric) is None:
+                self.stdout.write(f"{name:<40} {'-':>12} {result.get(metric, '-'):>12} {'new':>9}")
+                continue
+
+            change = (result[metric] - base[metric]) / base[metric] * 100 if base[metric] else 0.0
+            queries = f"{base.get('queries')} -> {result.get('queries')}"
+            line = f"{name:<40} {base[metric]:>12.3f} {result[metric]:>12.3f} {change:>+8.1f}%  {queries}"
+            if change > threshold or (result.get("queries") or 0) > (base.get("queries") or 0):
+                regressions.append(name)
+                line = self.style.ERROR(line)
+            self.stdout.write(line)
+
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS(f"No regressions (threshold {threshold}% on {metric})"))
+            return
+
+        message = f"{len(regressions)} regression(s): {', '.join(regressions)}"
+        if options["fail_on_regression"]:
+            raise CommandError(message)
+        self.stdout.write(self.style.WARNING(message))
+
+    @staticmethod
+    def _load(path):
+        try:
+            with open(path) as f:
+                result = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise CommandError(f"Cannot read benchmark result {path}: {e}") from e
+        if "results" not in result or "meta" not in result:
+            raise CommandError(f"{path} is not a run_benchmarks result.")
+        return result
@@ -0,0 +1,73 @@
+import json
+import platform
+import subprocess
+
+import django
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+
+from benchmarks.suite import BENCHMARKS, run_benchmark
+
+
+class Command(BaseCommand):
+    help = "Run the reservation lifecycle benchmark suite and write p50/p95/p99 latencies as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50, help="Measured iterations per benchmark")
+        parser.add_argument("--warmup", type=int, default=3, help="Unmeasured iterations per benchmark")
+        parser.add_argument("--only", nargs="+", metavar="NAME", help="Run only the named benchmarks")
+        parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+        parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for benchmark in BENCHMARKS:
+                self.stdout.write(benchmark.name)
+            return
+
+        benchmarks = BENCHMARKS
+        if options["only"]:
+            unknown = set(options["only"]) - {benchmark.name for benchmark in BENCHMARKS}
+            if unknown:
+                raise CommandError(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+            benchmarks = [benchmark for benchmark in BENCHMARKS if benchmark.name in options["only"]]
+
+        results = {}
+        # 테스트 클라이언트 요청이 허용되도록 하고, 조회 캐시 없이 실제 처리 시간을 측정합니다.
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"], EXAM_SCHEDULE_CACHE_TIMEOUT=0):
+            for benchmark in benchmarks:
+                results[benchmark.name] = run_benchmark(benchmark, options["iterations"], options["warmup"])
+                self.stderr.write(f"{benchmark.name}: p95 {results[benchmark.name].get('p95_ms')} ms")
+
+        result = {
+            "meta": {
+                "created_at": timezone.now().isoformat(),
+                "vendor": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "git_commit": self._get_git_commit(),
+                "iterations": options["iterations"],
+                "warmup": options["warmup"],
+            },
+            "results": results,
+        }
+
+        output = json.dumps(result, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Result written to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+    @staticmethod
+    def _get_git_commit():
+        try:
+            return subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR, stderr=subprocess.DEVNULL, text=True
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
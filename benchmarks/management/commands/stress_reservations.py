@@ -0,0 +1,311 @@
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from benchmarks.utils import summarize
+from core.transactions import classify_database_error
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Stress test concurrent confirm/modify/cancel on a few hot schedules and verify that confirmed and pending "
+        "counters always match the reservations and never exceed the maximum (PostgreSQL recommended)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=16, help="Number of concurrent worker threads")
+        parser.add_argument("--operations", type=int, default=200, help="Operations per worker")
+        parser.add_argument("--schedules", type=int, default=3, help="Number of hot schedules")
+        parser.add_argument("--reservations", type=int, default=100, help="Reservations per schedule")
+        parser.add_argument("--max-party", type=int, default=10, help="Maximum expected participants per reservation")
+        parser.add_argument(
+            "--headroom",
+            type=int,
+            default=200,
+            help="Free capacity left on each schedule at the start so that confirms run into the maximum",
+        )
+        parser.add_argument("--shards", type=int, default=0, help="Use striped capacity counters with this many rows")
+        parser.add_argument(
+            "--hold-ms", type=float, default=1.0, help="Time each transaction keeps running after the change"
+        )
+        parser.add_argument(
+            "--lock-timeout-ms", type=int, default=0, help="PostgreSQL lock_timeout per transaction (0: none)"
+        )
+        parser.add_argument(
+            "--check-interval-ms", type=float, default=50.0, help="Interval of invariant checks during the run"
+        )
+        parser.add_argument("--seed", type=int, help="Random seed for reproducible operation sequences")
+        parser.add_argument(
+            "--fail-on-violation", action="store_true", help="Exit with an error if an invariant was violated"
+        )
+        parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            raise CommandError("An in-memory SQLite database cannot be shared between worker threads.")
+        if connection.vendor != "postgresql":
+            self.stderr.write(
+                self.style.WARNING(f"{connection.vendor} locks the whole database; results are only indicative.")
+            )
+
+        user, schedules, pool = self._create_fixtures(options)
+        schedule_ids = [schedule.id for schedule in schedules]
+        try:
+            result = self._run(schedule_ids, pool, options)
+        finally:
+            ExamSchedule.objects.filter(id__in=schedule_ids).delete()
+            user.delete()
+
+        output = json.dumps(result, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Result written to {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+        if options["fail_on_violation"] and not result["invariant"]["ok"]:
+            raise CommandError(f"{len(result['invariant']['violations'])} invariant violation(s) detected.")
+
+    def _create_fixtures(self, options):
+        """
+        인기 일정과 확정 대기 예약을 만듭니다.
+
+        - 일정마다 headroom만 남기고 확정된 예약 하나로 인원을 채워, 짧은 실행에서도 최대 인원 검사가 동작하도록 합니다.
+        - 인원을 채운 예약은 작업 대상(pool)에 포함하지 않습니다.
+        """
+        rng = random.Random(options["seed"])
+        now = timezone.now()
+        user = User.objects.create_user(username=f"stress-{now.timestamp():.0f}-{rng.randrange(10**6)}")
+        filled = max(settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - options["headroom"], 0)
+
+        schedules, pool = [], []
+        for index in range(options["schedules"]):
+            schedule = ExamSchedule.objects.create(
+                title=f"stress: hot schedule {index}",
+                start_time=now + timedelta(days=365),
+                end_time=now + timedelta(days=365, hours=2),
+                confirmed_participants=filled,
+            )
+            if filled:
+                Reservation.objects.create(
+                    user=user, schedule=schedule, expected_participants=filled, is_confirmed=True, confirmed_at=now
+                )
+            if options["shards"]:
+                schedule.configure_capacity_shards(options["shards"])
+            schedules.append(schedule)
+
+            reservations = Reservation.objects.bulk_create(
+                Reservation(user=user, schedule=schedule, expected_participants=rng.randint(1, options["max_party"]))
+                for _ in range(options["reservations"])
+            )
+            ExamSchedule.change_pending_participants(
+                schedule.id, sum(reservation.expected_participants for reservation in reservations), len(reservations)
+            )
+            pool.extend(reservation.id for reservation in reservations)
+
+        return user, schedules, pool
+
+    def _run(self, schedule_ids, pool, options):
+        stats = {"outcomes": Counter(), "latencies": [], "lock_waits": [], "violations": [], "checks": 0}
+        pool_lock, stats_lock = threading.Lock(), threading.Lock()
+        stop = threading.Event()
+        barrier = threading.Barrier(options["workers"] + 1)
+        seed = options["seed"]
+
+        workers = [
+            threading.Thread(
+                target=self._worker,
+                args=(
+                    random.Random(None if seed is None else seed + index),
+                    pool,
+                    pool_lock,
+                    barrier,
+                    stats,
+                    stats_lock,
+                    options,
+                ),
+            )
+            for index in range(options["workers"])
+        ]
+        checker = threading.Thread(target=self._checker, args=(schedule_ids, stop, stats, options))
+
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        started = time.perf_counter()
+        checker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+        stop.set()
+        checker.join()
+
+        final = self._check_invariants(schedule_ids)
+        stats["violations"].extend(row for row in final if not row["ok"])
+        outcomes = stats["outcomes"]
+        completed = outcomes["confirmed"] + outcomes["modified"] + outcomes["cancelled"]
+        return {
+            "vendor": connection.vendor,
+            "workers": options["workers"],
+            "operations_per_worker": options["operations"],
+            "schedules": options["schedules"],
+            "shards": options["shards"],
+            "hold_ms": options["hold_ms"],
+            "elapsed_s": round(elapsed, 3),
+            "throughput_ops": round(completed / elapsed, 1),
+            "outcomes": dict(outcomes),
+            "latency": summarize(stats["latencies"]),
+            "lock_wait": summarize(stats["lock_waits"]),
+            "invariant": {
+                "ok": not stats["violations"],
+                "checks": stats["checks"] + 1,
+                "violations": stats["violations"],
+                "final": final,
+            },
+        }
+
+    def _worker(self, rng, pool, pool_lock, barrier, stats, stats_lock, options):
+        local = {"outcomes": Counter(), "latencies": [], "lock_waits": []}
+        try:
+            barrier.wait()
+            for _ in range(options["operations"]):
+                with pool_lock:
+                    slot = rng.randrange(len(pool))
+                    reservation_id = pool[slot]
+
+                started = time.perf_counter()
+                try:
+                    outcome = self._operate(rng, reservation_id, slot, pool, pool_lock, local, options)
+                except Reservation.DoesNotExist:
+                    # 다른 워커가 먼저 취소(삭제)한 예약
+                    outcome = "stale"
+                except ValueError:
+                    outcome = "rejected"
+                except DatabaseError as e:
+                    outcome = classify_database_error(e)
+                else:
+                    local["latencies"].append(time.perf_counter() - started)
+                local["outcomes"][outcome] += 1
+        finally:
+            connection.close()
+            with stats_lock:
+                stats["outcomes"].update(local["outcomes"])
+                stats["latencies"].extend(local["latencies"])
+                stats["lock_waits"].extend(local["lock_waits"])
+
+    def _operate(self, rng, reservation_id, slot, pool, pool_lock, stats, options):
+        """
+        예약 하나를 API와 같은 방식(예약 행 잠금 후 확정 인원 조건부 UPDATE)으로 확정/인원 변경/취소합니다.
+
+        - 확정 대기 예약은 확정하고, 확정된 예약은 인원을 변경하거나 취소합니다.
+        - 취소된 예약은 같은 일정의 새 확정 대기 예약으로 교체하여 작업 대상 수를 유지합니다.
+        """
+        with transaction.atomic():
+            if options["lock_timeout_ms"] and connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL lock_timeout = %s", [f"{options['lock_timeout_ms']}ms"])
+
+            lock_started = time.perf_counter()
+            reservation = Reservation.objects.select_for_update().get(id=reservation_id)
+            stats["lock_waits"].append(time.perf_counter() - lock_started)
+
+            if not reservation.is_confirmed:
+                reservation.confirm()
+                outcome = "confirmed"
+            elif rng.random() < 0.5:
+                new_expected_participants = rng.randint(1, options["max_party"])
+                reservation.modify_participants(new_expected_participants)
+                reservation.expected_participants = new_expected_participants
+                reservation.save(update_fields=["expected_participants"])
+                outcome = "modified"
+            else:
+                reservation.cancel()
+                reservation.delete()
+                replacement = Reservation.objects.create(
+                    user_id=reservation.user_id,
+                    schedule_id=reservation.schedule_id,
+                    expected_participants=rng.randint(1, options["max_party"]),
+                )
+                transaction.on_commit(lambda: self._replace(pool, pool_lock, slot, reservation_id, replacement.id))
+                outcome = "cancelled"
+
+            if options["hold_ms"]:
+                time.sleep(options["hold_ms"] / 1000)
+        return outcome
+
+    @staticmethod
+    def _replace(pool, pool_lock, slot, old_id, new_id):
+        with pool_lock:
+            if pool[slot] == old_id:
+                pool[slot] = new_id
+
+    def _checker(self, schedule_ids, stop, stats, options):
+        """
+        실행 중 주기적으로 불변 조건을 검사합니다.
+        """
+        try:
+            while not stop.wait(options["check_interval_ms"] / 1000):
+                try:
+                    rows = self._check_invariants(schedule_ids)
+                except DatabaseError:
+                    continue
+                stats["checks"] += 1
+                stats["violations"].extend(row for row in rows if not row["ok"])
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _check_invariants(schedule_ids):
+        """
+        일정의 카운터와 예약 테이블 집계를 한 쿼리(같은 스냅샷)로 조회하여 불변 조건을 검사합니다.
+
+        - 확정 인원 == 확정된 예약의 예상 인원 합계
+        - 확정 인원 <= EXAM_SCHEDULE_MAX_PARTICIPANTS
+        - 확정 대기 인원/예약 수 == 확정 대기 예약의 예상 인원 합계/예약 수
+        """
+        rows = (
+            ExamSchedule.objects.filter(id__in=schedule_ids)
+            .with_counter_totals()
+            .with_reservation_totals()
+            .order_by("id")
+            .values(
+                "id",
+                "confirmed_total",
+                "reserved_confirmed_participants",
+                "pending_total",
+                "reserved_pending_participants",
+                "pending_reservations_total",
+                "reserved_pending_reservations",
+            )
+        )
+        maximum = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
+        return [
+            {
+                "schedule_id": row["id"],
+                "confirmed_participants": row["confirmed_total"],
+                "confirmed_reservations": row["reserved_confirmed_participants"],
+                "pending_participants": row["pending_total"],
+                "pending_reservation_participants": row["reserved_pending_participants"],
+                "ok": (
+                    row["confirmed_total"] == row["reserved_confirmed_participants"]
+                    and row["confirmed_total"] <= maximum
+                    and row["pending_total"] == row["reserved_pending_participants"]
+                    and row["pending_reservations_total"] == row["reserved_pending_reservations"]
+                ),
+            }
+            for row in rows
+        ]
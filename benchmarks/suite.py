@@ -0,0 +1,384 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from benchmarks.utils import summarize
+from reservations.allocation import plan_allocation
+from reservations.models import Reservation
+from reservations.serializers import ReservationListProjection, ReservationSerializer
+from schedules.models import ExamSchedule
+from users.serializers.jwt import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+PASSWORD = "benchmark-password"
+
+
+class Fixtures:
+    """
+    벤치마크에서 공통으로 사용하는 사용자, 관리자, 시험 일정
+    """
+
+    def __init__(self):
+        self.user = User.objects.create_user(username="benchmark-user", password=PASSWORD)
+        self.admin = User.objects.create_user(username="benchmark-admin", password=PASSWORD, is_staff=True)
+        now = timezone.now()
+        self.schedule = ExamSchedule.objects.create(
+            title="benchmark: reservation lifecycle",
+            start_time=now + timedelta(days=365),
+            end_time=now + timedelta(days=365, hours=2),
+        )
+
+    def create_reservation(self, confirmed=False):
+        reservation = Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=1)
+        if confirmed:
+            reservation.confirm()
+        return reservation
+
+    def create_reservations(self, count):
+        reservations = Reservation.objects.bulk_create(
+            Reservation(user=self.user, schedule=self.schedule, expected_participants=1) for _ in range(count)
+        )
+        ExamSchedule.change_pending_participants(self.schedule.id, count, count)
+        return reservations
+
+    def client(self, user=None):
+        token = CustomTokenObtainPairSerializer.get_token(user or self.user).access_token
+        return Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+class Benchmark:
+    """
+    벤치마크 케이스
+
+    - setup은 한 번, prepare는 반복마다 실행되며 측정에 포함되지 않습니다.
+    - run(prepare의 반환값)의 실행 시간만 측정합니다.
+    - iterations가 있으면 명령어의 반복 횟수 대신 사용합니다. (로그인처럼 느린 케이스)
+    """
+
+    name = None
+    iterations = None
+
+    def setup(self, fixtures):
+        self.fixtures = fixtures
+
+    def prepare(self):
+        return None
+
+    def run(self, prepared):
+        raise NotImplementedError
+
+
+class ReservationSerializerValidateBenchmark(Benchmark):
+    name = "reservation_serializer_validate"
+
+    def run(self, prepared):
+        serializer = ReservationSerializer(data={"schedule_id": self.fixtures.schedule.id, "expected_participants": 1})
+        serializer.is_valid(raise_exception=True)
+
+
+class ReservationListSerializerBenchmark(Benchmark):
+    def __init__(self, rows):
+        self.rows = rows
+        self.name = f"reservation_list_serializer_{rows}"
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        fixtures.create_reservations(self.rows)
+        self.queryset = (
+            Reservation.objects.select_related("user")
+            .prefetch_related(Prefetch("schedule", queryset=ExamSchedule.objects.with_counter_totals()))
+            .order_by("-created_at")
+        )
+
+    def run(self, prepared):
+        ReservationSerializer(list(self.queryset[: self.rows]), many=True).data
+
+
+class ReservationListProjectionBenchmark(ReservationListSerializerBenchmark):
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.name = f"reservation_list_projection_{rows}"
+
+    def run(self, prepared):
+        rows = ReservationListProjection.values(self.queryset[: self.rows])
+        [ReservationListProjection.to_representation(row) for row in rows]
+
+
+class ReservationConfirmBenchmark(Benchmark):
+    name = "reservation_confirm"
+
+    def prepare(self):
+        return self.fixtures.create_reservation()
+
+    def run(self, reservation):
+        reservation.confirm()
+
+
+class ReservationModifyParticipantsBenchmark(Benchmark):
+    name = "reservation_modify_participants"
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        self.reservation = fixtures.create_reservation(confirmed=True)
+
+    def prepare(self):
+        return 2 if self.reservation.expected_participants == 1 else 1
+
+    def run(self, expected_participants):
+        self.reservation.modify_participants(expected_participants)
+        self.reservation.expected_participants = expected_participants
+
+
+class ReservationCancelBenchmark(Benchmark):
+    name = "reservation_cancel"
+
+    def prepare(self):
+        return self.fixtures.create_reservation(confirmed=True)
+
+    def run(self, reservation):
+        reservation.cancel()
+
+
+class JWTLoginBenchmark(Benchmark):
+    name = "jwt_login"
+    iterations = 10
+
+    def run(self, prepared):
+        serializer = CustomTokenObtainPairSerializer(
+            data={"username": self.fixtures.user.username, "password": PASSWORD}
+        )
+        serializer.is_valid(raise_exception=True)
+
+
+class APIBenchmark(Benchmark):
+    """
+    테스트 클라이언트로 URL 라우팅, 인증, 권한, 직렬화를 포함한 전체 요청을 측정하는 케이스
+    """
+
+    expected_status = 200
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        self.client = fixtures.client()
+
+    def run(self, prepared):
+        response = self.request(prepared)
+        if response.status_code != self.expected_status:
+            raise AssertionError(f"{self.name}: unexpected status {response.status_code}")
+
+    def request(self, prepared):
+        raise NotImplementedError
+
+
+class APIJWTLoginBenchmark(APIBenchmark):
+    name = "api_jwt_login"
+    iterations = 10
+
+    def request(self, prepared):
+        return Client().post(
+            reverse("users:token_obtain_pair"), {"username": self.fixtures.user.username, "password": PASSWORD}
+        )
+
+
+class APIReservationCreateBenchmark(APIBenchmark):
+    name = "api_reservation_create"
+    expected_status = 201
+
+    def request(self, prepared):
+        return self.client.post(
+            reverse("reservations:reservations-list"),
+            {"schedule_id": self.fixtures.schedule.id, "expected_participants": 1},
+            content_type="application/json",
+        )
+
+
+class APIReservationListBenchmark(APIBenchmark):
+    def __init__(self, params, name):
+        self.params = params
+        self.name = name
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        fixtures.create_reservations(1000)
+
+    def request(self, prepared):
+        return self.client.get(reverse("reservations:reservations-list"), self.params)
+
+
+class APIReservationConfirmBenchmark(APIBenchmark):
+    name = "api_reservation_confirm"
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        self.client = fixtures.client(fixtures.admin)
+
+    def prepare(self):
+        return self.fixtures.create_reservation()
+
+    def request(self, reservation):
+        return self.client.post(reverse("reservations:reservations-confirm", args=[reservation.id]))
+
+
+class APIReservationUpdateBenchmark(APIBenchmark):
+    name = "api_reservation_update"
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        self.reservation = fixtures.create_reservation()
+        self.expected_participants = 1
+
+    def prepare(self):
+        self.expected_participants = 3 - self.expected_participants
+        return self.expected_participants
+
+    def request(self, expected_participants):
+        return self.client.patch(
+            reverse("reservations:reservations-detail", args=[self.reservation.id]),
+            {"expected_participants": expected_participants},
+            content_type="application/json",
+        )
+
+
+class APIReservationDeleteBenchmark(APIBenchmark):
+    name = "api_reservation_delete"
+    expected_status = 204
+
+    def prepare(self):
+        return self.fixtures.create_reservation()
+
+    def request(self, reservation):
+        return self.client.delete(reverse("reservations:reservations-detail", args=[reservation.id]))
+
+
+class AllocationPlanBenchmark(Benchmark):
+    """
+    확정 대기 예약이 남은 인원을 크게 초과하는 일정에 대한 배정 계획 (조회 + 정책 계산)
+
+    - 사용자 `users`명이 1~10명 규모로 `rows`건을 예약한 일정을 사용합니다.
+    """
+
+    iterations = 5
+
+    def __init__(self, policy, rows, users=1000):
+        self.policy = policy
+        self.rows = rows
+        self.users = users
+        self.name = f"allocation_plan_{policy}_{rows}"
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        generator = random.Random(self.rows)
+        users = User.objects.bulk_create(
+            User(username=f"benchmark-allocation-{index}", password="!") for index in range(self.users)
+        )
+        Reservation.objects.bulk_create(
+            (
+                Reservation(
+                    user=generator.choice(users),
+                    schedule=fixtures.schedule,
+                    expected_participants=generator.randint(1, 10),
+                )
+                for _ in range(self.rows)
+            ),
+            batch_size=5000,
+        )
+        pending = Reservation.objects.filter(schedule=fixtures.schedule, is_confirmed=False)
+        ExamSchedule.change_pending_participants(
+            fixtures.schedule.id, sum(pending.values_list("expected_participants", flat=True)), self.rows
+        )
+
+    def run(self, prepared):
+        return plan_allocation(self.fixtures.schedule.id, self.policy)
+
+
+class AllocationApplyBenchmark(AllocationPlanBenchmark):
+    """
+    배정 계획의 반영 (확정 인원 조건부 UPDATE + 예약 상태 일괄 UPDATE)
+
+    - 반복마다 확정된 예약과 일정의 인원을 배정 전 상태로 되돌립니다. (측정에서 제외)
+    """
+
+    iterations = 3
+
+    def __init__(self, policy, rows, users=1000):
+        super().__init__(policy, rows, users)
+        self.name = f"allocation_apply_{policy}_{rows}"
+
+    def setup(self, fixtures):
+        super().setup(fixtures)
+        self.plan = plan_allocation(fixtures.schedule.id, self.policy)
+
+    def prepare(self):
+        Reservation.objects.filter(schedule=self.fixtures.schedule).update(is_confirmed=False, confirmed_at=None)
+        ExamSchedule.objects.filter(id=self.fixtures.schedule.id).update(
+            confirmed_participants=0,
+            pending_participants=self.plan.pending_participants,
+            pending_reservations=self.plan.pending_reservations,
+        )
+        return self.plan
+
+    def run(self, plan):
+        plan.apply()
+
+
+BENCHMARKS = [
+    ReservationSerializerValidateBenchmark(),
+    *(ReservationListSerializerBenchmark(rows) for rows in (10, 100, 1000)),
+    *(ReservationListProjectionBenchmark(rows) for rows in (10, 100, 1000)),
+    ReservationConfirmBenchmark(),
+    ReservationModifyParticipantsBenchmark(),
+    ReservationCancelBenchmark(),
+    JWTLoginBenchmark(),
+    APIJWTLoginBenchmark(),
+    APIReservationCreateBenchmark(),
+    APIReservationListBenchmark({}, "api_reservation_list"),
+    APIReservationListBenchmark({"pagination": "cursor", "page_size": 100}, "api_reservation_list_cursor_100"),
+    APIReservationConfirmBenchmark(),
+    APIReservationUpdateBenchmark(),
+    APIReservationDeleteBenchmark(),
+    *(AllocationPlanBenchmark(policy, 100_000) for policy in ("fifo", "best_fill", "fair_share")),
+    AllocationApplyBenchmark("best_fill", 100_000),
+]
+
+
+def run_benchmark(benchmark, iterations, warmup):
+    """
+    벤치마크 하나를 실행하고 결과(dict)를 반환합니다.
+
+    - 모든 데이터 변경은 트랜잭션 안에서 실행한 뒤 롤백하므로 DB에 남지 않습니다.
+    - 워밍업의 마지막 반복에서 실행된 쿼리 수를 함께 기록합니다.
+    """
+    iterations = benchmark.iterations or iterations
+    latencies = []
+    queries = None
+
+    with transaction.atomic():
+        benchmark.setup(Fixtures())
+
+        for index in range(warmup):
+            prepared = benchmark.prepare()
+            if index == warmup - 1:
+                with CaptureQueriesContext(connection) as context:
+                    benchmark.run(prepared)
+                queries = len(context.captured_queries)
+            else:
+                benchmark.run(prepared)
+
+        for _ in range(iterations):
+            prepared = benchmark.prepare()
+            started = time.perf_counter()
+            benchmark.run(prepared)
+            latencies.append(time.perf_counter() - started)
+
+        transaction.set_rollback(True)
+
+    return {"queries": queries, **summarize(latencies)}
@@ -0,0 +1,118 @@
+import json
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from reservations.models import Reservation
+
+"""
+벤치마크 스위트
+- 선택한 벤치마크 실행 결과에 백분위 지연 시간과 쿼리 수 기록 - 성공
+- 실행 후 벤치마크 데이터가 남지 않음 - 성공
+- 존재하지 않는 벤치마크 이름 - 실패
+- 두 실행 결과 비교 시 임계값을 넘는 회귀 감지 - 실패
+- 동시 확정/인원 변경/취소 중 확정 인원 불변 조건 유지 (PostgreSQL) - 성공
+"""
+
+
+class RunBenchmarksCommandTests(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def run_benchmarks(self, *names):
+        output = Path(self.tmpdir.name) / "result.json"
+        call_command(
+            "run_benchmarks",
+            "--only",
+            *names,
+            "--iterations",
+            "2",
+            "--warmup",
+            "1",
+            "--output",
+            str(output),
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+        return json.loads(output.read_text())
+
+    def write_result(self, name, results):
+        path = Path(self.tmpdir.name) / name
+        path.write_text(json.dumps({"meta": {"vendor": "sqlite"}, "results": results}))
+        return str(path)
+
+    def test_run_benchmarks__success(self):
+        # When
+        result = self.run_benchmarks("reservation_confirm", "api_reservation_update")
+
+        # Then
+        self.assertEqual(result["meta"]["iterations"], 2)
+        self.assertEqual(set(result["results"]), {"reservation_confirm", "api_reservation_update"})
+        for summary in result["results"].values():
+            self.assertEqual(summary["count"], 2)
+            self.assertGreater(summary["queries"], 0)
+            self.assertLessEqual(summary["p50_ms"], summary["p99_ms"])
+
+    def test_run_benchmarks__success_rolls_back_data(self):
+        # When
+        self.run_benchmarks("reservation_confirm")
+
+        # Then
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_run_benchmarks__fail_with_unknown_name(self):
+        # When & Then
+        with self.assertRaises(CommandError):
+            call_command("run_benchmarks", "--only", "unknown", stdout=StringIO())
+
+    def test_compare_benchmarks__fail_with_regression(self):
+        # Given
+        baseline = self.write_result("baseline.json", {"reservation_confirm": {"p95_ms": 1.0, "queries": 3}})
+        current = self.write_result("current.json", {"reservation_confirm": {"p95_ms": 1.5, "queries": 3}})
+
+        # When & Then
+        with self.assertRaisesMessage(CommandError, "reservation_confirm"):
+            call_command("compare_benchmarks", baseline, current, "--fail-on-regression", stdout=StringIO())
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "행 잠금 동시성 검증은 PostgreSQL에서만 실행합니다.")
+class StressReservationsCommandTests(TransactionTestCase):
+    def test_stress_reservations__success(self):
+        # Given
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        output = Path(tmpdir.name) / "stress.json"
+
+        # When
+        call_command(
+            "stress_reservations",
+            "--workers",
+            "8",
+            "--operations",
+            "30",
+            "--headroom",
+            "50",
+            "--seed",
+            "1",
+            "--fail-on-violation",
+            "--output",
+            str(output),
+            stdout=StringIO(),
+            stderr=StringIO(),
+        )
+
+        # Then
+        result = json.loads(output.read_text())
+        self.assertTrue(result["invariant"]["ok"])
+        self.assertGreater(result["outcomes"]["confirmed"], 0)
+        # 남은 인원(50)보다 많은 확정 요청이 들어오므로 최대 인원 초과 요청은 거절됩니다.
+        self.assertGreater(result["outcomes"].get("rejected", 0), 0)
+        for row in result["invariant"]["final"]:
+            self.assertLessEqual(row["confirmed_participants"], settings.EXAM_SCHEDULE_MAX_PARTICIPANTS)
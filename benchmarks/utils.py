@@ -0,0 +1,29 @@
+import math
+
+
+def percentile(sorted_values, percent):
+    """
+    정렬된 값 목록에서 nearest-rank 방식의 백분위 값을 반환합니다.
+    """
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies):
+    """
+    초 단위 지연 시간 목록을 밀리초 단위 통계(dict)로 요약합니다.
+    """
+    values = sorted(latency * 1000 for latency in latencies)
+    if not values:
+        return {"count": 0}
+
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "p50_ms": round(percentile(values, 50), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3),
+    }
@@ -14,4 +14,5 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.prod")
 os.environ.setdefault("DJANGO_ENVIRONMENT_FILE", ".env")
 
+# 일부 조회(GET, HEAD) 요청은 AsyncReadRoutingMiddleware가 비동기 뷰(config.urls_async)로 라우팅합니다.
 application = get_asgi_application()
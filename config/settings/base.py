@@ -22,6 +22,7 @@ env = environ.Env(
     DEBUG=(bool, False),
     ALLOWED_HOSTS=(list, []),
     DATABASE_URL=(str, "sqlite:///db.sqlite3"),
+    CACHE_URL=(str, "locmemcache://"),
 )
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -63,9 +64,13 @@ INSTALLED_APPS = [
     "reservations.apps.ReservationsConfig",
     "schedules.apps.SchedulesConfig",
     "users.apps.UsersConfig",
+    "benchmarks.apps.BenchmarksConfig",
 ]
 
 MIDDLEWARE = [
+    "core.timing.ServerTimingMiddleware",
+    "core.metrics.MetricsMiddleware",
+    "core.middleware.AsyncReadRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -73,9 +78,12 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "users.middleware.HashingPoolBusyMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
+# ASGI 조회 요청을 비동기 뷰로 처리할 URL 설정 (빈 값이면 사용 안 함)
+ASYNC_READ_URLCONF = env.str("ASYNC_READ_URLCONF", default="config.urls_async")
 
 TEMPLATES = [
     {
@@ -103,6 +111,15 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 여러 워커가 캐시를 공유하려면 CACHE_URL=redis://... 를 사용합니다. (redis 패키지 필요)
+
+CACHES = {
+    "default": env.cache(),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -121,6 +138,55 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# 비밀번호 해싱은 해싱 프로세스 풀을 사용 (기존 pbkdf2_sha256 해시와 호환)
+PASSWORD_HASHERS = [
+    "users.hashers.PooledPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+PASSWORD_HASHING_POOL_SIZE = env.int(
+    "PASSWORD_HASHING_POOL_SIZE", default=0
+)  # 해싱 프로세스 수 (0이면 요청 스레드에서 해싱)
+PASSWORD_HASHING_QUEUE_DEPTH = env.int("PASSWORD_HASHING_QUEUE_DEPTH", default=16)  # 초과 시 503 응답
+
+# 요청별 성능 계측 (Server-Timing 헤더와 core.timing 로거의 JSON 로그)
+SERVER_TIMING_SAMPLE_RATE = env.float(
+    "SERVER_TIMING_SAMPLE_RATE", default=0.0
+)  # 계측할 요청 비율 (0~1, 0이면 사용 안 함)
+
+# 예약 쓰기 action 트랜잭션 재시도 (교착 상태, 직렬화 실패, 잠금 시간 초과)
+TRANSACTION_RETRY_ATTEMPTS = env.int("TRANSACTION_RETRY_ATTEMPTS", default=3)  # 최초 실행 이후 재시도 횟수
+TRANSACTION_RETRY_BACKOFF_MS = env.float("TRANSACTION_RETRY_BACKOFF_MS", default=20.0)  # 지수 백오프 기준 (지터 적용)
+TRANSACTION_RETRY_MAX_BACKOFF_MS = env.float("TRANSACTION_RETRY_MAX_BACKOFF_MS", default=500.0)
+# PostgreSQL 트랜잭션별 lock_timeout/statement_timeout (밀리초, 0이면 DB 기본값)
+TRANSACTION_LOCK_TIMEOUT_MS = env.int("TRANSACTION_LOCK_TIMEOUT_MS", default=2000)
+TRANSACTION_STATEMENT_TIMEOUT_MS = env.int("TRANSACTION_STATEMENT_TIMEOUT_MS", default=10000)
+# action별 설정 (예: {"reservations.bulk_confirm": {"statement_timeout_ms": 30000}})
+TRANSACTION_TIMEOUTS = {
+    "reservations.bulk_confirm": {"lock_timeout_ms": 5000, "statement_timeout_ms": 30000},
+}
+
+# Prometheus 지표 (/metrics)
+# 여러 워커 프로세스(gunicorn 등)의 지표를 합산하려면 워커가 공유하는 디렉터리를 지정합니다.
+METRICS_DIR = env.str("METRICS_DIR", default="")
+METRICS_FLUSH_INTERVAL = env.float("METRICS_FLUSH_INTERVAL", default=1.0)  # 프로세스 지표 파일 갱신 주기 (초)
+# 조회 허용 클라이언트 IP/대역 또는 `Authorization: Bearer {토큰}` (둘 다 맞지 않으면 403)
+METRICS_ALLOWED_IPS = env.list("METRICS_ALLOWED_IPS", default=["127.0.0.1", "::1"])
+METRICS_BEARER_TOKEN = env.str("METRICS_BEARER_TOKEN", default="")
+METRICS_GAUGE_CACHE_TIMEOUT = env.int("METRICS_GAUGE_CACHE_TIMEOUT", default=15)  # 일정 테이블 게이지 캐시 (초)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "core.timing": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -147,14 +213,15 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST Framework 설정
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.ClaimsJWTAuthentication",),
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
+        "core.search.IndexedSearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
+    "EXCEPTION_HANDLER": "core.exceptions.exception_handler",
 }
 
 # JWT 설정
@@ -167,6 +234,12 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# JWT 인증 사용자 조회 방식 (db: 매 요청 조회, stateless: 토큰 클레임 사용, cached: 프로세스 내 캐시)
+# stateless/cached는 비활성화/권한 변경이 늦게 반영되므로 명시적으로 선택한 경우에만 사용합니다.
+JWT_AUTH_USER_MODE = env.str("JWT_AUTH_USER_MODE", default="db")
+JWT_AUTH_USER_CACHE_TIMEOUT = env.int("JWT_AUTH_USER_CACHE_TIMEOUT", default=60)  # 초, 0이면 캐시 사용 안 함
+JWT_AUTH_USER_CACHE_MAXSIZE = 10000
+
 # drf-spectacular 설정
 SPECTACULAR_SETTINGS = {
     "TITLE": "시험 일정 예약 시스템 API",
@@ -187,4 +260,12 @@ SPECTACULAR_SETTINGS = {
 
 # APP 설정
 EXAM_RESERVATION_DEADLINE_DAYS = 3
+# 일정의 CHECK 제약 조건과 부분 인덱스 조건에 사용되므로, 변경하면 makemigrations로 새 마이그레이션을 만들어야 합니다.
 EXAM_SCHEDULE_MAX_PARTICIPANTS = 50000
+EXAM_SCHEDULE_CACHE_TIMEOUT = env.int(
+    "EXAM_SCHEDULE_CACHE_TIMEOUT", default=60
+)  # 시험 일정 조회 캐시 (초, 0이면 사용 안 함)
+EXAM_SCHEDULE_STATS_MAX_WINDOW_DAYS = 31  # 예약 통계 조회 구간 최대 너비 (일)
+EXAM_SCHEDULE_START_TIME_CACHE_TIMEOUT = env.int(
+    "EXAM_SCHEDULE_START_TIME_CACHE_TIMEOUT", default=3600
+)  # 예약 생성 시 마감 검사에 사용하는 시험 시작 시간 캐시 (초, 0이면 사용 안 함)
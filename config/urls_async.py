@@ -0,0 +1,22 @@
+"""
+ASGI로 들어온 조회(GET, HEAD) 요청의 URL 설정 (core.middleware.AsyncReadRoutingMiddleware)
+
+자주 호출되는 조회 API는 비동기 뷰로 처리하고, 그 외에는 config.urls를 그대로 사용합니다.
+상세 조회는 숫자 ID만 연결하여 `export/`처럼 목록 하위의 조회 action은 동기 뷰셋으로 처리되도록 합니다.
+"""
+
+from django.urls import path, re_path
+
+from config.urls import urlpatterns as sync_urlpatterns
+from reservations.views import ReservationAsyncView
+from schedules.views import ExamScheduleAsyncView
+from users.views import UserMeAsyncView
+
+urlpatterns = [
+    path("api/users/me/", UserMeAsyncView.as_view()),
+    path("api/exam-schedules/", ExamScheduleAsyncView.as_view(action="list")),
+    re_path(r"^api/exam-schedules/(?P<pk>[0-9]+)/$", ExamScheduleAsyncView.as_view(action="retrieve")),
+    path("api/reservations/", ReservationAsyncView.as_view(action="list")),
+    re_path(r"^api/reservations/(?P<pk>[0-9]+)/$", ReservationAsyncView.as_view(action="retrieve")),
+    *sync_urlpatterns,
+]
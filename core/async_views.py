@@ -0,0 +1,97 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from core.timing import timed
+
+
+class AsyncReadView(View):
+    """
+    DRF 뷰셋의 설정(인증, 권한, 필터, 페이지네이션)을 그대로 사용하는 비동기 조회 뷰
+
+    - view_class(DRF 뷰/뷰셋)의 인스턴스를 만들어 get_queryset, filter_queryset, paginator, 권한 검사를 재사용합니다.
+    - 인증은 인증 클래스의 aauthenticate(없으면 authenticate를 sync_to_async로)로 수행합니다.
+    - 응답은 JSON으로 바로 렌더링한 HttpResponse로 반환합니다. (ASGI 핸들러의 동기 render 호출 방지)
+    - 하위 클래스는 action 이름과 같은 코루틴 메소드(`list`, `retrieve` 등)를 구현합니다.
+    """
+
+    view_class = None
+    action = None
+    renderer = JSONRenderer()
+
+    async def get(self, request, *args, **kwargs):
+        view = self.view_class(
+            action_map={"get": self.action, "head": self.action},
+            args=args,
+            kwargs=kwargs,
+            format_kwarg=None,
+            headers={},
+        )
+        request = view.initialize_request(request, *args, **kwargs)
+        view.request = request
+
+        try:
+            await self.authenticate(request)
+            view.check_permissions(request)
+            view.check_throttles(request)
+            response = await getattr(self, self.action)(view, request, *args, **kwargs)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+
+        return self.render(response)
+
+    @staticmethod
+    async def authenticate(request):
+        for authenticator in request.authenticators:
+            aauthenticate = getattr(authenticator, "aauthenticate", None)
+            if aauthenticate is not None:
+                user_auth_tuple = await aauthenticate(request)
+            else:
+                user_auth_tuple = await sync_to_async(authenticator.authenticate)(request)
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._authenticator = None
+        request.user, request.auth = AnonymousUser(), None
+
+    @staticmethod
+    async def filter_queryset(view, queryset):
+        """
+        view.filter_queryset을 적용합니다.
+
+        - 필터 값 검증(ModelChoiceFilter 등)에 DB 조회가 필요할 수 있으므로 필터 파라미터가 있으면 동기로 실행합니다.
+        """
+        params = view.request.query_params
+        if any(name in params for name in getattr(view, "filterset_fields", None) or []):
+            return await sync_to_async(view.filter_queryset)(queryset)
+        return view.filter_queryset(queryset)
+
+    @staticmethod
+    async def paginate(view, queryset, to_representation):
+        """
+        paginator의 apaginate_queryset으로 페이지를 조회하고, 각 행을 to_representation으로 변환한 응답을 만듭니다.
+        """
+        paginator = view.paginator
+        if paginator is None:
+            return Response([to_representation(row) async for row in queryset])
+
+        page = await paginator.apaginate_queryset(queryset, view.request, view=view)
+        if page is None:
+            return Response([to_representation(row) async for row in queryset])
+        with timed("serializer"):
+            data = [to_representation(row) for row in page]
+        return paginator.get_paginated_response(data)
+
+    def render(self, response):
+        content = b"" if response.data is None else self.renderer.render(response.data)
+        http_response = HttpResponse(content, status=response.status_code, content_type=self.renderer.media_type)
+        for key, value in response.items():
+            if key.lower() != "content-type":
+                http_response[key] = value
+        return http_response
@@ -0,0 +1,106 @@
+import hashlib
+
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "다른 요청에 의해 변경되었습니다. 최신 상태를 다시 조회한 뒤 시도해 주세요."
+    default_code = "precondition_failed"
+
+
+def make_etag(*parts):
+    """
+    버전 정보 등 응답 내용을 결정하는 값들로 강한 ETag(따옴표 포함)를 만듭니다.
+    """
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def make_versioned_etag(version, *parts):
+    """
+    행 버전을 앞에 붙인 강한 ETag (`"{version}-{digest}"`)
+
+    - 조회 응답의 ETag로 사용하며, If-Match 검사에서는 버전 부분만 비교합니다.
+    """
+    digest = hashlib.md5("|".join(str(part) for part in [version, *parts]).encode()).hexdigest()
+    return quote_etag(f"{version}-{digest}")
+
+
+def parse_if_match(request):
+    """
+    If-Match 헤더가 허용하는 행 버전 집합을 반환합니다.
+
+    - 헤더가 없으면 None, `*`이면 "*"를 반환합니다.
+    - If-Match는 강한 비교를 사용하므로 약한 ETag(W/)나 형식이 다른 ETag는 어떤 버전과도 일치하지 않습니다.
+    """
+    if_match = request.headers.get("If-Match")
+    if not if_match:
+        return None
+
+    versions = set()
+    for etag in parse_etags(if_match):
+        if etag == "*":
+            return "*"
+        if etag.startswith("W/"):
+            continue
+        version, _, _ = etag.strip('"').partition("-")
+        if version.isdigit():
+            versions.add(int(version))
+    return versions
+
+
+def check_if_match(if_match, version):
+    """
+    parse_if_match 결과가 현재 행 버전을 허용하지 않으면 PreconditionFailed(412) 예외 발생
+    """
+    if if_match not in (None, "*") and version not in if_match:
+        raise PreconditionFailed()
+
+
+def etag_matches(request, etag):
+    """
+    요청의 If-None-Match 헤더가 주어진 ETag와 일치하는지 여부를 반환합니다.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if not if_none_match:
+        return False
+
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두사를 무시합니다.
+    candidates = {candidate.removeprefix("W/") for candidate in parse_etags(if_none_match)}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_response(request, etag, build_response):
+    """
+    ETag가 If-None-Match와 일치하면 응답을 만들지 않고 304를 반환합니다.
+
+    - 일치하지 않으면 응답을 만들고, 200인 경우 ETag 헤더를 추가합니다.
+    - etag가 None이면(대상이 없는 경우 등) 조건부 처리 없이 응답을 만듭니다.
+    """
+    if etag is None:
+        return build_response()
+
+    if etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response = build_response()
+    if response.status_code == status.HTTP_200_OK:
+        response["ETag"] = etag
+    return response
+
+
+async def aconditional_response(request, etag, abuild_response):
+    """
+    비동기 뷰에서 사용하는 conditional_response (abuild_response는 코루틴 함수)
+    """
+    if etag is not None and etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response = await abuild_response()
+    if etag is not None and response.status_code == status.HTTP_200_OK:
+        response["ETag"] = etag
+    return response
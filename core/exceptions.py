@@ -0,0 +1,24 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler as drf_exception_handler
+
+from users.hashers import HashingPoolBusy
+
+
+class ServiceUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+    default_code = "service_unavailable"
+
+
+def exception_handler(exc, context):
+    """
+    DRF 기본 exception handler에 DRF 밖에서 정의된 예외의 응답을 추가합니다.
+
+    - 해싱 대기열 초과(HashingPoolBusy)는 `Retry-After` 헤더와 함께 503으로 응답합니다.
+    """
+    if isinstance(exc, HashingPoolBusy):
+        wait = exc.wait
+        exc = ServiceUnavailable(exc.message, exc.code)
+        exc.wait = wait
+    return drf_exception_handler(exc, context)
@@ -0,0 +1,184 @@
+import json
+import re
+from itertools import combinations
+
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from reservations.models import Reservation
+from reservations.serializers import ReservationListProjection
+from reservations.views import ReservationViewSet
+from schedules.models import ExamSchedule
+from schedules.serializers import (
+    ExamScheduleAvailabilitySerializer,
+    ExamScheduleListProjection,
+    ExamScheduleStatsProjection,
+    ExamScheduleStatsWindowSerializer,
+)
+from schedules.views import ExamScheduleViewSet
+
+User = get_user_model()
+
+SEQ_SCAN_PATTERNS = {
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+    # "SCAN 테이블" 중 인덱스(USING INDEX/COVERING INDEX)나 가상 테이블(FTS5)을 사용하지 않는 전체 테이블 스캔
+    "sqlite": re.compile(r"^SCAN (\w+)$"),
+}
+
+
+def subsets(names):
+    return [list(subset) for size in range(len(names) + 1) for subset in combinations(names, size)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the list queries of ReservationViewSet/ExamScheduleViewSet for every filter, search and "
+        "pagination combination and flag sequential scans"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--search", default="exam", help="Search term used for the search combinations")
+        parser.add_argument("--plans", action="store_true", help="Print the query plan of every combination")
+        parser.add_argument("--fail-on-seq-scan", action="store_true", help="Exit with an error if any scan is found")
+        parser.add_argument("--output", help="Write the JSON result to this file")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in SEQ_SCAN_PATTERNS:
+            raise CommandError(f"Unsupported database vendor: {connection.vendor}")
+        self.pattern = SEQ_SCAN_PATTERNS[connection.vendor]
+        self.tables = set(connection.introspection.table_names())
+        self.factory = APIRequestFactory()
+
+        results = []
+        for name, queries in self.build_cases(options["search"]):
+            plans = {label: self.explain(queryset, count=label == "count") for label, queryset in queries}
+            seq_scans = sorted({table for plan in plans.values() for table in self.find_seq_scans(plan)})
+            results.append({"name": name, "seq_scans": seq_scans, "plans": plans})
+
+            status = self.style.ERROR(f"SEQ SCAN {', '.join(seq_scans)}") if seq_scans else self.style.SUCCESS("OK")
+            self.stdout.write(f"[{status}] {name}")
+            if options["plans"]:
+                for label, plan in plans.items():
+                    self.stdout.write(f"  {label}:")
+                    self.stdout.write("\n".join(f"    {line}" for line in plan))
+
+        flagged = [result["name"] for result in results if result["seq_scans"]]
+        self.stdout.write(f"{len(results)} combinations, {len(flagged)} with sequential scans")
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump({"vendor": connection.vendor, "results": results}, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Result written to {options['output']}"))
+
+        if flagged and options["fail_on_seq_scan"]:
+            raise CommandError(f"Sequential scans found in {len(flagged)} combination(s).")
+
+    def build_cases(self, search):
+        """
+        (조합 이름, [(쿼리 이름, queryset), ...]) 목록을 만듭니다.
+
+        - 뷰셋의 get_queryset/filter_queryset을 그대로 사용하고, 응답과 같은 프로젝션과 페이지네이션을 적용합니다.
+        - 필터 값은 DB에 있는 첫 일정/사용자의 값을 사용합니다. (없으면 존재하지 않는 값)
+        """
+        schedule = ExamSchedule.objects.order_by("id").first()
+        sample = {
+            "schedule": schedule.id if schedule else 0,
+            "user": Reservation.objects.values_list("user_id", flat=True).first() or 0,
+            "is_confirmed": "false",
+            "start_time": schedule.start_time.isoformat() if schedule else "2000-01-01T00:00:00Z",
+            "end_time": schedule.end_time.isoformat() if schedule else "2000-01-01T00:00:00Z",
+        }
+        staff = User(id=0, is_staff=True)
+        member = User(id=sample["user"], is_staff=False)
+
+        cases = []
+        for role, user, fields in [
+            ("staff", staff, ["schedule", "user", "is_confirmed"]),
+            ("user", member, ["schedule", "is_confirmed"]),
+        ]:
+            for params in self.param_combinations(fields, sample, search):
+                view = self.build_view(ReservationViewSet, "list", user, params)
+                queryset = view.filter_queryset(view.get_queryset())
+                queries = self.paginate(view, queryset, ReservationListProjection)
+                cases.append((f"reservations list {role} {self.describe(params)}", queries))
+
+        for params in self.param_combinations(["start_time", "end_time"], sample, search):
+            view = self.build_view(ExamScheduleViewSet, "list", member, params)
+            queryset = view.filter_queryset(view.get_queryset())
+            queries = self.paginate(view, queryset, ExamScheduleListProjection)
+            cases.append((f"exam-schedules list {self.describe(params)}", queries))
+
+        view = self.build_view(ExamScheduleViewSet, "available", member, {"from": sample["start_time"]})
+        params = ExamScheduleAvailabilitySerializer(data=view.request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = params.filter_queryset(view.filter_queryset(view.get_queryset())).open_for_reservation()
+        paginator = view.keyset_pagination_class()
+        queryset, page_size = paginator._prepare(ExamScheduleListProjection.values(queryset), view.request)
+        cases.append(("exam-schedules available from", [("page", queryset[: page_size + 1])]))
+
+        window = {"from": sample["start_time"], "to": sample["end_time"]}
+        view = self.build_view(ExamScheduleViewSet, "stats", staff, window)
+        window = ExamScheduleStatsWindowSerializer(data=view.request.query_params)
+        window.is_valid(raise_exception=True)
+        queryset = window.filter_queryset(view.filter_queryset(ExamSchedule.objects.all()))
+        rows = ExamScheduleStatsProjection.values(queryset.order_by("start_time", "id"))
+        cases.append(("exam-schedules stats window", [("rows", rows)]))
+        return cases
+
+    @staticmethod
+    def param_combinations(fields, sample, search):
+        combinations_ = []
+        for subset in subsets(fields):
+            for with_search in [False, True]:
+                for pagination in ["page", "cursor"]:
+                    params = {field: sample[field] for field in subset}
+                    if with_search:
+                        params["search"] = search
+                    if pagination == "cursor":
+                        params["pagination"] = "cursor"
+                    combinations_.append(params)
+        return combinations_
+
+    @staticmethod
+    def describe(params):
+        return "+".join(params) or "(no filters)"
+
+    def build_view(self, viewset_class, action, user, params):
+        request = Request(self.factory.get("/", params))
+        request.user = user
+        return viewset_class(action=action, request=request, kwargs={}, args=(), format_kwarg=None)
+
+    @staticmethod
+    def paginate(view, queryset, projection):
+        """
+        목록 응답의 페이지네이션이 실행하는 쿼리 목록 (페이지 번호: COUNT + 페이지, 커서: 페이지)
+        """
+        rows = projection.values(queryset)
+        if view.keyset_pagination_class.is_requested(view.request):
+            rows, page_size = view.keyset_pagination_class()._prepare(rows, view.request)
+            return [("page", rows[: page_size + 1])]
+        page_size = view.paginator.get_page_size(view.request)
+        return [("count", queryset.order_by().values("pk")), ("page", rows[:page_size])]
+
+    @staticmethod
+    def explain(queryset, count=False):
+        sql, params = queryset.query.sql_with_params()
+        if count:
+            sql = f"SELECT COUNT(*) FROM ({sql}) subquery"
+        with connection.cursor() as cursor:
+            cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+            rows = cursor.fetchall()
+        if connection.vendor == "sqlite":
+            return [row[-1] for row in rows]
+        return [row[0] for row in rows]
+
+    def find_seq_scans(self, plan):
+        tables = []
+        for line in plan:
+            match = self.pattern.search(line.strip())
+            if match and match.group(1) in self.tables:
+                tables.append(match.group(1))
+        return tables
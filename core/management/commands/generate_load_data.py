@@ -0,0 +1,230 @@
+import csv
+import io
+import random
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from reservations.models import Reservation
+from schedules.cache import invalidate_schedule_cache
+from schedules.models import ExamSchedule
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Generate a large synthetic dataset of users, schedules and reservations for capacity planning"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="Number of users to create")
+        parser.add_argument("--schedules", type=int, default=100, help="Number of exam schedules to create")
+        parser.add_argument(
+            "--reservations-per-schedule", type=int, default=100, help="Reservations created for each schedule"
+        )
+        parser.add_argument(
+            "--confirmed-ratio", type=float, default=0.3, help="Share of reservations that are confirmed (0-1)"
+        )
+        parser.add_argument("--max-party", type=int, default=10, help="Maximum expected participants per reservation")
+        parser.add_argument(
+            "--days-before", type=int, default=30, help="Earliest schedule start, in days before now (past exams)"
+        )
+        parser.add_argument("--days-after", type=int, default=180, help="Latest schedule start, in days after now")
+        parser.add_argument(
+            "--distribution",
+            choices=["uniform", "peak"],
+            default="uniform",
+            help="Distribution of schedule start times (peak: concentrated just after the reservation deadline)",
+        )
+        parser.add_argument("--batch-size", type=int, default=10000, help="Rows per INSERT/COPY batch")
+        parser.add_argument("--copy", action="store_true", help="Load users and reservations with COPY (PostgreSQL)")
+        parser.add_argument("--prefix", default="load", help="Username prefix of the generated users")
+        parser.add_argument("--password", default="loadtest-password", help="Password of every generated user")
+        parser.add_argument("--seed", type=int, help="Random seed for a reproducible dataset")
+
+    def handle(self, *args, **options):
+        if not 0 <= options["confirmed_ratio"] <= 1:
+            raise CommandError("--confirmed-ratio must be between 0 and 1.")
+        if options["users"] < 1 or options["max_party"] < 1 or options["batch_size"] < 1:
+            raise CommandError("--users, --max-party and --batch-size must be positive.")
+        if options["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy is only supported on PostgreSQL.")
+        if User.objects.filter(username__startswith=f"{options['prefix']}-").exists():
+            raise CommandError(f"Users with the prefix {options['prefix']!r} already exist. Use another --prefix.")
+
+        self.rng = random.Random(options["seed"])
+        self.now = timezone.now()
+        started = time.perf_counter()
+
+        user_ids = self._create_users(options)
+        self.stdout.write(f"{len(user_ids)} users created ({time.perf_counter() - started:.1f}s)")
+
+        schedule_count, reservation_count = self._create_schedules_and_reservations(user_ids, options)
+        invalidate_schedule_cache()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(user_ids)} users, {schedule_count} schedules and {reservation_count} reservations "
+                f"in {elapsed:.1f}s ({(len(user_ids) + reservation_count) / elapsed:.0f} rows/s)."
+            )
+        )
+
+    def _create_users(self, options):
+        """
+        사용자를 배치 단위로 생성하고 생성된 ID 목록을 반환합니다.
+
+        - 비밀번호 해시는 한 번만 계산하여 모든 사용자에게 같은 값을 사용합니다. (사용자별 해싱 비용 제거)
+        """
+        password = make_password(options["password"])
+        prefix, total, batch_size = options["prefix"], options["users"], options["batch_size"]
+        width = len(str(total))
+
+        for offset in range(0, total, batch_size):
+            usernames = [f"{prefix}-{index:0{width}d}" for index in range(offset, min(offset + batch_size, total))]
+            with transaction.atomic():
+                if options["copy"]:
+                    self._copy(
+                        User,
+                        [
+                            "username",
+                            "password",
+                            "first_name",
+                            "last_name",
+                            "email",
+                            "is_staff",
+                            "is_superuser",
+                            "is_active",
+                            "date_joined",
+                        ],
+                        ([username, password, "", "", "", False, False, True, self.now] for username in usernames),
+                    )
+                else:
+                    User.objects.bulk_create(
+                        (User(username=username, password=password, date_joined=self.now) for username in usernames),
+                        batch_size=batch_size,
+                    )
+
+        return list(User.objects.filter(username__startswith=f"{prefix}-").order_by("id").values_list("id", flat=True))
+
+    def _create_schedules_and_reservations(self, user_ids, options):
+        """
+        일정과 예약을 일정 묶음 단위의 트랜잭션으로 생성합니다.
+
+        - 일정별 예약(사용자, 인원, 확정 여부)을 먼저 정하고, 확정/확정 대기 예약의 합계를 일정의 카운터로 저장합니다.
+        - 확정 인원이 최대 인원(EXAM_SCHEDULE_MAX_PARTICIPANTS)을 넘게 되는 예약은 확정 대기로 남깁니다.
+        - 커밋된 시점마다 일정의 확정/확정 대기 카운터와 예약 테이블의 합계가 항상 일치합니다.
+        """
+        per_schedule = options["reservations_per_schedule"]
+        chunk_size = max(options["batch_size"] // max(per_schedule, 1), 1)
+        reservation_count = 0
+
+        for offset in range(0, options["schedules"], chunk_size):
+            plans = [
+                self._plan_reservations(user_ids, options)
+                for _ in range(min(chunk_size, options["schedules"] - offset))
+            ]
+            with transaction.atomic():
+                schedules = ExamSchedule.objects.bulk_create(
+                    self._build_schedule(offset + index, plan, options) for index, plan in enumerate(plans)
+                )
+                rows = [
+                    (user_id, schedule.id, expected_participants, is_confirmed)
+                    for schedule, plan in zip(schedules, plans, strict=True)
+                    for user_id, expected_participants, is_confirmed in plan
+                ]
+                self._create_reservations(rows, options)
+            reservation_count += len(rows)
+            self.stdout.write(f"{offset + len(plans)} schedules, {reservation_count} reservations")
+
+        return options["schedules"], reservation_count
+
+    def _plan_reservations(self, user_ids, options):
+        maximum = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
+        confirmed_total = 0
+        plan = []
+        for _ in range(options["reservations_per_schedule"]):
+            expected_participants = self.rng.randint(1, options["max_party"])
+            is_confirmed = (
+                self.rng.random() < options["confirmed_ratio"] and confirmed_total + expected_participants <= maximum
+            )
+            if is_confirmed:
+                confirmed_total += expected_participants
+            plan.append((self.rng.choice(user_ids), expected_participants, is_confirmed))
+        return plan
+
+    def _build_schedule(self, index, plan, options):
+        earliest, latest = -options["days_before"], options["days_after"]
+        if options["distribution"] == "peak":
+            # 예약 마감 직후에 시작하는 일정이 가장 많도록 분포시킵니다.
+            peak = min(max(settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, earliest), latest)
+            days = self.rng.triangular(earliest, latest, peak)
+        else:
+            days = self.rng.uniform(earliest, latest)
+
+        start_time = (self.now + timedelta(days=days)).replace(minute=0, second=0, microsecond=0)
+        return ExamSchedule(
+            title=f"load test exam {index}",
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=self.rng.choice([1, 2, 3])),
+            confirmed_participants=sum(count for _, count, is_confirmed in plan if is_confirmed),
+            pending_participants=sum(count for _, count, is_confirmed in plan if not is_confirmed),
+            pending_reservations=sum(not is_confirmed for _, _, is_confirmed in plan),
+        )
+
+    def _create_reservations(self, rows, options):
+        if options["copy"]:
+            self._copy(
+                Reservation,
+                [
+                    "user_id",
+                    "schedule_id",
+                    "expected_participants",
+                    "is_confirmed",
+                    "confirmed_at",
+                    "created_at",
+                    "version",
+                ],
+                (
+                    [user_id, schedule_id, count, is_confirmed, self.now if is_confirmed else None, self.now, 1]
+                    for user_id, schedule_id, count, is_confirmed in rows
+                ),
+            )
+            return
+
+        Reservation.objects.bulk_create(
+            (
+                Reservation(
+                    user_id=user_id,
+                    schedule_id=schedule_id,
+                    expected_participants=count,
+                    is_confirmed=is_confirmed,
+                    confirmed_at=self.now if is_confirmed else None,
+                )
+                for user_id, schedule_id, count, is_confirmed in rows
+            ),
+            batch_size=options["batch_size"],
+        )
+
+    @staticmethod
+    def _copy(model, columns, rows):
+        """
+        PostgreSQL COPY ... FROM STDIN (CSV)으로 행을 적재합니다.
+
+        - 빈 문자열과 구분하기 위해 None은 \\N으로 기록합니다.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow("\\N" if value is None else value for value in row)
+        buffer.seek(0)
+
+        table = connection.ops.quote_name(model._meta.db_table)
+        column_list = ", ".join(connection.ops.quote_name(column) for column in columns)
+        with connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '\\N')", buffer)
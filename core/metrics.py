@@ -0,0 +1,428 @@
+import atexit
+import fcntl
+import glob
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import transaction
+
+from core.timing import QueryStats, current_query_stats
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+LOCK_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+PROCESS_FILE_PATTERN = re.compile(r"^metrics-(\d+)-\d+\.json$")
+AGGREGATE_FILE_NAME = "metrics-aggregate.json"
+LOCK_FILE_NAME = "metrics.lock"
+
+
+class Metric:
+    """
+    레이블 값 조합별 값을 가지는 Prometheus 지표
+
+    - 값은 프로세스 메모리에 저장되며, MetricsRegistry가 프로세스별 파일로 내보내고 합산합니다.
+    """
+
+    type = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        registry.register(self)
+
+    def empty(self):
+        raise NotImplementedError
+
+    def merge(self, current, other):
+        raise NotImplementedError
+
+    def samples(self, labels, value):
+        raise NotImplementedError
+
+    def _key(self, labels):
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def empty(self):
+        return 0
+
+    def merge(self, current, other):
+        return current + other
+
+    def samples(self, labels, value):
+        yield self.name, labels, value
+
+
+class Histogram(Metric):
+    """
+    누적 전 버킷별 관측 수(+Inf 포함)와 합계를 [count..., sum] 형태로 저장하는 히스토그램
+    """
+
+    type = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        super().__init__(registry, name, documentation, labelnames)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        with self.registry.lock:
+            data = self.values.get(key)
+            if data is None:
+                data = self.values[key] = self.empty()
+            data[index] += 1
+            data[-1] += value
+
+    def empty(self):
+        return [0] * (len(self.buckets) + 1) + [0.0]
+
+    def merge(self, current, other):
+        return [a + b for a, b in zip(current, other)]
+
+    def samples(self, labels, value):
+        cumulative = 0
+        for bound, count in zip((*self.buckets, math.inf), value):
+            cumulative += count
+            yield f"{self.name}_bucket", {**labels, "le": format_value(bound)}, cumulative
+        yield f"{self.name}_sum", labels, value[-1]
+        yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """
+    프로세스의 지표 목록과 여러 워커 프로세스의 지표 합산
+
+    - METRICS_DIR이 설정되면 각 프로세스가 자신의 지표를 `metrics-{pid}-{시작 시각}.json` 파일로 내보내고
+      (`METRICS_FLUSH_INTERVAL`초마다, 종료 시), `collect`는 디렉터리의 모든 파일과 현재 프로세스의 지표를 합산합니다.
+    - 종료된 워커의 파일은 `collect` 시 `metrics-aggregate.json` 하나로 합친 뒤 삭제하므로, 카운터가 감소하지 않고
+      파일 수는 살아 있는 워커 수만큼만 유지됩니다. (워커 프로세스가 같은 호스트에 있어야 함)
+    - METRICS_DIR이 비어 있으면 현재 프로세스의 지표만 반환합니다.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self._reset()
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+
+    def _reset(self):
+        with self.lock:
+            for metric in self.metrics.values():
+                metric.values = {}
+            self.file_name = f"metrics-{os.getpid()}-{time.time_ns()}.json"
+            self.last_flush = 0.0
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                name: [
+                    [list(key), value.copy() if isinstance(value, list) else value]
+                    for key, value in metric.values.items()
+                ]
+                for name, metric in self.metrics.items()
+            }
+
+    def maybe_flush(self):
+        if settings.METRICS_DIR and time.monotonic() - self.last_flush >= settings.METRICS_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        directory = settings.METRICS_DIR
+        if not directory:
+            return
+        self.last_flush = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self.file_name)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(f"{path}.tmp", path)
+
+    def merge_dead_processes(self):
+        """
+        종료된 프로세스의 지표 파일을 집계 파일에 합치고 삭제합니다.
+
+        - 여러 프로세스가 동시에 합치지 않도록 디렉터리의 잠금 파일로 직렬화합니다.
+        - gunicorn의 `child_exit` 훅에서 호출하면 워커 종료 직후 파일을 정리할 수 있습니다.
+        """
+        directory = settings.METRICS_DIR
+        if not directory:
+            return
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, LOCK_FILE_NAME), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            dead_paths = [
+                path
+                for path in glob.glob(os.path.join(directory, "metrics-*.json"))
+                if (match := PROCESS_FILE_PATTERN.match(os.path.basename(path)))
+                and os.path.basename(path) != self.file_name
+                and not process_alive(int(match.group(1)))
+            ]
+            if not dead_paths:
+                return
+
+            aggregate_path = os.path.join(directory, AGGREGATE_FILE_NAME)
+            merged = self._merge(read_snapshots([aggregate_path, *dead_paths]))
+            with open(f"{aggregate_path}.tmp", "w") as f:
+                json.dump(
+                    {name: [[list(key), value] for key, value in rows.items()] for name, rows in merged.items()}, f
+                )
+            os.replace(f"{aggregate_path}.tmp", aggregate_path)
+            for path in dead_paths:
+                os.remove(path)
+
+    def collect(self):
+        """
+        {지표 이름: {레이블 값 튜플: 합산 값}}
+        """
+        snapshots = [self.snapshot()]
+        if settings.METRICS_DIR:
+            self.merge_dead_processes()
+            paths = glob.glob(os.path.join(settings.METRICS_DIR, "metrics-*.json"))
+            snapshots.extend(read_snapshots(path for path in paths if os.path.basename(path) != self.file_name))
+        return self._merge(snapshots)
+
+    def _merge(self, snapshots):
+        merged = {name: {} for name in self.metrics}
+        for snapshot in snapshots:
+            for name, rows in snapshot.items():
+                metric = self.metrics.get(name)
+                if metric is None:
+                    continue
+                for key, value in rows:
+                    key = tuple(key)
+                    merged[name][key] = metric.merge(merged[name].get(key, metric.empty()), value)
+        return merged
+
+    def render(self, extra_gauges=()):
+        """
+        Prometheus 텍스트 형식(0.0.4)으로 합산된 지표와 추가 게이지(이름, 설명, 값)를 반환합니다.
+        """
+        lines = []
+        for name, values in self.collect().items():
+            metric = self.metrics[name]
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for key, value in sorted(values.items()):
+                for sample_name, labels, sample in metric.samples(dict(zip(metric.labelnames, key)), value):
+                    lines.append(format_sample(sample_name, labels, sample))
+        for name, documentation, value in extra_gauges:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(format_sample(name, {}, value))
+        return "\n".join(lines) + "\n"
+
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_snapshots(paths):
+    snapshots = []
+    for path in paths:
+        try:
+            with open(path) as f:
+                snapshots.append(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return snapshots
+
+
+def format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return f"{value:.1f}"
+    return str(value)
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_sample(name, labels, value):
+    if not labels:
+        return f"{name} {format_value(value)}"
+    escaped = ",".join(f'{key}="{escape_label(label)}"' for key, label in labels.items())
+    return f"{name}{{{escaped}}} {format_value(value)}"
+
+
+registry = MetricsRegistry()
+
+request_latency = Histogram(
+    registry, "http_request_duration_seconds", "Request latency by viewset and action", ["viewset", "action"]
+)
+request_count = Counter(
+    registry, "http_requests_total", "Requests by viewset, action and status code", ["viewset", "action", "status"]
+)
+request_db_queries = Histogram(
+    registry,
+    "http_request_db_queries",
+    "SQL queries per request by viewset and action",
+    ["viewset", "action"],
+    buckets=DB_QUERY_BUCKETS,
+)
+lock_wait = Histogram(
+    registry,
+    "db_lock_wait_seconds",
+    "Time spent in SELECT ... FOR UPDATE statements per request",
+    ["viewset", "action"],
+    buckets=LOCK_WAIT_BUCKETS,
+)
+reservation_confirms = Counter(registry, "reservation_confirms_total", "Reservations confirmed (committed)", ["source"])
+capacity_rejections = Counter(
+    registry, "schedule_capacity_rejections_total", "Confirmed participant increases rejected by the maximum capacity"
+)
+transaction_retries = Counter(
+    registry, "transaction_retries_total", "Write transactions retried after a conflict", ["action", "reason"]
+)
+transaction_failures = Counter(
+    registry,
+    "transaction_failures_total",
+    "Write transactions answered with 503 after a conflict or timeout",
+    ["action", "reason"],
+)
+
+os.register_at_fork(after_in_child=registry._reset)
+atexit.register(registry.flush)
+
+deferred_capacity_rejections = ContextVar("deferred_capacity_rejections", default=None)
+
+
+def record_confirms(count, source):
+    """
+    트랜잭션 커밋 후 확정된 예약 수를 기록합니다.
+    """
+    if count:
+        transaction.on_commit(lambda: reservation_confirms.inc(count, source=source))
+
+
+def record_capacity_rejection():
+    """
+    최대 인원 초과로 거절된 확정 인원 증가를 기록합니다.
+
+    - defer_capacity_rejections 블록 안에서는 블록이 끝날 때 한 번에 기록합니다.
+    """
+    rejections = deferred_capacity_rejections.get()
+    if rejections is None:
+        capacity_rejections.inc()
+    else:
+        rejections.append(1)
+
+
+@contextmanager
+def defer_capacity_rejections():
+    """
+    블록 안에서 발생한 최대 인원 초과 거절을 블록이 끝날 때 기록하는 컨텍스트 매니저 (retry_transaction의 시도마다 사용)
+
+    - 반환된 리스트를 비우면 기록하지 않으므로, 재시도로 버려진 시도의 거절은 중복 집계되지 않습니다.
+    - 거절된 요청은 롤백될 수 있으므로 커밋 여부와 관계없이 기록합니다.
+    - 바깥 블록이 있으면 바깥 블록이 끝날 때 함께 기록합니다.
+    """
+    outer = deferred_capacity_rejections.get()
+    rejections = []
+    token = deferred_capacity_rejections.set(rejections)
+    try:
+        yield rejections
+    finally:
+        deferred_capacity_rejections.reset(token)
+        if outer is not None:
+            outer.extend(rejections)
+        elif rejections:
+            capacity_rejections.inc(len(rejections))
+
+
+def resolve_view_labels(request):
+    """
+    요청을 처리한 뷰셋 이름과 action 이름 (URL이 일치하지 않았으면 빈 문자열)
+
+    - 비동기 조회 뷰(AsyncReadView)는 원래 뷰셋 이름과 action을 사용합니다.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "", ""
+
+    func = match.func
+    view_class = getattr(func, "cls", None) or getattr(func, "view_class", None)
+    actions = getattr(func, "actions", None) or {}
+    action = actions.get(request.method.lower()) or getattr(view_class, "action", None) or request.method.lower()
+    view_class = getattr(view_class, "view_class", None) or view_class
+    return (view_class.__name__ if view_class else match.view_name), action
+
+
+class MetricsMiddleware:
+    """
+    요청 지연 시간, 상태 코드, SQL 쿼리 수, select_for_update 시간을 뷰셋/action별 지표로 기록하는 미들웨어
+
+    - 쿼리 수는 가벼운 QueryStats로 세며, Server-Timing 샘플링(`current_timings`)에는 영향을 주지 않습니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started_at = time.perf_counter()
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        self.finish(request, response, started_at, stats)
+        return response
+
+    async def __acall__(self, request):
+        started_at = time.perf_counter()
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        self.finish(request, response, started_at, stats)
+        return response
+
+    @staticmethod
+    def finish(request, response, started_at, stats):
+        viewset, action = resolve_view_labels(request)
+        request_latency.observe(time.perf_counter() - started_at, viewset=viewset, action=action)
+        request_count.inc(viewset=viewset, action=action, status=response.status_code)
+        request_db_queries.observe(stats.queries, viewset=viewset, action=action)
+        if stats.lock_queries:
+            lock_wait.observe(stats.lock_time, viewset=viewset, action=action)
+        registry.maybe_flush()
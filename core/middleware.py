@@ -0,0 +1,38 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+
+ASYNC_READ_METHODS = ("GET", "HEAD")
+
+
+class AsyncReadRoutingMiddleware:
+    """
+    ASGI로 들어온 조회(GET, HEAD) 요청을 ASYNC_READ_URLCONF로 라우팅하는 미들웨어
+
+    - ASYNC_READ_URLCONF에 비동기 조회 뷰가 연결되어 있으며, 그 외 요청은 기존 URL 설정(동기 뷰셋)을 사용합니다.
+    - WSGI 요청이나 ASYNC_READ_URLCONF가 비어 있으면 아무것도 하지 않습니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.route(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        self.route(request)
+        return await self.get_response(request)
+
+    @staticmethod
+    def route(request):
+        urlconf = settings.ASYNC_READ_URLCONF
+        if urlconf and isinstance(request, ASGIRequest) and request.method in ASYNC_READ_METHODS:
+            request.urlconf = urlconf
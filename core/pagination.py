@@ -0,0 +1,189 @@
+import base64
+import binascii
+import json
+from collections.abc import Mapping
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import InvalidPage, Page
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    (정렬 컬럼, id) 키셋 기반 커서 페이지네이션
+
+    - OFFSET 스캔과 COUNT(*) 없이 마지막으로 조회한 행의 키 다음부터 조회합니다.
+    - 정렬 기준은 `ordering`으로 고정되며, 마지막 항목은 유일한 컬럼(id)이어야 합니다.
+    """
+
+    ordering = ("-id",)
+    mode_query_param = "pagination"
+    mode_query_value = "cursor"
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = api_settings.PAGE_SIZE
+    max_page_size = 100
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    @classmethod
+    def is_requested(cls, request):
+        """
+        요청이 커서 페이지네이션을 사용하는지 여부를 반환합니다.
+        """
+        params = request.query_params
+        return params.get(cls.mode_query_param) == cls.mode_query_value or cls.cursor_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, page_size = self._prepare(queryset, request)
+        return self._set_page(list(queryset[: page_size + 1]), page_size)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        비동기 뷰에서 사용하는 paginate_queryset
+        """
+        queryset, page_size = self._prepare(queryset, request)
+        return self._set_page([row async for row in queryset[: page_size + 1]], page_size)
+
+    def _prepare(self, queryset, request):
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self._build_after_filter(position))
+        return queryset, page_size
+
+    def _set_page(self, rows, page_size):
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.mode_query_param, self.mode_query_value)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def encode_cursor(self, item):
+        position = [self._get_value(item, field) for field in self._field_names()]
+        payload = json.dumps(position, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request, model):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            names = self._field_names()
+            if not isinstance(position, list) or len(position) != len(names):
+                raise ValueError
+            return [model._meta.get_field(name).to_python(value) for name, value in zip(names, position, strict=True)]
+        except (binascii.Error, UnicodeDecodeError, ValueError, ValidationError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+    def _field_names(self):
+        return [field.lstrip("-") for field in self.ordering]
+
+    def _build_after_filter(self, position):
+        """
+        (a, b, c) > (x, y, z) 형태의 키셋 조건을 정렬 방향에 맞게 Q 객체로 만듭니다.
+        """
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            equal_prefix = {
+                prev.lstrip("-"): value for prev, value in zip(self.ordering[:index], position, strict=False)
+            }
+            condition |= Q(**equal_prefix, **{f"{name}__{lookup}": position[index]})
+        return condition
+
+    @staticmethod
+    def _get_value(item, name):
+        if isinstance(item, Mapping):
+            return item[name]
+        return getattr(item, name)
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """
+    비동기 뷰에서도 사용할 수 있는 PageNumberPagination
+
+    - apaginate_queryset은 전체 개수와 페이지 조회를 비동기 ORM으로 수행하며, 응답 형태는 동일합니다.
+    """
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Paginator.count(cached_property)를 미리 채워 동기 COUNT 쿼리가 실행되지 않도록 합니다.
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            number = paginator.validate_number(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg) from exc
+
+        bottom = (number - 1) * page_size
+        top = bottom + page_size
+        if top + paginator.orphans >= paginator.count:
+            top = paginator.count
+        self.page = Page([row async for row in queryset[bottom:top]], number, paginator)
+        return list(self.page)
+
+
+class KeysetPaginationMixin:
+    """
+    요청 파라미터(`pagination=cursor` 또는 `cursor`)가 있을 때만 키셋 페이지네이션을 사용하도록 하는 뷰셋 믹스인
+
+    - 그 외에는 기본 페이지네이션(PageNumberPagination)을 그대로 사용합니다.
+    """
+
+    keyset_pagination_class = None
+
+    @property
+    def paginator(self):
+        if (
+            not hasattr(self, "_paginator")
+            and self.keyset_pagination_class is not None
+            and self.keyset_pagination_class.is_requested(self.request)
+        ):
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
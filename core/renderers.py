@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# 스프레드시트에서 수식으로 해석될 수 있는 값의 시작 문자
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    행(dict) 목록을 한 줄씩 출력하는 내보내기용 렌더러
+
+    - 뷰에서 `stream`/`astream`으로 StreamingHttpResponse의 내용을 만들며, `batch_size` 행씩 묶어 출력합니다.
+    - `render`는 오류 응답처럼 스트리밍하지 않는 응답에 사용됩니다.
+    """
+
+    charset = "utf-8"
+    batch_size = 500
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        columns = list(rows[0]) if rows and isinstance(rows[0], dict) else []
+        return self.render_header(columns) + self.render_rows(rows, columns)
+
+    def render_header(self, columns):
+        return b""
+
+    def render_rows(self, rows, columns):
+        raise NotImplementedError
+
+    def stream(self, rows, columns):
+        yield self.render_header(columns)
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield self.render_rows(batch, columns)
+                batch = []
+        if batch:
+            yield self.render_rows(batch, columns)
+
+    async def astream(self, rows, columns):
+        yield self.render_header(columns)
+        batch = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield self.render_rows(batch, columns)
+                batch = []
+        if batch:
+            yield self.render_rows(batch, columns)
+
+
+class CSVRenderer(StreamingRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+    def render_header(self, columns):
+        return self._write([columns]) if columns else b""
+
+    def render_rows(self, rows, columns):
+        return self._write([self._to_cell(row.get(column)) for column in columns] for row in rows)
+
+    @staticmethod
+    def _write(lines):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(lines)
+        return buffer.getvalue().encode()
+
+    @staticmethod
+    def _to_cell(value):
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+            return f"'{value}"
+        return value
+
+
+class NDJSONRenderer(StreamingRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+    def render_rows(self, rows, columns):
+        return b"".join(
+            json.dumps(row, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")).encode() + b"\n" for row in rows
+        )
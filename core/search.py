@@ -0,0 +1,108 @@
+from django.db import connections
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import SearchFilter
+
+
+def fts_table_name(model, field_name):
+    """
+    SQLite FTS5 검색 테이블 이름 (예: schedules_examschedule_title_fts)
+    """
+    return f"{model._meta.db_table}_{field_name}_fts"
+
+
+class SearchBackend:
+    """
+    검색어 하나에 대해 모델의 검색 필드가 일치하는 행의 pk 서브쿼리를 만드는 검색 백엔드
+
+    - 기본 구현은 `icontains` (인덱스를 사용하지 않는 LIKE '%검색어%')
+    """
+
+    def match(self, model, field_name, term):
+        return model._default_manager.filter(**{f"{field_name}__icontains": term}).values("pk")
+
+
+class TrigramSearchBackend(SearchBackend):
+    """
+    PostgreSQL pg_trgm 백엔드
+
+    - `icontains`가 만드는 `UPPER(필드) LIKE UPPER('%검색어%')` 조건을 `UPPER(필드)` 트라이그램 GIN 인덱스로 검색합니다.
+    - 조건이 기본 구현과 같으므로 검색 결과도 같습니다.
+    """
+
+
+class SQLiteFTSSearchBackend(SearchBackend):
+    """
+    SQLite FTS5(trigram 토크나이저) 백엔드
+
+    - 필드별 FTS5 테이블(`fts_table_name`)에서 검색어를 부분 문자열로 포함하는 rowid(pk)를 조회합니다.
+    - trigram 토크나이저는 3글자 미만의 검색어를 찾을 수 없으므로 그 경우 기본 구현을 사용합니다.
+    """
+
+    min_term_length = 3
+
+    def match(self, model, field_name, term):
+        if len(term) < self.min_term_length:
+            return super().match(model, field_name, term)
+        table = fts_table_name(model, field_name)
+        phrase = '"{}"'.format(term.replace('"', '""'))
+        return RawSQL(f'SELECT rowid FROM "{table}" WHERE "{table}" MATCH %s', [phrase])
+
+
+SEARCH_BACKENDS = {
+    "postgresql": TrigramSearchBackend(),
+    "sqlite": SQLiteFTSSearchBackend(),
+}
+
+
+def get_search_backend(alias):
+    return SEARCH_BACKENDS.get(connections[alias].vendor, SearchBackend())
+
+
+class IndexedSearchFilter(SearchFilter):
+    """
+    모델의 `indexed_search_fields`에 등록된 필드는 DB별 검색 인덱스로 검색하는 SearchFilter
+
+    - 관계 경로(예: `schedule__title`)는 JOIN 대신 관계 모델의 pk 서브쿼리 조건(`schedule__pk__in`)으로 바꿉니다.
+    - 접두사(`^`, `=`, `$`, `@`)가 있거나 인덱스가 없는 필드는 SearchFilter의 기본 동작을 그대로 사용합니다.
+    - 검색어가 여러 개이면 모든 검색어가 (필드 중 하나에) 포함된 행만 조회합니다.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+
+        targets = [self._resolve_indexed_field(queryset.model, field) for field in search_fields]
+        if not all(targets):
+            return super().filter_queryset(request, queryset, view)
+
+        backend = get_search_backend(queryset.db)
+        for term in search_terms:
+            condition = Q()
+            for prefix, model, field_name in targets:
+                condition |= Q(**{f"{prefix}pk__in": backend.match(model, field_name, term)})
+            queryset = queryset.filter(condition)
+        return queryset
+
+    @staticmethod
+    def _resolve_indexed_field(model, search_field):
+        """
+        검색 필드 경로를 (관계 경로 접두사, 관계 모델, 필드 이름)으로 바꿉니다. 인덱스가 없는 필드면 None
+        """
+        if search_field[0] in SearchFilter.lookup_prefixes:
+            return None
+
+        *relations, field_name = search_field.split(LOOKUP_SEP)
+        for relation in relations:
+            field = model._meta.get_field(relation)
+            if not (field.many_to_one or field.one_to_one) or field.related_model is None:
+                return None
+            model = field.related_model
+
+        if field_name not in getattr(model, "indexed_search_fields", ()):
+            return None
+        prefix = "".join(f"{relation}{LOOKUP_SEP}" for relation in relations)
+        return prefix, model, field_name
@@ -1,3 +1,563 @@
-from django.test import TestCase
+import json
+import os
+import re
+import tempfile
+import threading
+import unittest
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, OperationalError, connection
+from django.db.models import Q, Sum
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.metrics import capacity_rejections, registry, request_count, transaction_failures, transaction_retries
+from core.transactions import TransactionConflict, retry_transaction
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+from users.serializers.jwt import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+"""
+대용량 테스트 데이터 생성
+- 지정한 수의 사용자, 일정, 예약 생성 - 성공
+- 일정의 확정 인원이 확정된 예약 인원 합계와 일치 - 성공
+- 생성된 사용자의 비밀번호로 로그인 가능 - 성공
+- 이미 사용 중인 사용자 이름 접두사 - 실패
+
+인덱스 검색 필터
+- 시험 일정 제목 검색 결과가 icontains 검색과 동일 (대소문자, 한글, 여러 검색어, 3글자 미만 검색어) - 성공
+- 제목 수정, 일정 삭제 후 검색 결과에 반영 - 성공
+- 예약의 일정 제목 검색 - 성공
+
+목록 쿼리 실행 계획 검사
+- 사용자/일정/확정 여부 필터 조합의 예약 목록 쿼리가 순차 스캔 없이 인덱스 사용 - 성공
+
+요청별 성능 계측 (Server-Timing)
+- 목록 조회 시 SQL, 권한 검사, serializer, 전체 시간을 헤더와 JSON 로그로 기록 - 성공
+- 예약 생성 시 serializer 검증 시간과 쿼리 수 기록 - 성공
+- ASGI 비동기 조회 요청 계측 - 성공
+- 샘플링 비율이 0이면 계측하지 않음 - 성공
+
+Prometheus 지표 (/metrics)
+- 뷰셋/action별 지연 시간 히스토그램, 상태 코드별 요청 수, 쿼리 수, 예약 확정 수 기록 - 성공
+- 최대 인원 초과로 거절된 확정 인원 증가 기록 - 성공
+- Server-Timing 샘플링되지 않은 요청도 구간별 계측 없이 쿼리 수 기록 - 성공
+- 일정 테이블 게이지를 캐시하여 스크레이프마다 집계하지 않음 - 성공
+- 다른 워커 프로세스의 지표 파일 합산, 종료된 프로세스의 파일은 집계 파일로 합친 뒤 삭제 - 성공
+- 허용되지 않은 IP에서 토큰 없이 조회 - 실패
+
+쓰기 트랜잭션 재시도
+- 교착 상태로 실패한 트랜잭션을 재시도하여 성공, 재시도 횟수 기록 - 성공
+- 재시도 횟수를 모두 사용하면 TransactionConflict(503) - 실패
+- 재시도 대상이 아닌 DB 예외는 그대로 전달 - 실패
+- 재시도된 시도의 최대 인원 초과 거절은 기록하지 않고 마지막 시도의 거절만 한 번 기록 - 성공
+- 두 워커가 예약 행을 반대 순서로 잠가 발생한 교착 상태를 재시도로 해결 (PostgreSQL) - 성공
+"""
+
+
+class GenerateLoadDataCommandTests(TestCase):
+    def generate(self, *args):
+        call_command(
+            "generate_load_data",
+            "--users",
+            "30",
+            "--schedules",
+            "7",
+            "--reservations-per-schedule",
+            "20",
+            "--confirmed-ratio",
+            "0.5",
+            "--batch-size",
+            "50",
+            "--seed",
+            "1",
+            *args,
+            stdout=StringIO(),
+        )
+
+    def test_generate_load_data__success(self):
+        # When
+        self.generate()
+
+        # Then
+        self.assertEqual(User.objects.filter(username__startswith="load-").count(), 30)
+        self.assertEqual(ExamSchedule.objects.count(), 7)
+        self.assertEqual(Reservation.objects.count(), 140)
+        self.assertTrue(Reservation.objects.filter(is_confirmed=True, confirmed_at__isnull=False).exists())
+
+    def test_generate_load_data__success_with_consistent_confirmed_participants(self):
+        # When
+        self.generate("--distribution", "peak")
+
+        # Then
+        schedules = ExamSchedule.objects.annotate(
+            confirmed_reservations=Sum("reservations__expected_participants", filter=Q(reservations__is_confirmed=True))
+        )
+        for schedule in schedules:
+            self.assertEqual(schedule.confirmed_participants, schedule.confirmed_reservations or 0)
+
+    def test_generate_load_data__success_with_password(self):
+        # When
+        self.generate("--password", "secret-password")
+
+        # Then
+        users = User.objects.filter(username__startswith="load-")
+        self.assertEqual(len({user.password for user in users}), 1)
+        self.assertTrue(users.first().check_password("secret-password"))
+
+    def test_generate_load_data__fail_with_existing_prefix(self):
+        # Given
+        User.objects.create_user(username="load-00", password="password")
+
+        # When & Then
+        with self.assertRaises(CommandError):
+            self.generate()
+
+
+class IndexedSearchFilterTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        start_time = timezone.now() + timedelta(days=30)
+        self.schedules = {
+            title: ExamSchedule.objects.create(title=title, start_time=start_time, end_time=start_time)
+            for title in ["Math Exam", "Advanced MATH final", "English Exam", "영어 중간고사", 'Quote "exam"']
+        }
+        for schedule in self.schedules.values():
+            Reservation.objects.create(user=self.user, schedule=schedule, expected_participants=1)
+        self.url = reverse("schedules:exam-schedules-list")
+        self.client.force_authenticate(user=self.user)
+
+    def search(self, term, url=None):
+        response = self.client.get(url or self.url, {"search": term, "page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {item["schedule"]["title"] if "schedule" in item else item["title"] for item in response.data["results"]}
+
+    def test_indexed_search__success_matches_icontains(self):
+        for term in ["math", "EXAM", "중간고", "math exam", "ma", '"exam"', "no match"]:
+            # When
+            titles = self.search(term)
+
+            # Then
+            expected = ExamSchedule.objects.all()
+            for word in term.split():
+                expected = expected.filter(title__icontains=word.strip('"'))
+            self.assertEqual(titles, set(expected.values_list("title", flat=True)), term)
+
+    def test_indexed_search__success_with_title_update_and_delete(self):
+        # Given
+        schedule = self.schedules["Math Exam"]
+        schedule.title = "Physics Exam"
+        schedule.save()
+        self.schedules["English Exam"].delete()
+
+        # When
+        titles = self.search("exam")
+
+        # Then
+        self.assertEqual(titles, {"Physics Exam", 'Quote "exam"'})
+        self.assertEqual(self.search("math"), {"Advanced MATH final"})
+
+    def test_indexed_search__success_with_reservation_schedule_title(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+
+        # When
+        titles = self.search("math", reverse("reservations:reservations-list"))
+
+        # Then
+        self.assertEqual(titles, {"Math Exam", "Advanced MATH final"})
+
+
+class ExplainQueriesCommandTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="testuser", password="testpassword")
+        start_time = timezone.now() + timedelta(days=30)
+        schedule = ExamSchedule.objects.create(title="Math Exam", start_time=start_time, end_time=start_time)
+        Reservation.objects.create(user=user, schedule=schedule, expected_participants=1)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_explain_queries__success_without_seq_scan_on_reservation_filters(self):
+        # Given
+        output = os.path.join(self.tmpdir.name, "plans.json")
+
+        # When
+        call_command("explain_queries", "--output", output, stdout=StringIO())
+
+        # Then
+        with open(output) as f:
+            results = {result["name"]: result for result in json.load(f)["results"]}
+        for name in [
+            "reservations list user (no filters)",
+            "reservations list user pagination",
+            "reservations list staff schedule",
+            "reservations list staff schedule+is_confirmed+pagination",
+            "reservations list staff user+pagination",
+            "reservations list staff is_confirmed",
+            "exam-schedules available from",
+        ]:
+            self.assertEqual(results[name]["seq_scans"], [], name)
+            self.assertTrue(results[name]["plans"]["page"], name)
+        self.assertIn("count", results["reservations list staff schedule"]["plans"])
+
+
+@override_settings(SERVER_TIMING_SAMPLE_RATE=1.0, EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+class ServerTimingMiddlewareTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        start_time = timezone.now() + timedelta(days=30)
+        self.schedule = ExamSchedule.objects.create(title="Math Exam", start_time=start_time, end_time=start_time)
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=1)
+        self.url = reverse("reservations:reservations-list")
+        self.client.force_authenticate(user=self.user)
+
+    @staticmethod
+    def parse_server_timing(response):
+        timings = {}
+        for metric in response["Server-Timing"].split(", "):
+            name, duration, _ = metric.split(";")
+            timings[name] = float(duration.removeprefix("dur="))
+        return timings
+
+    def test_server_timing__success_with_list(self):
+        # When
+        with self.assertLogs("core.timing", level="INFO") as logs:
+            response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        timings = self.parse_server_timing(response)
+        self.assertEqual(set(timings), {"db", "perm", "serializer", "total"})
+        self.assertGreaterEqual(timings["total"], timings["db"])
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual((record["method"], record["path"], record["status"]), ("GET", self.url, 200))
+        self.assertGreater(record["db_queries"], 0)
+        self.assertEqual(
+            set(record) - {"method", "path", "status", "db_queries"},
+            {"total_ms", "db_ms", "lock_ms", "perm_ms", "serializer_ms"},
+        )
+
+    def test_server_timing__success_with_create(self):
+        # When
+        with self.assertLogs("core.timing", level="INFO") as logs:
+            response = self.client.post(
+                self.url, {"schedule_id": self.schedule.id, "expected_participants": 3}, format="json"
+            )
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn("serializer", self.parse_server_timing(response))
+        record = json.loads(logs.records[0].getMessage())
+        self.assertGreater(record["serializer_ms"], 0)
+        self.assertGreater(record["db_queries"], 1)
+
+    def test_server_timing__success_with_async_view(self):
+        # Given
+        token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+
+        # When
+        with self.assertLogs("core.timing", level="INFO") as logs:
+            response = async_to_sync(self.async_client.get)(self.url, headers={"Authorization": f"Bearer {token}"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(self.parse_server_timing(response)), {"db", "perm", "serializer", "total"})
+        self.assertGreater(json.loads(logs.records[0].getMessage())["db_queries"], 0)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_server_timing__success_without_sampling(self):
+        # When
+        with self.assertNoLogs("core.timing", level="INFO"):
+            response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header("Server-Timing"))
+
+
+@override_settings(METRICS_DIR="", METRICS_GAUGE_CACHE_TIMEOUT=0, EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+class MetricsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        start_time = timezone.now() + timedelta(days=30)
+        self.schedule = ExamSchedule.objects.create(title="Math Exam", start_time=start_time, end_time=start_time)
+        self.reservation = Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=3)
+        self.client.force_authenticate(user=self.admin)
+
+    def scrape(self):
+        response = self.client.get(reverse("metrics"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        return response.content.decode()
+
+    @staticmethod
+    def sample(text, name, **labels):
+        label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+        pattern = rf"^{re.escape(name)}{re.escape(f'{{{label_text}}}' if labels else '')} (\S+)$"
+        match = re.search(pattern, text, re.MULTILINE)
+        return float(match.group(1)) if match else 0.0
+
+    def test_metrics__success_with_request_metrics(self):
+        # Given
+        labels = {"viewset": "ReservationViewSet", "action": "list"}
+        before = self.scrape()
+
+        # When
+        self.client.get(reverse("reservations:reservations-list"))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("reservations:reservations-confirm", args=[self.reservation.id]))
+        after = self.scrape()
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for name, sample_labels in [
+            ("http_request_duration_seconds_count", labels),
+            ("http_request_duration_seconds_bucket", {**labels, "le": "+Inf"}),
+            ("http_requests_total", {**labels, "status": "200"}),
+            ("http_request_db_queries_count", labels),
+            ("http_requests_total", {"viewset": "ReservationViewSet", "action": "confirm", "status": "200"}),
+            ("reservation_confirms_total", {"source": "confirm"}),
+        ]:
+            self.assertEqual(self.sample(after, name, **sample_labels) - self.sample(before, name, **sample_labels), 1)
+        self.assertGreater(self.sample(after, "http_request_db_queries_sum", **labels), 0)
+        self.assertEqual(self.sample(after, "reservations_pending"), 0)
+        self.assertEqual(self.sample(after, "exam_schedules_open"), 1)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_metrics__success_without_server_timing_sampling(self):
+        # Given
+        labels = {"viewset": "ReservationViewSet", "action": "list"}
+        before = self.sample(self.scrape(), "http_request_db_queries_sum", **labels)
+
+        # When
+        with mock.patch("core.timing.RequestTimings") as request_timings:
+            response = self.client.get(reverse("reservations:reservations-list"))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        request_timings.assert_not_called()
+        self.assertGreater(self.sample(self.scrape(), "http_request_db_queries_sum", **labels) - before, 0)
+
+    def test_metrics__success_with_capacity_rejection(self):
+        # Given
+        before = self.sample(self.scrape(), "schedule_capacity_rejections_total")
+        self.schedule.add_confirmed_participant(settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 2)
+
+        # When
+        response = self.client.post(reverse("reservations:reservations-confirm", args=[self.reservation.id]))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.sample(self.scrape(), "schedule_capacity_rejections_total") - before, 1)
+
+    def test_metrics__success_with_worker_processes(self):
+        # Given
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        labels = {"viewset": "WorkerViewSet", "action": "list", "status": "200"}
+
+        with self.settings(METRICS_DIR=tmpdir.name):
+            # When
+            pid = os.fork()
+            if pid == 0:
+                # 자식 프로세스: fork 이후 비어 있는 지표에 기록하고 파일로 내보냄
+                request_count.inc(2, **labels)
+                registry.flush()
+                os._exit(0)
+            os.waitpid(pid, 0)
+            request_count.inc(**labels)
+            text = self.scrape()
+            second_text = self.scrape()
+
+        # Then
+        self.assertEqual(self.sample(text, "http_requests_total", **labels), 3)
+        # 종료된 자식 프로세스의 파일은 집계 파일로 합쳐지며, 다시 조회해도 중복 합산되지 않습니다.
+        self.assertFalse(any(name.startswith(f"metrics-{pid}-") for name in os.listdir(tmpdir.name)))
+        self.assertIn("metrics-aggregate.json", os.listdir(tmpdir.name))
+        self.assertEqual(self.sample(second_text, "http_requests_total", **labels), 3)
+
+    @override_settings(METRICS_GAUGE_CACHE_TIMEOUT=60)
+    def test_metrics__success_with_cached_gauges(self):
+        # Given
+        cache.clear()
+        self.scrape()
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=2)
+
+        # When
+        with self.assertNumQueries(0):
+            text = self.scrape()
+
+        # Then
+        self.assertEqual(self.sample(text, "reservations_pending"), 1)
+        self.assertEqual(self.sample(text, "reservation_pending_participants"), 3)
+
+    @override_settings(METRICS_ALLOWED_IPS=["10.0.0.0/8"], METRICS_BEARER_TOKEN="metrics-token")
+    def test_metrics__fail_with_disallowed_client(self):
+        # Given
+        url = reverse("metrics")
+
+        # When
+        anonymous_response = self.client.get(url)
+        wrong_token_response = self.client.get(url, headers={"Authorization": "Bearer wrong"})
+        token_response = self.client.get(url, headers={"Authorization": "Bearer metrics-token"})
+        allowed_ip_response = self.client.get(url, REMOTE_ADDR="10.1.2.3")
+
+        # Then
+        self.assertEqual(anonymous_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(wrong_token_response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(token_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(allowed_ip_response.status_code, status.HTTP_200_OK)
+
+
+def deadlock_error():
+    error = OperationalError("deadlock detected")
+    error.__cause__ = Exception("deadlock detected")
+    error.__cause__.pgcode = "40P01"
+    return error
+
+
+@override_settings(TRANSACTION_RETRY_ATTEMPTS=2, TRANSACTION_RETRY_BACKOFF_MS=1)
+class RetryTransactionTests(TransactionTestCase):
+    def retry_count(self, name, reason="deadlock"):
+        return transaction_retries.values.get((name, reason), 0)
+
+    def test_retry_transaction__success_after_deadlock(self):
+        # Given
+        errors = [deadlock_error(), deadlock_error()]
+
+        @retry_transaction("test.retry")
+        def create_user():
+            User.objects.create_user(username=f"user-{len(errors)}", password="password")
+            if errors:
+                raise errors.pop()
+            return "done"
+
+        before = self.retry_count("test.retry")
+
+        # When
+        result = create_user()
+
+        # Then
+        self.assertEqual(result, "done")
+        self.assertEqual(self.retry_count("test.retry") - before, 2)
+        # 실패한 시도의 변경은 롤백됩니다.
+        self.assertEqual(list(User.objects.values_list("username", flat=True)), ["user-0"])
+
+    def test_retry_transaction__fail_after_attempts(self):
+        # Given
+        @retry_transaction("test.exhausted")
+        def always_deadlock():
+            raise deadlock_error()
+
+        before = transaction_failures.values.get(("test.exhausted", "deadlock"), 0)
+
+        # When & Then
+        with self.assertRaises(TransactionConflict):
+            always_deadlock()
+        self.assertEqual(self.retry_count("test.exhausted"), 2)
+        self.assertEqual(transaction_failures.values[("test.exhausted", "deadlock")] - before, 1)
+
+    def test_retry_transaction__success_with_capacity_rejection_recorded_once(self):
+        # Given
+        start_time = timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1)
+        schedule = ExamSchedule.objects.create(title="Math Exam", start_time=start_time, end_time=start_time)
+        schedule.add_confirmed_participant(settings.EXAM_SCHEDULE_MAX_PARTICIPANTS)
+        errors = [deadlock_error(), deadlock_error()]
+
+        @retry_transaction("test.rejection")
+        def confirm_over_capacity():
+            try:
+                ExamSchedule.change_confirmed_participants(schedule.id, 1)
+            except ValueError:
+                pass
+            if errors:
+                raise errors.pop()
+
+        before = capacity_rejections.values.get((), 0)
+
+        # When
+        confirm_over_capacity()
+
+        # Then
+        self.assertEqual(self.retry_count("test.rejection"), 2)
+        self.assertEqual(capacity_rejections.values.get((), 0) - before, 1)
+
+    def test_retry_transaction__fail_with_other_error(self):
+        # Given
+        calls = []
+
+        @retry_transaction("test.other")
+        def integrity_error():
+            calls.append(1)
+            raise IntegrityError("duplicate key")
+
+        # When & Then
+        with self.assertRaises(IntegrityError):
+            integrity_error()
+        self.assertEqual(len(calls), 1)
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "행 잠금 교착 상태 검증은 PostgreSQL에서만 실행합니다.")
+@override_settings(TRANSACTION_RETRY_ATTEMPTS=5, TRANSACTION_LOCK_TIMEOUT_MS=0)
+class RetryTransactionDeadlockTests(TransactionTestCase):
+    def test_retry_transaction__success_with_deadlock_between_workers(self):
+        # Given
+        user = User.objects.create_user(username="testuser", password="testpassword")
+        start_time = timezone.now() + timedelta(days=30)
+        schedule = ExamSchedule.objects.create(title="Math Exam", start_time=start_time, end_time=start_time)
+        reservations = [
+            Reservation.objects.create(user=user, schedule=schedule, expected_participants=1) for _ in range(2)
+        ]
+        barrier = threading.Barrier(2)
+        errors = []
+
+        @retry_transaction("test.deadlock")
+        def lock_in_order(first_id, second_id, attempts):
+            attempts.append(1)
+            Reservation.objects.select_for_update().get(id=first_id)
+            if len(attempts) == 1:
+                # 두 워커가 첫 번째 행을 잠근 뒤 서로의 행을 기다리도록 맞춥니다.
+                barrier.wait(timeout=10)
+            reservation = Reservation.objects.select_for_update().get(id=second_id)
+            reservation.expected_participants += 1
+            reservation.save(update_fields=["expected_participants"])
+
+        def worker(first_id, second_id):
+            try:
+                lock_in_order(first_id, second_id, [])
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+            finally:
+                connection.close()
+
+        before = transaction_retries.values.get(("test.deadlock", "deadlock"), 0)
+        ids = [reservation.id for reservation in reservations]
+
+        # When
+        threads = [threading.Thread(target=worker, args=pair) for pair in [ids, ids[::-1]]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        # Then
+        self.assertEqual(errors, [])
+        self.assertGreaterEqual(transaction_retries.values.get(("test.deadlock", "deadlock"), 0) - before, 1)
+        self.assertEqual(
+            sorted(Reservation.objects.values_list("expected_participants", flat=True)),
+            [2, 2],
+        )
@@ -0,0 +1,216 @@
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger("core.timing")
+
+# 계측 중인 요청의 RequestTimings (샘플링되지 않은 요청이면 None)
+current_timings = ContextVar("current_timings", default=None)
+# 지표를 기록 중인 요청의 QueryStats (샘플링과 관계없이 MetricsMiddleware가 설정)
+current_query_stats = ContextVar("current_query_stats", default=None)
+
+TIMING_DESCRIPTIONS = {
+    "db": "SQL",
+    "lock": "select_for_update",
+    "perm": "permission checks",
+    "serializer": "serialization",
+    "total": "total",
+}
+
+
+class RequestTimings:
+    """
+    요청 하나의 구간별 소요 시간(초)과 SQL 쿼리 수
+
+    - `lock`은 `SELECT ... FOR UPDATE` 쿼리의 소요 시간이며, 행 잠금 대기 시간이 포함됩니다. (`db`에도 포함)
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.durations = defaultdict(float)
+        self.db_queries = 0
+        self.active = set()
+
+    def to_header(self, total):
+        durations = {**self.durations, "total": total}
+        return ", ".join(
+            f'{name};dur={durations[name] * 1000:.1f};desc="{description}"'
+            for name, description in TIMING_DESCRIPTIONS.items()
+            if name in durations
+        )
+
+    def to_log(self, request, response, total):
+        return {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "db_queries": self.db_queries,
+            **{f"{name}_ms": round(self.durations[name] * 1000, 2) for name in ["db", "lock", "perm", "serializer"]},
+        }
+
+
+class QueryStats:
+    """
+    요청 하나의 SQL 쿼리 수와 `SELECT ... FOR UPDATE` 쿼리 수/소요 시간(초)
+
+    - 모든 요청에 설정되므로 구간별 시간 없이 지표에 필요한 값만 기록합니다.
+    """
+
+    __slots__ = ("queries", "lock_queries", "lock_time")
+
+    def __init__(self):
+        self.queries = 0
+        self.lock_queries = 0
+        self.lock_time = 0.0
+
+
+@contextmanager
+def timed(name):
+    """
+    계측 중인 요청이면 블록의 소요 시간을 `name` 구간에 더합니다.
+
+    - 같은 구간이 중첩되면(중첩 serializer 등) 가장 바깥 블록만 측정합니다.
+    """
+    timings = current_timings.get()
+    if timings is None or name in timings.active:
+        yield
+        return
+
+    timings.active.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.durations[name] += time.perf_counter() - start
+        timings.active.discard(name)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    SQL 쿼리 수와 소요 시간을 기록하는 DB execute wrapper (모든 DB 연결에 등록됨)
+
+    - 샘플링된 요청은 RequestTimings에, 지표를 기록 중인 요청은 QueryStats에 기록합니다.
+    """
+    timings = current_timings.get()
+    stats = current_query_stats.get()
+    if timings is None and stats is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        lock = "FOR UPDATE" in sql
+        if stats is not None:
+            stats.queries += 1
+            if lock:
+                stats.lock_queries += 1
+                stats.lock_time += elapsed
+        if timings is not None:
+            timings.db_queries += 1
+            timings.durations["db"] += elapsed
+            if lock:
+                timings.durations["lock"] += elapsed
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    새 DB 연결에 record_query를 등록하는 connection_created 시그널 핸들러
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class TimedPermissionsMixin:
+    """
+    권한 검사(check_permissions, check_object_permissions) 시간을 `perm` 구간으로 기록하는 뷰 믹스인
+    """
+
+    def check_permissions(self, request):
+        with timed("perm"):
+            super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        with timed("perm"):
+            super().check_object_permissions(request, obj)
+
+
+class TimedSerializerMixin:
+    """
+    입력 검증(run_validation)과 출력 변환(to_representation) 시간을 `serializer` 구간으로 기록하는 serializer 믹스인
+    """
+
+    def run_validation(self, *args, **kwargs):
+        with timed("serializer"):
+            return super().run_validation(*args, **kwargs)
+
+    def to_representation(self, instance):
+        with timed("serializer"):
+            return super().to_representation(instance)
+
+
+class ServerTimingMiddleware:
+    """
+    샘플링된 요청의 구간별 소요 시간을 `Server-Timing` 헤더와 JSON 로그(`core.timing` 로거)로 남기는 미들웨어
+
+    - SERVER_TIMING_SAMPLE_RATE(0~1) 비율의 요청만 계측하며, 나머지 요청은 ContextVar 조회 외의 비용이 없습니다.
+    - SQL 쿼리 수/시간, select_for_update 시간, 권한 검사 시간, serializer 시간, 전체 시간을 기록합니다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    @staticmethod
+    def sampled():
+        rate = settings.SERVER_TIMING_SAMPLE_RATE
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    @staticmethod
+    def finish(request, response, timings):
+        total = time.perf_counter() - timings.started_at
+        header = timings.to_header(total)
+        if response.has_header("Server-Timing"):
+            header = f"{response['Server-Timing']}, {header}"
+        response["Server-Timing"] = header
+        logger.info(json.dumps(timings.to_log(request, response, total), separators=(",", ":")))
+        return response
@@ -0,0 +1,118 @@
+import random
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from core.metrics import defer_capacity_rejections, transaction_failures, transaction_retries
+
+# PostgreSQL SQLSTATE 코드별 실패 분류
+SQLSTATE_OUTCOMES = {
+    "40P01": "deadlock",
+    "40001": "serialization_failure",
+    "55P03": "lock_timeout",
+    "57014": "statement_timeout",
+}
+# 트랜잭션을 처음부터 다시 실행하면 성공할 수 있는 실패 (statement_timeout은 재시도하지 않음)
+RETRYABLE_OUTCOMES = {"deadlock", "serialization_failure", "lock_timeout", "locked"}
+
+
+class TransactionConflict(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "다른 요청과 경합하여 처리하지 못했습니다. 잠시 후 다시 시도해 주세요."
+    default_code = "transaction_conflict"
+    wait = 1  # Retry-After 헤더 (초)
+
+
+def classify_database_error(error):
+    """
+    DB 예외를 deadlock, serialization_failure, lock_timeout, statement_timeout, locked(SQLite)로 분류합니다.
+
+    - 분류할 수 없으면 예외 클래스 이름을 반환합니다.
+    """
+    sqlstate = getattr(error.__cause__, "pgcode", None)
+    if sqlstate in SQLSTATE_OUTCOMES:
+        return SQLSTATE_OUTCOMES[sqlstate]
+    if "database is locked" in str(error):
+        return "locked"
+    return type(error).__name__
+
+
+def get_transaction_timeouts(name):
+    """
+    action의 (lock_timeout, statement_timeout) 밀리초 (0이면 DB 기본값 사용)
+    """
+    timeouts = settings.TRANSACTION_TIMEOUTS.get(name, {})
+    return (
+        timeouts.get("lock_timeout_ms", settings.TRANSACTION_LOCK_TIMEOUT_MS),
+        timeouts.get("statement_timeout_ms", settings.TRANSACTION_STATEMENT_TIMEOUT_MS),
+    )
+
+
+def set_transaction_timeouts(lock_timeout_ms, statement_timeout_ms):
+    """
+    현재 트랜잭션에만 적용되는 lock_timeout/statement_timeout을 설정합니다. (PostgreSQL 외에는 무시)
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        for name, value in [("lock_timeout", lock_timeout_ms), ("statement_timeout", statement_timeout_ms)]:
+            if value:
+                cursor.execute(f"SET LOCAL {name} = %s", [f"{value}ms"])
+
+
+def get_retry_delay(attempt):
+    """
+    재시도 전 대기 시간(초). 지수 백오프 상한 안에서 균등 분포로 고릅니다. (full jitter)
+    """
+    ceiling = min(settings.TRANSACTION_RETRY_MAX_BACKOFF_MS, settings.TRANSACTION_RETRY_BACKOFF_MS * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling) / 1000
+
+
+def retry_transaction(name):
+    """
+    함수를 트랜잭션 안에서 실행하고, 교착 상태/직렬화 실패/잠금 시간 초과로 실패하면 처음부터 다시 실행하는 데코레이터
+
+    - 트랜잭션 시작 시 action(`name`)별 lock_timeout/statement_timeout을 설정합니다. (TRANSACTION_TIMEOUTS)
+    - 최대 TRANSACTION_RETRY_ATTEMPTS번 재시도하며, 재시도 사이에는 지터가 있는 지수 백오프로 대기합니다.
+    - 재시도할 수 없거나 재시도 횟수를 모두 사용하면 TransactionConflict(503) 예외 발생
+    - 바깥 트랜잭션 안에서 호출되면 롤백된 트랜잭션을 다시 실행할 수 없으므로 재시도하지 않습니다.
+    - 최대 인원 초과 거절 지표는 마지막 시도의 거절만 기록합니다. (재시도된 시도는 제외)
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            retryable = not connection.in_atomic_block
+            timeouts = get_transaction_timeouts(name)
+            attempt = 0
+            while True:
+                with defer_capacity_rejections() as rejections:
+                    try:
+                        with transaction.atomic():
+                            set_transaction_timeouts(*timeouts)
+                            return func(*args, **kwargs)
+                    except DatabaseError as e:
+                        outcome = classify_database_error(e)
+                        if outcome not in RETRYABLE_OUTCOMES and outcome != "statement_timeout":
+                            raise
+                        if (
+                            outcome not in RETRYABLE_OUTCOMES
+                            or not retryable
+                            or attempt >= settings.TRANSACTION_RETRY_ATTEMPTS
+                        ):
+                            transaction_failures.inc(action=name, reason=outcome)
+                            raise TransactionConflict() from e
+
+                        # 다시 실행할 시도의 최대 인원 초과 거절은 기록하지 않습니다.
+                        rejections.clear()
+                        attempt += 1
+                        transaction_retries.inc(action=name, reason=outcome)
+                        time.sleep(get_retry_delay(attempt))
+
+        return wrapper
+
+    return decorator
@@ -1,3 +1,66 @@
-from django.shortcuts import render
+import ipaddress
 
-# Create your views here.
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from core.metrics import registry
+from schedules.models import ExamSchedule, ScheduleCapacityShard
+
+GAUGES_CACHE_KEY = "metrics:gauges"
+
+
+def metrics_allowed(request):
+    """
+    METRICS_BEARER_TOKEN과 같은 Bearer 토큰을 보냈거나, 클라이언트 IP가 METRICS_ALLOWED_IPS에 포함되면 True
+
+    - METRICS_ALLOWED_IPS에는 IP 또는 대역(CIDR)을 지정하며, 프록시 뒤에서는 프록시의 IP(REMOTE_ADDR)로 검사합니다.
+    """
+    token = settings.METRICS_BEARER_TOKEN
+    if token and constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        return True
+    try:
+        address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network, strict=False) for network in settings.METRICS_ALLOWED_IPS)
+
+
+def get_schedule_gauges():
+    """
+    일정 테이블의 카운터로 계산한 현재 값(예약 가능 일정 수, 확정 대기 예약/인원 수)
+
+    - 스크레이프마다 집계하지 않도록 METRICS_GAUGE_CACHE_TIMEOUT초 동안 캐시합니다. (0이면 캐시 사용 안 함)
+    """
+    timeout = settings.METRICS_GAUGE_CACHE_TIMEOUT
+    gauges = cache.get(GAUGES_CACHE_KEY) if timeout else None
+    if gauges is not None:
+        return gauges
+
+    # 확정 대기 카운터는 일정의 기준값과 스트라이프 증감의 합계입니다.
+    aggregates = {field: Coalesce(Sum(field), 0) for field in ExamSchedule.pending_counter_fields}
+    totals = [model.objects.aggregate(**aggregates) for model in [ExamSchedule, ScheduleCapacityShard]]
+    pending = {field: sum(total[field] for total in totals) for field in ExamSchedule.pending_counter_fields}
+    gauges = [
+        ("exam_schedules_open", "Schedules open for reservation", ExamSchedule.objects.open_for_reservation().count()),
+        ("reservations_pending", "Reservations waiting for confirmation", pending["pending_reservations"]),
+        ("reservation_pending_participants", "Participants waiting for confirmation", pending["pending_participants"]),
+    ]
+    if timeout:
+        cache.set(GAUGES_CACHE_KEY, gauges, timeout)
+    return gauges
+
+
+def metrics(request):
+    """
+    모든 워커 프로세스의 지표를 합산하여 Prometheus 텍스트 형식으로 반환합니다.
+
+    - 허용된 IP 또는 Bearer 토큰이 아니면 403 응답
+    - 요청 지표 외에 일정 테이블의 카운터로 계산한 현재 값을 함께 반환합니다.
+    """
+    if not metrics_allowed(request):
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(get_schedule_gauges()), content_type="text/plain; version=0.0.4; charset=utf-8")
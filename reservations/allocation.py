@@ -0,0 +1,232 @@
+import heapq
+from collections import defaultdict, deque
+from operator import attrgetter
+
+from django.db.models import F
+from django.utils import timezone
+
+from core.metrics import record_confirms
+from core.transactions import retry_transaction
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+
+created_order = attrgetter("created_at", "id")
+
+
+class AllocationPolicy:
+    """
+    남은 인원 안에서 확정할 확정 대기 예약을 고르는 정책
+
+    - `select`는 확정 대기 예약 행(id, user_id, expected_participants, created_at)과 남은 인원을 받아
+      확정할 행 목록을 반환하며, DB에 접근하지 않습니다.
+    """
+
+    name = None
+
+    def select(self, pending, capacity):
+        raise NotImplementedError
+
+
+class FIFOPolicy(AllocationPolicy):
+    """
+    생성 순서대로 남은 인원에 들어가는 예약을 확정합니다. (일괄 확정과 같은 방식)
+    """
+
+    name = "fifo"
+
+    def select(self, pending, capacity):
+        accepted = []
+        for row in sorted(pending, key=created_order):
+            if row.expected_participants <= capacity:
+                capacity -= row.expected_participants
+                accepted.append(row)
+        return accepted
+
+
+class BestFillPolicy(AllocationPolicy):
+    """
+    확정 인원 합계가 남은 인원에 가장 가깝도록 예약 조합을 고릅니다. (부분집합 합 배낭 문제)
+
+    - 같은 인원의 예약을 묶어 2의 거듭제곱 개씩 나눈 뒤, 도달 가능한 합계를 정수 비트셋으로 계산합니다.
+    - 같은 인원의 예약 중에서는 먼저 생성된 예약을 확정합니다.
+    - 비트셋 기록이 `max_table_bits`를 넘으면 인원이 큰 순서로 채웁니다. (first fit decreasing)
+    """
+
+    name = "best_fill"
+    max_table_bits = 1 << 28
+
+    def select(self, pending, capacity):
+        candidates = sorted((row for row in pending if row.expected_participants <= capacity), key=created_order)
+        if sum(row.expected_participants for row in candidates) <= capacity:
+            return candidates
+
+        rows_by_size = defaultdict(list)
+        for row in candidates:
+            rows_by_size[row.expected_participants].append(row)
+
+        chunks = []
+        for size, rows in rows_by_size.items():
+            remaining, take = len(rows), 1
+            while remaining:
+                take = min(take, remaining)
+                chunks.append((size, take))
+                remaining -= take
+                take *= 2
+
+        if len(chunks) * (capacity + 1) > self.max_table_bits:
+            return self._first_fit_decreasing(candidates, capacity)
+
+        # history[i]: i번째 묶음을 더하기 전에 도달 가능한 합계의 비트셋
+        mask = (1 << (capacity + 1)) - 1
+        reachable = 1
+        history = []
+        for size, take in chunks:
+            history.append(reachable)
+            reachable = (reachable | (reachable << (size * take))) & mask
+
+        target = reachable.bit_length() - 1
+        taken = defaultdict(int)
+        for (size, take), before in zip(reversed(chunks), reversed(history)):
+            if not (before >> target) & 1:
+                target -= size * take
+                taken[size] += take
+
+        return sorted((row for size, count in taken.items() for row in rows_by_size[size][:count]), key=created_order)
+
+    @staticmethod
+    def _first_fit_decreasing(candidates, capacity):
+        accepted = []
+        for row in sorted(candidates, key=lambda row: -row.expected_participants):
+            if row.expected_participants <= capacity:
+                capacity -= row.expected_participants
+                accepted.append(row)
+        return sorted(accepted, key=created_order)
+
+
+class FairSharePolicy(AllocationPolicy):
+    """
+    사용자별 확정 인원이 고르게 나뉘도록 예약을 확정합니다. (max-min 공정 분배)
+
+    - 지금까지 확정된 인원이 가장 적은 사용자의 가장 먼저 생성된 예약부터 하나씩 확정합니다.
+    - 남은 인원에 들어가지 않는 예약은 건너뛰고 해당 사용자의 다음 예약을 고려합니다.
+    """
+
+    name = "fair_share"
+
+    def select(self, pending, capacity):
+        queues = defaultdict(deque)
+        for row in sorted(pending, key=created_order):
+            queues[row.user_id].append(row)
+
+        heap = [(0, *created_order(queue[0]), user_id) for user_id, queue in queues.items()]
+        heapq.heapify(heap)
+
+        accepted = []
+        while heap and capacity:
+            admitted, _, _, user_id = heapq.heappop(heap)
+            queue = queues[user_id]
+            row = queue.popleft()
+            if row.expected_participants <= capacity:
+                capacity -= row.expected_participants
+                admitted += row.expected_participants
+                accepted.append(row)
+            if queue:
+                heapq.heappush(heap, (admitted, *created_order(queue[0]), user_id))
+        return sorted(accepted, key=created_order)
+
+
+ALLOCATION_POLICIES = {policy.name: policy for policy in [FIFOPolicy(), BestFillPolicy(), FairSharePolicy()]}
+
+
+class AllocationPlan:
+    """
+    일정 하나에 대한 배정 계획
+
+    - 남은 인원과 확정 대기 예약, 정책이 고른 확정 대상을 가지고 있으며 `apply`로 DB에 반영합니다.
+    """
+
+    update_batch_size = 5000
+
+    def __init__(self, schedule_id, policy, remaining_capacity, pending, accepted):
+        self.schedule_id = schedule_id
+        self.policy = policy
+        self.remaining_capacity = remaining_capacity
+        self.pending_reservations = len(pending)
+        self.pending_participants = sum(row.expected_participants for row in pending)
+        self.reservation_ids = [row.id for row in accepted]
+        self.confirmed_participants = sum(row.expected_participants for row in accepted)
+
+    def apply(self):
+        """
+        계획한 예약들을 확정하고 일정의 확정/확정 대기 인원에 반영합니다.
+
+        - 트랜잭션 안에서 호출되어야 합니다.
+        - 확정 인원은 조건부 UPDATE로 한 번에 반영하므로 그 사이 남은 인원이 줄었다면 예외 발생
+        """
+        if not self.reservation_ids:
+            return
+
+        ExamSchedule.change_confirmed_participants(
+            self.schedule_id, self.confirmed_participants, -self.confirmed_participants, -len(self.reservation_ids)
+        )
+
+        confirmed_at = timezone.now()
+        for start in range(0, len(self.reservation_ids), self.update_batch_size):
+            Reservation.objects.filter(id__in=self.reservation_ids[start : start + self.update_batch_size]).update(
+                is_confirmed=True, confirmed_at=confirmed_at, version=F("version") + 1
+            )
+        record_confirms(len(self.reservation_ids), source="allocate")
+
+    def to_representation(self, dry_run):
+        return {
+            "schedule_id": self.schedule_id,
+            "policy": self.policy,
+            "dry_run": dry_run,
+            "remaining_capacity": self.remaining_capacity,
+            "pending_reservations": self.pending_reservations,
+            "pending_participants": self.pending_participants,
+            "confirmed_reservations": len(self.reservation_ids),
+            "confirmed_participants": self.confirmed_participants,
+            "unused_capacity": self.remaining_capacity - self.confirmed_participants,
+            "reservation_ids": self.reservation_ids,
+        }
+
+
+def plan_allocation(schedule_id, policy, lock=False):
+    """
+    일정의 확정 대기 예약 전체를 메모리로 읽어 정책에 따른 배정 계획을 만듭니다.
+
+    - `lock`이면 확정 대기 예약 행을 id 순서로 잠가 계획과 반영 사이에 대상이 바뀌지 않게 합니다.
+    - 일정 행은 잠그지 않습니다. 반영 시 확정 인원을 조건부 UPDATE로 늘리므로 그 사이 남은 인원이 줄었다면 예외 발생
+    - 예약 확정/수정과 같은 순서(예약 행 → 일정 행)로 잠가 교착 상태를 피합니다.
+    - 일정이 없으면 ExamSchedule.DoesNotExist 예외 발생
+    """
+    reservations = Reservation.objects.filter(schedule_id=schedule_id, is_confirmed=False).order_by("id")
+    if lock:
+        reservations = reservations.select_for_update()
+
+    pending = list(reservations.values_list("id", "user_id", "expected_participants", "created_at", named=True))
+    remaining_capacity = ExamSchedule.objects.with_confirmed_total().get(id=schedule_id).get_remaining_capacity()
+    accepted = ALLOCATION_POLICIES[policy].select(pending, max(remaining_capacity, 0))
+    return AllocationPlan(schedule_id, policy, remaining_capacity, pending, accepted)
+
+
+@retry_transaction("reservations.allocate")
+def apply_allocation(schedule_id, policy):
+    """
+    확정 대기 예약 행을 잠근 트랜잭션에서 배정 계획을 만들어 반영합니다.
+
+    - 교착 상태/잠금 시간 초과로 실패하면 트랜잭션을 처음부터 다시 실행합니다.
+    """
+    plan = plan_allocation(schedule_id, policy, lock=True)
+    plan.apply()
+    return plan
+
+
+def run_allocation(schedule_id, policy, dry_run=False):
+    """
+    배정 계획을 만들고, `dry_run`이 아니면 한 트랜잭션으로 반영한 뒤 계획을 반환합니다.
+    """
+    if dry_run:
+        return plan_allocation(schedule_id, policy)
+    return apply_allocation(schedule_id, policy)
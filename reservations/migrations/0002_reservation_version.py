@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-18 18:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reservations", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reservation",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
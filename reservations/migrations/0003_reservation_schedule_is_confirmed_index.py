@@ -0,0 +1,16 @@
+# Generated by Django 5.2 on 2026-10-18 19:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reservations", "0002_reservation_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(fields=["schedule", "is_confirmed"], name="reservation_schedul_ff3fa6_idx"),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-18 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("reservations", "0003_reservation_schedule_is_confirmed_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(fields=["user", "-created_at", "-id"], name="reservation_user_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                fields=["schedule", "is_confirmed", "-created_at", "-id"], name="reservation_sched_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reservation",
+            index=models.Index(
+                condition=models.Q(("is_confirmed", False)),
+                fields=["-created_at", "-id"],
+                name="reservation_pending_idx",
+            ),
+        ),
+        # (schedule, is_confirmed)는 reservation_sched_created_idx의 앞부분과 같으므로 제거
+        migrations.RemoveIndex(
+            model_name="reservation",
+            name="reservation_schedul_ff3fa6_idx",
+        ),
+    ]
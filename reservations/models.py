@@ -1,10 +1,21 @@
+from collections import defaultdict
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.utils import timezone
 
+from core.metrics import record_confirms
 from schedules.models import ExamSchedule
 
 
+class ConfirmResult(models.TextChoices):
+    CONFIRMED = "confirmed", "확정 완료"
+    ALREADY_CONFIRMED = "already_confirmed", "이미 확정된 예약"
+    OVER_CAPACITY = "over_capacity", "최대 참가자 수 초과"
+    NOT_FOUND = "not_found", "존재하지 않는 예약"
+
+
 class Reservation(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reservations")
     schedule = models.ForeignKey(ExamSchedule, on_delete=models.CASCADE, related_name="reservations")
@@ -12,64 +23,196 @@ class Reservation(models.Model):
     is_confirmed = models.BooleanField(default=False)
     confirmed_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    version = models.PositiveIntegerField(default=1)  # 행이 변경될 때마다 증가 (ETag 등에 사용)
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["user", "is_confirmed"]),
+            # 일반 사용자 목록: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+            models.Index(fields=["user", "-created_at", "-id"], name="reservation_user_created_idx"),
+            # 관리자 일정별 목록, 일정별 통계/배정: WHERE schedule_id = ? [AND is_confirmed = ?] ORDER BY created_at
+            models.Index(
+                fields=["schedule", "is_confirmed", "-created_at", "-id"], name="reservation_sched_created_idx"
+            ),
+            # 관리자 확정 대기 목록: WHERE NOT is_confirmed ORDER BY created_at DESC, id DESC
+            models.Index(
+                fields=["-created_at", "-id"], condition=models.Q(is_confirmed=False), name="reservation_pending_idx"
+            ),
         ]
 
-    def _get_exam_schedule_for_update(self):
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version += 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = [*kwargs["update_fields"], "version"]
+            super().save(*args, **kwargs)
+            return
+
+        # 새 확정 대기 예약은 일정의 확정 대기 인원/예약 수에 함께 반영합니다.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if not self.is_confirmed:
+                ExamSchedule.change_pending_participants(self.schedule_id, self.expected_participants, 1)
+
+    @classmethod
+    def bulk_confirm(cls, queryset):
         """
-        일정 객체를 select_for_update로 가져옵니다.
+        조회된 예약들을 일괄 확정 처리하고, 예약 ID별 처리 결과를 반환합니다.
 
-        - 동시성 제어를 위해 예약 확정/변경 시 반드시 사용해야 합니다.
+        - 트랜잭션 안에서 호출되어야 합니다.
+        - 일정별로 확정 인원을 한 번에 증가시키고, 예약 상태는 단일 UPDATE로 변경합니다.
+        - 남은 인원을 초과하는 일정은 생성 순서대로 채울 수 있는 예약만 확정합니다.
+        """
+        rows = (
+            queryset.select_for_update(of=("self",))
+            .order_by("id")
+            .values_list("id", "schedule_id", "expected_participants", "is_confirmed", "created_at")
+        )
+
+        results = {}
+        pending_by_schedule = defaultdict(list)
+        for reservation_id, schedule_id, expected_participants, is_confirmed, created_at in rows:
+            if is_confirmed:
+                results[reservation_id] = ConfirmResult.ALREADY_CONFIRMED
+            else:
+                pending_by_schedule[schedule_id].append((created_at, reservation_id, expected_participants))
+
+        confirmed_ids = []
+        rejected_ids = []
+        for schedule_id, pending in sorted(pending_by_schedule.items()):
+            accepted, rejected = cls._admit_within_capacity(schedule_id, pending)
+            confirmed_ids.extend(accepted)
+            rejected_ids.extend(rejected)
+
+        if confirmed_ids:
+            cls.objects.filter(id__in=confirmed_ids).update(
+                is_confirmed=True, confirmed_at=timezone.now(), version=F("version") + 1
+            )
+            record_confirms(len(confirmed_ids), source="bulk_confirm")
+
+        results.update(dict.fromkeys(confirmed_ids, ConfirmResult.CONFIRMED))
+        results.update(dict.fromkeys(rejected_ids, ConfirmResult.OVER_CAPACITY))
+        return results
+
+    @staticmethod
+    def _admit_within_capacity(schedule_id, pending):
         """
-        return ExamSchedule.objects.select_for_update().get(id=self.schedule.id)
+        한 일정의 확정 대기 예약들을 남은 인원 안에서 확정 인원에 반영합니다.
+
+        - 전체 인원이 들어가면 조건부 UPDATE 한 번으로 반영합니다.
+        - 초과하는 경우 생성 순서대로 남은 인원에 들어가는 예약만 골라 다시 반영합니다.
+        - 확정된 예약의 인원/수만큼 확정 대기 인원/예약 수도 같은 UPDATE로 감소시킵니다.
+        - (확정된 예약 ID 목록, 인원 초과로 거절된 예약 ID 목록)을 반환합니다.
+        """
+        pending.sort()
+        total = sum(count for _, _, count in pending)
+        try:
+            ExamSchedule.change_confirmed_participants(schedule_id, total, -total, -len(pending))
+            return [reservation_id for _, reservation_id, _ in pending], []
+        except ValueError:
+            pass
+
+        remaining = ExamSchedule.objects.get(id=schedule_id).get_remaining_capacity()
+        accepted, rejected, admitted = [], [], 0
+        for _, reservation_id, expected_participants in pending:
+            if admitted + expected_participants <= remaining:
+                admitted += expected_participants
+                accepted.append(reservation_id)
+            else:
+                rejected.append(reservation_id)
+
+        try:
+            ExamSchedule.change_confirmed_participants(schedule_id, admitted, -admitted, -len(accepted))
+        except ValueError:
+            return [], accepted + rejected
+        return accepted, rejected
+
+    def _change_schedule_participants(self, confirmed=0, pending=0, pending_reservations=0):
+        """
+        일정의 확정 인원과 확정 대기 인원/예약 수를 UPDATE 한 번으로 함께 증감합니다.
+
+        - 확정 인원이 바뀌면 최대 인원 조건이 있는 UPDATE에 확정 대기 증감을 포함하므로, 조건을 만족하지 못하면
+          어느 카운터도 변경되지 않습니다.
+        - 스트라이프 모드인 일정은 일정 행 대신 스트라이프 하나만 갱신하므로 같은 일정의 확정/변경/취소가 일정 행에서
+          대기하지 않습니다. 스트라이프 모드가 아니면 UPDATE한 일정 행은 트랜잭션이 끝날 때까지 잠깁니다.
+        - 이미 로드된 일정 객체가 있으면 변경된 인원 수로 갱신합니다.
+        """
+        ExamSchedule.change_confirmed_participants(self.schedule_id, confirmed, pending, pending_reservations)
+
+        if Reservation.schedule.is_cached(self):
+            self.schedule.refresh_from_db(
+                fields=["confirmed_participants", "pending_participants", "pending_reservations", "version"]
+            )
 
     def confirm(self):
         """
         예약을 확정 처리합니다.
 
         - 이미 확정된 예약은 예외 발생
-        - 일정의 확정 인원을 증가시킵니다.
+        - 일정의 확정 인원을 증가시키고, 확정 대기 인원/예약 수를 감소시킵니다.
         """
         if self.is_confirmed:
             raise ValueError("예약이 이미 확정되었습니다.")
 
-        schedule = self._get_exam_schedule_for_update()
-
-        schedule.add_confirmed_participant(self.expected_participants)
+        self._change_schedule_participants(
+            confirmed=self.expected_participants, pending=-self.expected_participants, pending_reservations=-1
+        )
 
         self.is_confirmed = True
         self.confirmed_at = timezone.now()
         self.save(update_fields=["is_confirmed", "confirmed_at"])
+        record_confirms(1, source="confirm")
 
-    def modify_participants(self, new_expected_participants):
+    def modify_pending_participants(self, new_expected_participants):
         """
-        확정된 예약의 인원 수를 변경합니다.
+        확정되지 않은 예약의 인원 수를 행 잠금 없이 버전 조건부 UPDATE로 변경합니다.
 
-        - 확정되지 않은 예약은 변경 없이 무시됩니다.
-        - 기존 인원을 제거한 뒤 새 인원 수로 반영합니다.
+        - 확정 대기 인원은 일정(스트라이프 모드면 스트라이프)에 UPDATE 한 번으로 반영하며, 일정 버전은 바뀌지 않습니다.
+        - 조회한 이후 예약이 변경/확정/삭제되어 버전이 다르면 아무것도 변경하지 않고 False를 반환합니다.
+        - 확정 인원은 변경되지 않으므로 일정의 확정 대기 인원만 함께 반영합니다.
         """
-        if not self.is_confirmed:
-            return
+        updated = Reservation.objects.filter(id=self.id, version=self.version, is_confirmed=False).update(
+            expected_participants=new_expected_participants, version=F("version") + 1
+        )
+        if not updated:
+            return False
 
-        schedule = self._get_exam_schedule_for_update()
+        self._change_schedule_participants(pending=new_expected_participants - self.expected_participants)
+        self.expected_participants = new_expected_participants
+        self.version += 1
+        return True
+
+    def modify_participants(self, new_expected_participants):
+        """
+        예약의 인원 수 변경을 일정에 반영합니다.
 
-        schedule.remove_confirmed_participant(self.expected_participants)
-        schedule.add_confirmed_participant(new_expected_participants)
+        - 확정된 예약은 확정 인원, 확정되지 않은 예약은 확정 대기 인원에 반영됩니다.
+        - 기존 인원과 새 인원 수의 차이만큼 한 번에 반영합니다.
+        """
+        delta = new_expected_participants - self.expected_participants
+        if self.is_confirmed:
+            self._change_schedule_participants(confirmed=delta)
+        else:
+            self._change_schedule_participants(pending=delta)
 
     def cancel(self):
         """
         예약을 취소합니다.
 
-        - 확정된 예약인 경우 확정 인원을 다시 감소시킵니다.
+        - 확정된 예약인 경우 확정 인원을 감소시킵니다.
+        - 확정 대기 인원/예약 수는 예약이 삭제될 때 post_delete 시그널에서 감소시킵니다. (reservations.signals)
         - 예약 객체 자체의 삭제는 view에서 처리됩니다.
         """
-        if not self.is_confirmed:
-            return
+        if self.is_confirmed:
+            self._change_schedule_participants(confirmed=-self.expected_participants)
 
-        schedule = self._get_exam_schedule_for_update()
+    def delete_pending(self):
+        """
+        확정되지 않은 예약을 행 잠금 없이 버전 조건부 DELETE로 취소합니다.
 
-        schedule.remove_confirmed_participant(self.expected_participants)
+        - 조회한 이후 예약이 변경/확정/삭제되어 버전이 다르면 아무것도 변경하지 않고 False를 반환합니다.
+        - 확정 대기 인원/예약 수는 다른 삭제 경로와 같이 post_delete 시그널에서 감소시킵니다. (reservations.signals)
+        """
+        deleted, _ = Reservation.objects.filter(id=self.id, version=self.version, is_confirmed=False).delete()
+        return bool(deleted)
@@ -0,0 +1,5 @@
+from core.pagination import KeysetPagination
+
+
+class ReservationCursorPagination(KeysetPagination):
+    ordering = ("-created_at", "-id")
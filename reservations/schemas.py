@@ -5,10 +5,17 @@ from drf_spectacular.utils import (
     OpenApiResponse,
     extend_schema,
     extend_schema_view,
+    inline_serializer,
 )
-from rest_framework import status
+from rest_framework import serializers, status
 
-from reservations.serializers import ReservationSerializer, ReservationUpdateSerializer
+from reservations.serializers import (
+    ReservationAllocateSerializer,
+    ReservationBulkConfirmResultSerializer,
+    ReservationBulkConfirmSerializer,
+    ReservationSerializer,
+    ReservationUpdateSerializer,
+)
 
 reservation_create_schema = extend_schema(
     summary="예약 신청",
@@ -43,38 +50,67 @@ reservation_list_schema = extend_schema(
             name="ordering", description="정렬 기준 (생성일, 응시 인원)", required=False, type=OpenApiTypes.STR
         ),
         OpenApiParameter(name="page", description="페이지 번호", required=False, type=OpenApiTypes.INT),
+        OpenApiParameter(
+            name="pagination",
+            description="`cursor`로 지정하면 생성일 기준 커서 페이지네이션을 사용합니다. (전체 개수 미제공)",
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=["cursor"],
+        ),
+        OpenApiParameter(
+            name="cursor", description="커서 페이지네이션의 다음 페이지 커서", required=False, type=OpenApiTypes.STR
+        ),
+        OpenApiParameter(
+            name="page_size",
+            description="커서 페이지네이션의 페이지 크기 (최대 100)",
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
     ],
 )
 
 reservation_detail_schema = extend_schema(
     summary="예약 상세 조회",
-    description="예약의 상세 정보를 조회합니다.",
+    description="예약의 상세 정보를 조회합니다.\n\nIf-None-Match 조건부 조회를 지원합니다.",
     responses={
         status.HTTP_200_OK: OpenApiResponse(response=ReservationSerializer, description="예약 상세 정보"),
+        status.HTTP_304_NOT_MODIFIED: OpenApiResponse(description="변경되지 않았습니다."),
         status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
         status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
     },
 )
 
+if_match_parameter = OpenApiParameter(
+    name="If-Match",
+    description="상세 조회 응답의 ETag. 그 사이 예약이 변경되었으면 412로 응답합니다.",
+    required=False,
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.HEADER,
+)
+
 reservation_update_schema = extend_schema(
     summary="예약 수정",
     description="예약을 수정합니다.\n\n예약 수정은 확정 전 까지 가능합니다.\n\n관리자는 모든 예약을 수정할 수 있습니다.",
     request=ReservationUpdateSerializer,
+    parameters=[if_match_parameter],
     responses={
         status.HTTP_200_OK: OpenApiResponse(response=ReservationUpdateSerializer, description="예약이 수정되었습니다."),
         status.HTTP_400_BAD_REQUEST: OpenApiResponse(description="유효하지 않은 입력 데이터입니다."),
         status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
         status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+        status.HTTP_412_PRECONDITION_FAILED: OpenApiResponse(description="If-Match 이후 예약이 변경되었습니다."),
     },
 )
 
 reservation_delete_schema = extend_schema(
     summary="예약 삭제",
     description="예약을 삭제합니다.\n\n예약 삭제는 확정 전 까지 가능합니다.\n\n관리자는 모든 예약을 삭제할 수 있습니다.",
+    parameters=[if_match_parameter],
     responses={
         status.HTTP_204_NO_CONTENT: OpenApiResponse(description="예약이 성공적으로 삭제되었습니다."),
         status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
         status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+        status.HTTP_412_PRECONDITION_FAILED: OpenApiResponse(description="If-Match 이후 예약이 변경되었습니다."),
     },
 )
 
@@ -94,6 +130,105 @@ reservation_confirm_schema = extend_schema(
     },
 )
 
+reservation_bulk_confirm_schema = extend_schema(
+    summary="예약 일괄 확정",
+    description=(
+        "여러 예약을 한 번에 확정 처리합니다.\n\n"
+        "확정할 예약 ID 목록(`ids`)을 전달하거나, 목록 조회와 동일한 필터(쿼리 파라미터)로 대상을 지정합니다.\n\n"
+        "일정별 남은 인원을 초과하는 예약은 생성 순서대로 채운 뒤 나머지를 `over_capacity`로 처리합니다.\n\n"
+        "이 API는 관리자 권한이 필요합니다."
+    ),
+    request=ReservationBulkConfirmSerializer,
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(
+            response=inline_serializer(
+                name="ReservationBulkConfirmResponse",
+                fields={
+                    "confirmed_count": serializers.IntegerField(),
+                    "results": ReservationBulkConfirmResultSerializer(many=True),
+                },
+            ),
+            description="예약 ID별 확정 처리 결과",
+        ),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(description="유효하지 않은 입력 데이터입니다."),
+        status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
+        status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+    },
+    parameters=[
+        OpenApiParameter(name="search", description="검색어 (시험 제목)", required=False, type=OpenApiTypes.STR),
+        OpenApiParameter(name="schedule", description="시험 일정 ID", required=False, type=OpenApiTypes.INT),
+        OpenApiParameter(name="user", description="사용자 ID", required=False, type=OpenApiTypes.INT),
+        OpenApiParameter(name="is_confirmed", description="확정 여부", required=False, type=OpenApiTypes.BOOL),
+    ],
+)
+
+reservation_allocate_schema = extend_schema(
+    summary="확정 대기 예약 배정",
+    description=(
+        "일정의 확정 대기 예약을 남은 인원 안에서 배정 정책에 따라 한 번에 확정합니다.\n\n"
+        "- `fifo`: 생성 순서대로 남은 인원에 들어가는 예약을 확정\n"
+        "- `best_fill`: 확정 인원 합계가 남은 인원에 가장 가깝도록 예약 조합을 선택\n"
+        "- `fair_share`: 사용자별 확정 인원이 고르게 나뉘도록 확정\n\n"
+        "`dry_run`이면 DB를 변경하지 않고 배정 계획만 반환합니다.\n\n"
+        "이 API는 관리자 권한이 필요합니다."
+    ),
+    request=ReservationAllocateSerializer,
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(
+            response=inline_serializer(
+                name="ReservationAllocateResponse",
+                fields={
+                    "schedule_id": serializers.IntegerField(),
+                    "policy": serializers.CharField(),
+                    "dry_run": serializers.BooleanField(),
+                    "remaining_capacity": serializers.IntegerField(help_text="배정 전 남은 인원"),
+                    "pending_reservations": serializers.IntegerField(help_text="배정 전 확정 대기 예약 수"),
+                    "pending_participants": serializers.IntegerField(help_text="배정 전 확정 대기 인원"),
+                    "confirmed_reservations": serializers.IntegerField(help_text="확정(예정)된 예약 수"),
+                    "confirmed_participants": serializers.IntegerField(help_text="확정(예정)된 인원"),
+                    "unused_capacity": serializers.IntegerField(help_text="배정 후 남는 인원"),
+                    "reservation_ids": serializers.ListField(child=serializers.IntegerField()),
+                },
+            ),
+            description="배정 계획 (dry_run이 아니면 반영된 결과)",
+        ),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="유효하지 않은 입력 데이터이거나 배정 중 남은 인원이 변경되었습니다."
+        ),
+        status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
+        status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+    },
+)
+
+reservation_export_schema = extend_schema(
+    summary="예약 내보내기",
+    description=(
+        "예약 목록을 CSV 또는 NDJSON으로 내보냅니다.\n\n"
+        "목록 조회와 동일한 필터, 검색, 정렬을 적용하며 페이지 구분 없이 전체 결과를 스트리밍합니다.\n\n"
+        "이 API는 관리자 권한이 필요합니다."
+    ),
+    responses={
+        (status.HTTP_200_OK, "text/csv"): OpenApiResponse(response=OpenApiTypes.STR, description="CSV"),
+        (status.HTTP_200_OK, "application/x-ndjson"): OpenApiResponse(
+            response=OpenApiTypes.STR, description="줄마다 예약 하나의 JSON 객체"
+        ),
+        status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
+        status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+    },
+    parameters=[
+        OpenApiParameter(
+            name="format", description="내보내기 형식", required=False, type=OpenApiTypes.STR, enum=["csv", "ndjson"]
+        ),
+        OpenApiParameter(name="search", description="검색어 (시험 제목)", required=False, type=OpenApiTypes.STR),
+        OpenApiParameter(name="schedule", description="시험 일정 ID", required=False, type=OpenApiTypes.INT),
+        OpenApiParameter(name="user", description="사용자 ID", required=False, type=OpenApiTypes.INT),
+        OpenApiParameter(name="is_confirmed", description="확정 여부", required=False, type=OpenApiTypes.BOOL),
+        OpenApiParameter(
+            name="ordering", description="정렬 기준 (생성일, 응시 인원)", required=False, type=OpenApiTypes.STR
+        ),
+    ],
+)
+
 reservation_schema_view = extend_schema_view(
     list=reservation_list_schema,
     create=reservation_create_schema,
@@ -102,4 +237,7 @@ reservation_schema_view = extend_schema_view(
     partial_update=reservation_update_schema,
     destroy=reservation_delete_schema,
     confirm=reservation_confirm_schema,
+    bulk_confirm=reservation_bulk_confirm_schema,
+    allocate=reservation_allocate_schema,
+    export=reservation_export_schema,
 )
@@ -1,45 +1,67 @@
 from django.contrib.auth import get_user_model
+from django.db.models import F
 from django.utils import timezone
 from rest_framework import serializers
 
-from reservations.models import Reservation
-from schedules.models import ExamSchedule
-from schedules.serializers import ExamScheduleSerializer
+from core.timing import TimedSerializerMixin
+from reservations.allocation import ALLOCATION_POLICIES, FIFOPolicy
+from reservations.models import ConfirmResult, Reservation
+from schedules.cache import get_cached_start_time, set_cached_start_time
+from schedules.models import ExamSchedule, confirmed_total_expression, pending_total_expressions
+from schedules.serializers import ExamScheduleListProjection, ExamScheduleSerializer
 from users.serializers.users import UserMeSerializer
 
 User = get_user_model()
 
 
-class ReservationSerializer(serializers.ModelSerializer):
+class ReservationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = UserMeSerializer(read_only=True)
-    schedule_id = serializers.PrimaryKeyRelatedField(
-        queryset=ExamSchedule.objects.all(), source="schedule", write_only=True
-    )
+    # 일정 행 전체를 읽지 않도록 ID만 받고, validate에서 검사에 필요한 값만 조회합니다.
+    schedule_id = serializers.IntegerField(min_value=1, write_only=True)
     schedule = ExamScheduleSerializer(read_only=True)
 
     class Meta:
         model = Reservation
         fields = "__all__"
-        read_only_fields = ["id", "user", "is_confirmed", "confirmed_at", "created_at"]
+        read_only_fields = ["id", "user", "is_confirmed", "confirmed_at", "created_at", "version"]
 
     def validate(self, attrs):
-        schedule = attrs.get("schedule")
-        if timezone.now() > schedule.get_reservation_deadline():
-            raise serializers.ValidationError("예약 마감 시간이 지났습니다.")
-        expected_participants = attrs.get("expected_participants")
-        if expected_participants > schedule.get_remaining_capacity():
+        """
+        예약 마감 시간과 남은 인원을 검사합니다.
+
+        - 캐시된 시험 시작 시간으로 마감이 지난 요청은 DB 조회 없이 거절합니다.
+        - 그 외에는 시험 시작 시간과 확정 인원만 조회하여 검사하고, 시작 시간을 캐시합니다.
+        """
+        schedule_id = attrs["schedule_id"]
+        start_time = get_cached_start_time(schedule_id)
+        if start_time is not None:
+            self._validate_deadline(start_time)
+
+        snapshot = ExamSchedule.get_admission_snapshot(schedule_id)
+        if snapshot is None:
+            raise serializers.ValidationError({"schedule_id": "존재하지 않는 시험 일정입니다."})
+        start_time, remaining_capacity = snapshot
+        set_cached_start_time(schedule_id, start_time)
+
+        self._validate_deadline(start_time)
+        if attrs.get("expected_participants") > remaining_capacity:
             raise serializers.ValidationError("예약 가능한 인원 수를 초과했습니다.")
         return attrs
 
+    @staticmethod
+    def _validate_deadline(start_time):
+        if timezone.now() > ExamSchedule.calculate_reservation_deadline(start_time):
+            raise serializers.ValidationError("예약 마감 시간이 지났습니다.")
+
 
-class ReservationUpdateSerializer(serializers.ModelSerializer):
+class ReservationUpdateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     user = UserMeSerializer(read_only=True)
     schedule = ExamScheduleSerializer(read_only=True)
 
     class Meta:
         model = Reservation
         fields = "__all__"
-        read_only_fields = ["id", "user", "schedule", "is_confirmed", "confirmed_at", "created_at"]
+        read_only_fields = ["id", "user", "schedule", "is_confirmed", "confirmed_at", "created_at", "version"]
 
     def validate_expected_participants(self, value):
         instance = self.instance
@@ -55,3 +77,114 @@ class ReservationUpdateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("예약 가능한 인원 수를 초과했습니다.")
 
         return value
+
+
+class ReservationBulkConfirmSerializer(TimedSerializerMixin, serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=10000, required=False
+    )
+
+
+class ReservationAllocateSerializer(TimedSerializerMixin, serializers.Serializer):
+    schedule_id = serializers.IntegerField(min_value=1)
+    policy = serializers.ChoiceField(choices=list(ALLOCATION_POLICIES), default=FIFOPolicy.name)
+    dry_run = serializers.BooleanField(default=False)
+
+
+class ReservationBulkConfirmResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    result = serializers.ChoiceField(choices=ConfirmResult.choices)
+
+
+class ReservationListProjection:
+    """
+    목록 조회용 읽기 전용 프로젝션
+
+    - `values()`로 예약, 사용자, 일정의 필요한 컬럼만 한 번에 조회합니다.
+    - ReservationSerializer와 같은 형태의 dict를 serializer 없이 직접 만듭니다.
+    """
+
+    datetime_field = serializers.DateTimeField()
+
+    @classmethod
+    def values(cls, queryset):
+        return queryset.values(
+            "id",
+            "expected_participants",
+            "is_confirmed",
+            "confirmed_at",
+            "created_at",
+            "version",
+            "user_id",
+            "user__username",
+            "user__email",
+            *ExamScheduleListProjection.columns(prefix="schedule__"),
+            schedule_confirmed_total=confirmed_total_expression(prefix="schedule__", schedule_ref="schedule_id"),
+            **{
+                f"schedule_{name}": expression
+                for name, expression in pending_total_expressions(
+                    prefix="schedule__", schedule_ref="schedule_id"
+                ).items()
+            },
+        )
+
+    @classmethod
+    def to_representation(cls, row):
+        to_datetime = cls.datetime_field.to_representation
+        return {
+            "id": row["id"],
+            "user": {"id": row["user_id"], "username": row["user__username"], "email": row["user__email"]},
+            "schedule": ExamScheduleListProjection.to_representation(
+                row, prefix="schedule__", totals_prefix="schedule_"
+            ),
+            "expected_participants": row["expected_participants"],
+            "is_confirmed": row["is_confirmed"],
+            "confirmed_at": to_datetime(row["confirmed_at"]),
+            "created_at": to_datetime(row["created_at"]),
+            "version": row["version"],
+        }
+
+
+class ReservationExportProjection:
+    """
+    내보내기용 평면(flat) 프로젝션
+
+    - `values()`로 예약 컬럼과 사용자 이름, 일정 제목을 조인하여 한 행으로 조회합니다.
+    - CSV/NDJSON 한 줄에 그대로 출력할 수 있도록 중첩 없는 dict를 만듭니다.
+    """
+
+    columns = [
+        "id",
+        "user_id",
+        "username",
+        "schedule_id",
+        "schedule_title",
+        "expected_participants",
+        "is_confirmed",
+        "confirmed_at",
+        "created_at",
+    ]
+    datetime_field = serializers.DateTimeField()
+
+    @classmethod
+    def values(cls, queryset):
+        return queryset.values(
+            "id",
+            "user_id",
+            "schedule_id",
+            "expected_participants",
+            "is_confirmed",
+            "confirmed_at",
+            "created_at",
+            username=F("user__username"),
+            schedule_title=F("schedule__title"),
+        )
+
+    @classmethod
+    def to_representation(cls, row):
+        to_datetime = cls.datetime_field.to_representation
+        return {
+            **{column: row[column] for column in cls.columns},
+            "confirmed_at": to_datetime(row["confirmed_at"]),
+            "created_at": to_datetime(row["created_at"]),
+        }
@@ -0,0 +1,20 @@
+from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+
+
+@receiver(post_delete, sender=Reservation)
+def release_pending_participants(sender, instance, origin=None, **kwargs):
+    """
+    확정 대기 예약이 삭제되면 일정의 확정 대기 인원/예약 수를 감소시킵니다.
+
+    - 뷰, 관리자 페이지, queryset.delete(), 사용자 삭제에 따른 CASCADE 삭제를 모두 반영합니다.
+    - 일정과 함께 삭제되는 예약은 반영하지 않습니다.
+    """
+    origin_model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    if instance.is_confirmed or issubclass(origin_model, ExamSchedule):
+        return
+    ExamSchedule.change_pending_participants(instance.schedule_id, -instance.expected_participants, -1)
@@ -0,0 +1,181 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+
+User = get_user_model()
+
+"""
+확정 대기 예약 배정
+- FIFO 정책으로 생성 순서대로 남은 인원에 들어가는 예약 확정 - 성공
+- best fill 정책으로 남은 인원을 모두 채우는 예약 조합 확정 - 성공
+- fair share 정책으로 사용자별 확정 인원을 고르게 배정 - 성공
+- dry run 시 배정 계획만 반환하고 DB는 변경하지 않음 - 성공
+- 스트라이프 모드 일정의 배정 - 성공
+- 확정 대기 예약 행을 id 순서로 먼저 조회하고 일정 행은 조건부 UPDATE로만 변경 - 성공
+- 존재하지 않는 일정 또는 정책 - 실패
+- 유저가 배정 시도를 한 경우 - 실패
+"""
+
+
+class ReservationAllocateTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+        # 남은 인원이 10명이 되도록 확정된 예약을 만듭니다.
+        Reservation.objects.create(
+            user=self.admin, schedule=self.schedule, expected_participants=settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 10
+        ).confirm()
+        self.url = reverse("reservations:reservations-allocate")
+        self.client.force_authenticate(user=self.admin)
+
+    def create_reservations(self, *counts, user=None):
+        return [
+            Reservation.objects.create(user=user or self.user, schedule=self.schedule, expected_participants=count)
+            for count in counts
+        ]
+
+    def allocate(self, policy, dry_run=False):
+        return self.client.post(
+            self.url, {"schedule_id": self.schedule.id, "policy": policy, "dry_run": dry_run}, format="json"
+        )
+
+    def test_allocate__success_with_fifo(self):
+        # Given
+        reservations = self.create_reservations(6, 5, 4, 3)
+
+        # When
+        response = self.allocate("fifo")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["reservation_ids"], [reservations[0].id, reservations[2].id])
+        self.assertEqual(response.data["confirmed_participants"], 10)
+        self.assertEqual(
+            set(
+                Reservation.objects.filter(user=self.user, is_confirmed=True, confirmed_at__isnull=False).values_list(
+                    "id", flat=True
+                )
+            ),
+            {reservations[0].id, reservations[2].id},
+        )
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.get_remaining_capacity(), 0)
+        self.assertEqual((self.schedule.pending_participants, self.schedule.pending_reservations), (8, 2))
+
+    def test_allocate__success_with_best_fill(self):
+        # Given
+        reservations = self.create_reservations(6, 5, 3, 4, 11)
+
+        # When
+        fifo_response = self.allocate("fifo", dry_run=True)
+        response = self.allocate("best_fill")
+
+        # Then
+        self.assertEqual(fifo_response.data["unused_capacity"], 1)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["confirmed_participants"], 10)
+        self.assertEqual(response.data["unused_capacity"], 0)
+        self.assertEqual(response.data["reservation_ids"], [reservations[0].id, reservations[3].id])
+
+    def test_allocate__success_with_fair_share(self):
+        # Given
+        self.create_reservations(3, 3, 3, 3)
+        other_reservations = self.create_reservations(4, 4, user=self.other_user)
+
+        # When
+        response = self.allocate("fair_share")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        confirmed = Reservation.objects.filter(id__in=response.data["reservation_ids"])
+        self.assertEqual(sum(r.expected_participants for r in confirmed if r.user_id == self.user.id), 6)
+        self.assertEqual(sum(r.expected_participants for r in confirmed if r.user_id == self.other_user.id), 4)
+        self.assertIn(other_reservations[0].id, response.data["reservation_ids"])
+
+    def test_allocate__success_with_dry_run(self):
+        # Given
+        self.create_reservations(6, 5, 4)
+        self.schedule.refresh_from_db()
+        version = self.schedule.version
+
+        # When
+        response = self.allocate("best_fill", dry_run=True)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["dry_run"])
+        self.assertEqual(response.data["confirmed_participants"], 10)
+        self.assertEqual(response.data["pending_participants"], 15)
+        self.assertEqual(Reservation.objects.filter(is_confirmed=False).count(), 3)
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.version, version)
+
+    def test_allocate__success_with_capacity_shards(self):
+        # Given
+        self.schedule.configure_capacity_shards(4)
+        self.create_reservations(2, 2, 2, 2, 2, 2)
+
+        # When
+        response = self.allocate("fifo")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["confirmed_reservations"], 5)
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.get_confirmed_participants(), settings.EXAM_SCHEDULE_MAX_PARTICIPANTS)
+
+    def test_allocate__success_with_lock_order(self):
+        # Given
+        self.create_reservations(3, 4)
+
+        # When
+        with CaptureQueriesContext(connection) as context:
+            response = self.allocate("fifo")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statements = [query["sql"] for query in context.captured_queries]
+        reservation_index = next(i for i, sql in enumerate(statements) if 'FROM "reservations_reservation"' in sql)
+        schedule_index = next(i for i, sql in enumerate(statements) if 'FROM "schedules_examschedule"' in sql)
+        self.assertLess(reservation_index, schedule_index)
+        self.assertIn("ORDER BY 1 ASC", statements[reservation_index])
+        self.assertFalse(any("FOR UPDATE" in sql and '"schedules_examschedule"' in sql for sql in statements))
+
+    def test_allocate__fail_with_invalid_input(self):
+        # When
+        not_found_response = self.client.post(self.url, {"schedule_id": self.schedule.id + 100}, format="json")
+        policy_response = self.allocate("unknown")
+
+        # Then
+        self.assertEqual(not_found_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("schedule_id", not_found_response.data)
+        self.assertEqual(policy_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("policy", policy_response.data)
+
+    def test_allocate__fail_with_user(self):
+        # Given
+        self.create_reservations(3)
+        self.client.force_authenticate(user=self.user)
+
+        # When
+        response = self.allocate("fifo")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Reservation.objects.filter(user=self.user, is_confirmed=True).exists())
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+from users.authentication import user_cache
+from users.serializers.jwt import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+"""
+예약 비동기 조회 (ASGI)
+- 본인 예약 목록 조회 응답이 동기 뷰셋과 동일 - 성공
+- 일정 필터를 사용한 목록 조회 응답이 동기 뷰셋과 동일 - 성공
+- 관리자의 전체 예약 목록 조회 - 성공
+- 상세 조회 응답과 ETag가 동기 뷰셋과 동일 - 성공
+- 다른 유저의 예약 상세 조회 - 실패
+- 존재하지 않는 페이지 조회 - 실패
+"""
+
+
+class ReservationAsyncViewTests(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedules = [
+            ExamSchedule.objects.create(
+                title=f"Test Exam {index}",
+                start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+                end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+            )
+            for index in range(2)
+        ]
+        self.reservations = [
+            Reservation.objects.create(user=user, schedule=schedule, expected_participants=5)
+            for user in [self.user, self.other_user]
+            for schedule in self.schedules
+        ]
+        self.reservations[0].confirm()
+        self.list_url = reverse("reservations:reservations-list")
+        self.client.force_authenticate(user=self.user)
+
+    def async_get(self, url, data=None, user=None):
+        token = CustomTokenObtainPairSerializer.get_token(user or self.user).access_token
+        return async_to_sync(self.async_client.get)(url, data, headers={"Authorization": f"Bearer {token}"})
+
+    def test_list_reservations__success(self):
+        # Given
+        sync_response = self.client.get(self.list_url)
+
+        # When
+        response = self.async_get(self.list_url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_list_reservations__success_with_schedule_filter(self):
+        # Given
+        params = {"schedule": self.schedules[0].id}
+        sync_response = self.client.get(self.list_url, params)
+
+        # When
+        response = self.async_get(self.list_url, params)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_list_reservations__success_with_admin(self):
+        # When
+        response = self.async_get(self.list_url, {"pagination": "cursor"}, user=self.admin)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["results"]), 4)
+
+    def test_retrieve_reservation__success(self):
+        # Given
+        url = reverse("reservations:reservations-detail", args=[self.reservations[0].id])
+        sync_response = self.client.get(url)
+
+        # When
+        response = self.async_get(url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response["ETag"], sync_response["ETag"])
+
+    def test_retrieve_reservation__fail_with_other_user(self):
+        # Given
+        url = reverse("reservations:reservations-detail", args=[self.reservations[2].id])
+
+        # When
+        response = self.async_get(url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_reservations__fail_with_invalid_page(self):
+        # Given
+        sync_response = self.client.get(self.list_url, {"page": 5})
+
+        # When
+        response = self.async_get(self.list_url, {"page": 5})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), sync_response.json())
@@ -0,0 +1,143 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+
+User = get_user_model()
+
+"""
+예약 일괄 확정
+- 어드민이 ID 목록으로 일괄 확정한 경우 - 성공
+- 어드민이 필터 조건으로 일괄 확정한 경우 - 성공
+- 이미 확정된 예약, 존재하지 않는 예약이 포함된 경우 - 해당 예약만 실패
+- 남은 인원을 초과하는 경우 - 생성 순서대로 들어가는 예약만 확정
+- ID 목록과 필터 조건이 모두 없는 경우 - 실패
+- 유저가 일괄 확정 시도를 한 경우 - 실패
+"""
+
+
+class ReservationBulkConfirmTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+        self.other_schedule = ExamSchedule.objects.create(
+            title="Other Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+        self.reservations = [
+            Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=5),
+            Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=7),
+            Reservation.objects.create(user=self.user, schedule=self.other_schedule, expected_participants=3),
+        ]
+        self.url = reverse("reservations:reservations-bulk-confirm")
+
+    def get_results(self, response):
+        return {item["id"]: item["result"] for item in response.data["results"]}
+
+    def test_bulk_confirm__success_with_ids(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        payload = {"ids": [reservation.id for reservation in self.reservations]}
+
+        # When
+        response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["confirmed_count"], 3)
+        self.assertEqual(Reservation.objects.filter(is_confirmed=True, confirmed_at__isnull=False).count(), 3)
+        self.schedule.refresh_from_db()
+        self.other_schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, 12)
+        self.assertEqual(self.other_schedule.confirmed_participants, 3)
+
+    def test_bulk_confirm__success_with_filter(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+
+        # When
+        response = self.client.post(f"{self.url}?schedule={self.schedule.id}", {}, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.get_results(response),
+            {self.reservations[0].id: "confirmed", self.reservations[1].id: "confirmed"},
+        )
+        self.other_schedule.refresh_from_db()
+        self.assertEqual(self.other_schedule.confirmed_participants, 0)
+
+    def test_bulk_confirm__partial_fail_with_already_confirmed_and_not_found(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        self.reservations[0].confirm()
+        payload = {"ids": [self.reservations[0].id, self.reservations[1].id, 999999]}
+
+        # When
+        response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.get_results(response),
+            {self.reservations[0].id: "already_confirmed", self.reservations[1].id: "confirmed", 999999: "not_found"},
+        )
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, 12)
+
+    def test_bulk_confirm__partial_fail_with_over_capacity(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        self.schedule.confirmed_participants = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 6
+        self.schedule.save(update_fields=["confirmed_participants"])
+        payload = {"ids": [self.reservations[0].id, self.reservations[1].id]}
+
+        # When
+        response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.get_results(response),
+            {self.reservations[0].id: "confirmed", self.reservations[1].id: "over_capacity"},
+        )
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 1)
+        self.reservations[1].refresh_from_db()
+        self.assertFalse(self.reservations[1].is_confirmed)
+
+    def test_bulk_confirm__fail_without_ids_and_filter(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+
+        # When
+        response = self.client.post(self.url, {}, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Reservation.objects.filter(is_confirmed=True).exists())
+
+    def test_bulk_confirm__fail_with_non_admin_user(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        payload = {"ids": [self.reservations[0].id]}
+
+        # When
+        response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Reservation.objects.filter(is_confirmed=True).exists())
@@ -1,7 +1,9 @@
 from datetime import timedelta
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import OperationalError
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -17,6 +19,7 @@ User = get_user_model()
 - 어드민이 예약을 확정한 경우 - 성공
 - 어드민이 예약을 확정한 경우 - 예약 인원을 초과한 경우 - 실패
 - 어드민이 예약을 확정한 경우 - 이미 확정된 예약인 경우 - 실패
+- 어드민이 예약을 확정한 경우 - 교착 상태로 처리하지 못한 경우 503 응답 - 실패
 - 유저가 예약 확정 시도를 한 경우 - 실패
 - 로그인 하지 않은 사용자가 접근 - 실패
 """
@@ -59,7 +62,7 @@ class ReservationDeleteTests(APITestCase):
         self.client.force_authenticate(user=self.admin)
         url = self.get_url(self.reservation.id)
         self.schedule.confirmed_participants = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
-        self.schedule.save()
+        self.schedule.save(update_fields=["confirmed_participants"])
 
         # When
         response = self.client.post(url, format="json")
@@ -71,6 +74,23 @@ class ReservationDeleteTests(APITestCase):
         self.schedule.refresh_from_db()
         self.assertEqual(self.schedule.confirmed_participants, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS)
 
+    def test_confirm_reservation__fail_with_deadlock(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        error = OperationalError("deadlock detected")
+        error.__cause__ = Exception("deadlock detected")
+        error.__cause__.pgcode = "40P01"
+
+        # When
+        with mock.patch.object(Reservation, "confirm", side_effect=error):
+            response = self.client.post(self.get_url(self.reservation.id), format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "1")
+        self.reservation.refresh_from_db()
+        self.assertFalse(self.reservation.is_confirmed)
+
     def test_confirm_reservation__fail_with_already_confirmed(self):
         # Given
         self.client.force_authenticate(user=self.admin)
@@ -2,6 +2,8 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -14,7 +16,10 @@ User = get_user_model()
 """
 예약 생성
 - 정상 예약 - 성공
+- 마감/인원 검사 시 일정의 설명 등 불필요한 컬럼을 조회하지 않음 - 성공
+- 관리자가 시험 시작 시간을 수정한 뒤 캐시된 시작 시간 대신 수정된 시간으로 검사 - 성공
 - 예약 마감 기간을 넘은 경우 - 실패
+- 캐시된 시작 시간으로 마감 기간을 넘은 경우 (DB 조회 없음) - 실패
 - 예약 인원을 초과한 경우 - 실패
 - 로그인 하지 않은 사용자가 접근 - 실패
 """
@@ -62,11 +67,63 @@ class ReservationCreateTests(APITestCase):
         # Then
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_create_reservation__success_with_slim_schedule_lookup(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        payload = {"schedule_id": self.schedule.id, "expected_participants": 10}
+
+        # When
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        validation_queries = []
+        for query in context.captured_queries:
+            if query["sql"].startswith("INSERT"):
+                break
+            if query["sql"].startswith("SELECT"):
+                validation_queries.append(query["sql"])
+        self.assertEqual(len(validation_queries), 1)
+        self.assertNotIn("description", validation_queries[0])
+
+    def test_create_reservation__success_after_start_time_update(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        payload = {"schedule_id": self.schedule.id, "expected_participants": 10}
+        self.schedule.start_time = timezone.now()
+        self.schedule.save()
+        self.assertEqual(self.client.post(self.url, payload, format="json").status_code, status.HTTP_400_BAD_REQUEST)
+
+        # When
+        self.schedule.start_time = timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1)
+        self.schedule.save()
+        response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_reservation__fail_with_cached_start_time_after_deadline(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        payload = {"schedule_id": self.schedule.id, "expected_participants": 10}
+        self.schedule.start_time = timezone.now()
+        self.schedule.save()
+        self.client.post(self.url, payload, format="json")
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.post(self.url, payload, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["non_field_errors"], ["예약 마감 시간이 지났습니다."])
+
     def test_create_reservation__fail_with_over_capacity(self):
         # Given
         self.client.force_authenticate(user=self.user)
         self.schedule.confirmed_participants = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
-        self.schedule.save()
+        self.schedule.save(update_fields=["confirmed_participants"])
         payload = {
             "schedule_id": self.schedule.id,
             "expected_participants": 10,
@@ -2,6 +2,7 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -19,6 +20,10 @@ User = get_user_model()
 - 예약 확정 후 어드민이 삭제한 경우 - 성공 - schedule 의 confirmed_participants 수 감소 확인
 - 다른 유저의 예약을 삭제 시도 하는 경우 - 실패
 - 로그인 하지 않은 사용자가 접근 - 실패
+- 확정 전 예약을 최신 ETag로 삭제 - 성공 -- 확정 대기 인원/예약 수 감소 확인
+- 다른 요청이 변경한 뒤 이전 ETag로 삭제 - 실패 (412)
+- 확정 전 예약 삭제 시 post_delete 시그널 1회 발생 - 성공 -- 확정 대기 인원이 한 번만 감소
+- 다른 요청이 변경한 뒤 이전 버전으로 삭제 - 실패 -- 시그널 미발생
 """
 
 
@@ -72,7 +77,7 @@ class ReservationDeleteTests(APITestCase):
         self.reservation.is_confirmed = True
         self.reservation.save()
         self.schedule.confirmed_participants += self.reservation.expected_participants
-        self.schedule.save()
+        self.schedule.save(update_fields=["confirmed_participants"])
         self.client.force_authenticate(user=self.admin)
         url = self.get_url(self.reservation.id)
 
@@ -107,3 +112,77 @@ class ReservationDeleteTests(APITestCase):
         # Then
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         self.assertTrue(Reservation.objects.filter(id=self.reservation.id).exists())
+
+    def test_delete_reservation__success_with_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        url = self.get_url(self.reservation.id)
+        etag = self.client.get(url)["ETag"]
+
+        # When
+        response = self.client.delete(url, HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Reservation.objects.filter(id=self.reservation.id).exists())
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.pending_participants, 0)
+        self.assertEqual(self.schedule.pending_reservations, 0)
+
+    def test_delete_reservation__fail_with_stale_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        url = self.get_url(self.reservation.id)
+        etag = self.client.get(url)["ETag"]
+        self.client.patch(url, {"expected_participants": 4}, format="json")
+
+        # When
+        response = self.client.delete(url, HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertTrue(Reservation.objects.filter(id=self.reservation.id).exists())
+
+    def test_delete_pending__success_with_post_delete_signal(self):
+        # Given
+        Reservation.objects.create(user=self.other_user, schedule=self.schedule, expected_participants=3)
+        deleted = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted.append(instance.id)
+
+        post_delete.connect(receiver, sender=Reservation)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Reservation)
+
+        # When
+        result = self.reservation.delete_pending()
+
+        # Then
+        self.assertTrue(result)
+        self.assertEqual(deleted, [self.reservation.id])
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.pending_participants, 3)
+        self.assertEqual(self.schedule.pending_reservations, 1)
+
+    def test_delete_pending__fail_with_stale_version(self):
+        # Given
+        stale = Reservation.objects.get(id=self.reservation.id)
+        self.assertTrue(self.reservation.modify_pending_participants(4))
+        deleted = []
+
+        def receiver(sender, instance, **kwargs):
+            deleted.append(instance.id)
+
+        post_delete.connect(receiver, sender=Reservation)
+        self.addCleanup(post_delete.disconnect, receiver, sender=Reservation)
+
+        # When
+        result = stale.delete_pending()
+
+        # Then
+        self.assertFalse(result)
+        self.assertEqual(deleted, [])
+        self.assertTrue(Reservation.objects.filter(id=self.reservation.id).exists())
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.pending_participants, 4)
+        self.assertEqual(self.schedule.pending_reservations, 1)
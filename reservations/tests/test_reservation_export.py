@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+from users.authentication import user_cache
+from users.serializers.jwt import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+"""
+예약 내보내기
+- 관리자의 CSV 내보내기 (사용자 이름, 일정 제목 포함) - 성공
+- 관리자의 NDJSON 내보내기 - 성공
+- 목록 조회와 같은 필터, 검색, 정렬 적용 - 성공
+- 수식으로 해석될 수 있는 CSV 값 이스케이프 - 성공
+- ASGI 요청의 비동기 스트리밍 응답이 동기 응답과 동일 - 성공
+- 일반 사용자의 내보내기 - 실패
+"""
+
+
+class ReservationExportTests(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedules = [
+            ExamSchedule.objects.create(
+                title=title,
+                start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+                end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+            )
+            for title in ["Math Exam", "=English Exam"]
+        ]
+        self.reservations = [
+            Reservation.objects.create(user=self.user, schedule=schedule, expected_participants=count)
+            for schedule in self.schedules
+            for count in [1, 2]
+        ]
+        self.reservations[0].confirm()
+        self.url = reverse("reservations:reservations-export")
+        self.client.force_authenticate(user=self.admin)
+
+    def read_csv(self, response):
+        content = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(io.StringIO(content)))
+
+    def test_export_reservations__success_with_csv(self):
+        # When
+        response = self.client.get(self.url, {"format": "csv"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('.csv"', response["Content-Disposition"])
+        rows = self.read_csv(response)
+        self.assertEqual([int(row["id"]) for row in rows], [r.id for r in reversed(self.reservations)])
+        confirmed = next(row for row in rows if int(row["id"]) == self.reservations[0].id)
+        self.assertEqual(confirmed["username"], "testuser")
+        self.assertEqual(confirmed["schedule_title"], "Math Exam")
+        self.assertEqual(confirmed["is_confirmed"], "true")
+        self.assertNotEqual(confirmed["confirmed_at"], "")
+
+    def test_export_reservations__success_with_ndjson(self):
+        # When
+        response = self.client.get(self.url, {"format": "ndjson"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson; charset=utf-8")
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(
+            set(rows[0]),
+            {
+                "id",
+                "user_id",
+                "username",
+                "schedule_id",
+                "schedule_title",
+                "expected_participants",
+                "is_confirmed",
+                "confirmed_at",
+                "created_at",
+            },
+        )
+        self.assertIsNone(rows[0]["confirmed_at"])
+
+    def test_export_reservations__success_with_filters(self):
+        # When
+        response = self.client.get(
+            self.url, {"format": "csv", "search": "Math", "is_confirmed": "false", "ordering": "expected_participants"}
+        )
+
+        # Then
+        rows = self.read_csv(response)
+        self.assertEqual([int(row["id"]) for row in rows], [self.reservations[1].id])
+
+    def test_export_reservations__success_with_formula_escape(self):
+        # When
+        response = self.client.get(self.url, {"format": "csv", "schedule": self.schedules[1].id})
+
+        # Then
+        rows = self.read_csv(response)
+        self.assertEqual({row["schedule_title"] for row in rows}, {"'=English Exam"})
+
+    def test_export_reservations__success_with_asgi(self):
+        # Given
+        sync_response = self.client.get(self.url, {"format": "ndjson"})
+        token = CustomTokenObtainPairSerializer.get_token(self.admin).access_token
+
+        async def export():
+            response = await self.async_client.get(
+                self.url, {"format": "ndjson"}, headers={"Authorization": f"Bearer {token}"}
+            )
+            return response, b"".join([chunk async for chunk in response.streaming_content])
+
+        # When
+        response, content = async_to_sync(export)()
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.is_async)
+        self.assertEqual(content, b"".join(sync_response.streaming_content))
+
+    def test_export_reservations__fail_with_user(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+
+        # When
+        response = self.client.get(self.url, {"format": "csv"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
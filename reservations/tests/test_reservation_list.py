@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from reservations.serializers import ReservationListProjection, ReservationSerializer
+from schedules.models import ExamSchedule
+
+User = get_user_model()
+
+"""
+예약 목록 조회
+- 기본 페이지네이션 - 성공 (전체 개수 포함)
+- 커서 페이지네이션으로 모든 페이지 순회 (생성일이 같은 예약 포함) - 성공
+- 커서 페이지네이션의 페이지 크기 상한 - 성공
+- 유효하지 않은 커서 - 실패
+- 목록 프로젝션 응답이 ReservationSerializer 응답과 동일 (확정 예약, 스트라이프 일정 포함) - 성공
+"""
+
+
+class ReservationListTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+        self.reservations = [
+            Reservation.objects.create(user=self.admin, schedule=self.schedule, expected_participants=index + 1)
+            for index in range(5)
+        ]
+        # 생성일이 같은 예약이 있어도 id로 순서가 결정되는지 확인
+        Reservation.objects.filter(id__in=[r.id for r in self.reservations[1:4]]).update(
+            created_at=self.reservations[1].created_at
+        )
+        self.url = reverse("reservations:reservations-list")
+        self.client.force_authenticate(user=self.admin)
+
+    def get_expected_ids(self):
+        return list(Reservation.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def test_list_reservations__success_with_page_number(self):
+        # When
+        response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+
+    def test_list_reservations__success_with_cursor(self):
+        # Given
+        url = f"{self.url}?pagination=cursor&page_size=2"
+        ids = []
+
+        # When
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        # Then
+        self.assertEqual(ids, self.get_expected_ids())
+
+    def test_list_reservations__success_with_cursor_page_size_cap(self):
+        # When
+        response = self.client.get(self.url, {"pagination": "cursor", "page_size": 100000})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIsNone(response.data["next"])
+
+    def test_list_reservations__fail_with_invalid_cursor(self):
+        # When
+        response = self.client.get(self.url, {"cursor": "invalid"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_projection__matches_serializer(self):
+        # Given
+        self.reservations[0].confirm()
+        sharded_schedule = ExamSchedule.objects.create(
+            title="Sharded Exam",
+            description="스트라이프 모드 일정",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 2),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 2, hours=2),
+        )
+        sharded_schedule.configure_capacity_shards(4)
+        Reservation.objects.create(user=self.admin, schedule=sharded_schedule, expected_participants=30).confirm()
+        queryset = Reservation.objects.select_related("user", "schedule")
+
+        # When
+        projected = [
+            ReservationListProjection.to_representation(row) for row in ReservationListProjection.values(queryset)
+        ]
+
+        # Then
+        self.assertEqual(projected, ReservationSerializer(queryset, many=True).data)
+        response = self.client.get(self.url, {"page_size": 100, "pagination": "cursor"})
+        self.assertEqual(response.data["results"], ReservationSerializer(queryset, many=True).data)
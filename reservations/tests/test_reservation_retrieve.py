@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule
+
+User = get_user_model()
+
+"""
+예약 상세 조회
+- 본인 예약 조회 시 ETag 응답 - 성공
+- 스트라이프 모드 일정의 예약 조회 시 일정 인원 합계를 추가 집계 쿼리 없이 응답 - 성공
+- 같은 ETag로 재요청 시 304 - 성공
+- 예약 수정 후 같은 ETag로 재요청 시 변경된 예약 응답 - 성공
+- 예약 확정 후 같은 ETag로 재요청 시 변경된 예약 응답 - 성공
+- 다른 유저의 예약을 ETag로 조회 - 실패
+"""
+
+
+class ReservationRetrieveTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+        self.reservation = Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=5)
+        self.url = reverse("reservations:reservations-detail", args=[self.reservation.id])
+
+    def test_retrieve_reservation__success(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+
+        # When
+        response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertEqual(response.data["version"], 1)
+
+    def test_retrieve_reservation__success_with_capacity_shards(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as unstriped:
+            self.client.get(self.url)
+        self.schedule.configure_capacity_shards(4)
+        Reservation.objects.create(user=self.other_user, schedule=self.schedule, expected_participants=7).confirm()
+
+        # When
+        with self.assertNumQueries(len(unstriped)):
+            response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        schedule = response.data["schedule"]
+        self.assertEqual(schedule["confirmed_participants"], 7)
+        self.assertEqual((schedule["pending_participants"], schedule["pending_reservations"]), (5, 1))
+
+    def test_retrieve_reservation__success_with_not_modified(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+
+        # When
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_retrieve_reservation__success_after_update(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+        self.client.patch(self.url, {"expected_participants": 10}, format="json")
+
+        # When
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["expected_participants"], 10)
+        self.assertEqual(response.data["version"], 2)
+
+    def test_retrieve_reservation__success_after_confirm(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+        self.reservation.confirm()
+
+        # When
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["is_confirmed"])
+
+    def test_retrieve_reservation__fail_with_other_user(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+        self.client.force_authenticate(user=self.other_user)
+
+        # When
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
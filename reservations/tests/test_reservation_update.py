@@ -1,7 +1,10 @@
 from datetime import timedelta
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -21,6 +24,13 @@ User = get_user_model()
 - 예약 확정 후 어드민이 수정한 경우 - 예약 인원을 초과한 경우 - 실패
 - 다른 유저의 예약을 수정 시도 하는 경우 - 실패
 - 로그인 하지 않은 사용자가 접근 - 실패
+
+예약 수정 낙관적 동시성 제어 (If-Match)
+- 확정 전 예약을 최신 ETag로 수정 - 성공 -- 행 잠금 없이 처리, 새 ETag 응답 확인
+- 다른 요청이 변경한 뒤 이전 ETag로 수정 - 실패 (412)
+- 조회 이후 다른 요청이 변경하여 조건부 UPDATE 실패, If-Match 없음 - 성공 (잠금 경로로 재처리)
+- 조회 이후 다른 요청이 변경하여 조건부 UPDATE 실패, If-Match 있음 - 실패 (412)
+- 확정 후 어드민이 이전 ETag로 수정 - 실패 (412)
 """
 
 
@@ -58,7 +68,7 @@ class ReservationUpdateTests(APITestCase):
     def test_update_reservation__fail_with_over_capacity(self):
         # Given
         self.schedule.confirmed_participants = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
-        self.schedule.save()
+        self.schedule.save(update_fields=["confirmed_participants"])
         self.client.force_authenticate(user=self.user)
         url = self.get_url(self.reservation.id)
         payload = {"expected_participants": 100}
@@ -90,7 +100,7 @@ class ReservationUpdateTests(APITestCase):
         self.reservation.confirmed_at = timezone.now()
         self.reservation.save()
         self.schedule.confirmed_participants = self.reservation.expected_participants
-        self.schedule.save()
+        self.schedule.save(update_fields=["confirmed_participants"])
         self.client.force_authenticate(user=self.admin)
         url = self.get_url(self.reservation.id)
         payload = {"expected_participants": 3}
@@ -111,7 +121,7 @@ class ReservationUpdateTests(APITestCase):
         self.reservation.confirmed_at = timezone.now()
         self.reservation.save()
         self.schedule.confirmed_participants = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
-        self.schedule.save()
+        self.schedule.save(update_fields=["confirmed_participants"])
         self.client.force_authenticate(user=self.admin)
         url = self.get_url(self.reservation.id)
         payload = {"expected_participants": 100}
@@ -144,3 +154,93 @@ class ReservationUpdateTests(APITestCase):
 
         # Then
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ReservationUpdateIfMatchTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+        self.reservation = Reservation.objects.create(
+            user=self.user, schedule=self.schedule, expected_participants=5, is_confirmed=False
+        )
+        self.url = reverse("reservations:reservations-detail", args=[self.reservation.id])
+
+    def test_update_reservation__success_with_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+
+        # When
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(self.url, {"expected_participants": 3}, format="json", HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 2)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response["ETag"], self.client.get(self.url)["ETag"])
+        self.assertFalse([query for query in context.captured_queries if "FOR UPDATE" in query["sql"]])
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.pending_participants, 3)
+
+    def test_update_reservation__fail_with_stale_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+        self.client.patch(self.url, {"expected_participants": 4}, format="json")
+
+        # When
+        response = self.client.patch(self.url, {"expected_participants": 3}, format="json", HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.expected_participants, 4)
+
+    def test_update_reservation__success_with_conflict_and_without_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+
+        # When
+        with mock.patch.object(Reservation, "modify_pending_participants", return_value=False):
+            response = self.client.patch(self.url, {"expected_participants": 3}, format="json")
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.expected_participants, 3)
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.pending_participants, 3)
+
+    def test_update_reservation__fail_with_conflict_and_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.url)["ETag"]
+
+        # When
+        with mock.patch.object(Reservation, "modify_pending_participants", return_value=False):
+            response = self.client.patch(self.url, {"expected_participants": 3}, format="json", HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.expected_participants, 5)
+
+    def test_update_reservation__fail_with_stale_if_match_after_confirmation_and_admin_user(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        etag = self.client.get(self.url)["ETag"]
+        self.reservation.confirm()
+
+        # When
+        response = self.client.patch(self.url, {"expected_participants": 3}, format="json", HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, 5)
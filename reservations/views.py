@@ -1,18 +1,37 @@
-from django.db import transaction
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Prefetch
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework import serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import SAFE_METHODS, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
-from reservations.models import Reservation
+from core.async_views import AsyncReadView
+from core.etag import check_if_match, conditional_response, make_versioned_etag, parse_if_match
+from core.pagination import KeysetPaginationMixin
+from core.renderers import CSVRenderer, NDJSONRenderer
+from core.timing import TimedPermissionsMixin, timed
+from core.transactions import retry_transaction
+from reservations.allocation import run_allocation
+from reservations.models import ConfirmResult, Reservation
+from reservations.pagination import ReservationCursorPagination
 from reservations.permissions import IsAdminOrOwnerWithEditableCondition
 from reservations.schemas import reservation_schema_view
-from reservations.serializers import ReservationSerializer, ReservationUpdateSerializer
+from reservations.serializers import (
+    ReservationAllocateSerializer,
+    ReservationBulkConfirmSerializer,
+    ReservationExportProjection,
+    ReservationListProjection,
+    ReservationSerializer,
+    ReservationUpdateSerializer,
+)
+from schedules.models import ExamSchedule, confirmed_total_expression, pending_total_expressions
 
 
 @reservation_schema_view
-class ReservationViewSet(viewsets.ModelViewSet):
+class ReservationViewSet(TimedPermissionsMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     """
     예약 뷰셋
     - 예약 생성, 조회, 수정, 삭제, 확정 기능을 제공
@@ -22,8 +41,14 @@ class ReservationViewSet(viewsets.ModelViewSet):
     filterset_fields = ["schedule", "user", "is_confirmed"]
     ordering_fields = ["created_at", "expected_participants"]
     search_fields = ["schedule__title"]
+    keyset_pagination_class = ReservationCursorPagination
+    export_chunk_size = 2000
 
     def get_serializer_class(self):
+        if self.action == "bulk_confirm":
+            return ReservationBulkConfirmSerializer
+        if self.action == "allocate":
+            return ReservationAllocateSerializer
         if self.request.method in ["PUT", "PATCH"]:
             return ReservationUpdateSerializer
         return ReservationSerializer
@@ -31,9 +56,12 @@ class ReservationViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         qs = Reservation.objects
         if self.action in ["list", "retrieve"]:
-            # user와 schedule을 미리 가져오기 위해 select_related 사용
+            # user는 select_related로, schedule은 스트라이프 카운터 합계를 annotate한 queryset으로 미리 가져옴
+            # (중첩 일정 serializer가 예약마다 스트라이프 합계를 집계하지 않도록)
             # 나머지 action에서는 모델 메소드 내부에서 schedule을 가져옴
-            qs = qs.select_related("user", "schedule")
+            qs = qs.select_related("user").prefetch_related(
+                Prefetch("schedule", queryset=ExamSchedule.objects.with_counter_totals())
+            )
 
         user = self.request.user
         if not user.is_staff:
@@ -41,15 +69,76 @@ class ReservationViewSet(viewsets.ModelViewSet):
 
         return qs.all()
 
-    def get_object(self):
+    def list(self, request, *args, **kwargs):
+        # 목록 조회는 serializer 대신 values() 기반 프로젝션으로 응답을 만듭니다.
+        queryset = ReservationListProjection.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            with timed("serializer"):
+                data = [ReservationListProjection.to_representation(row) for row in page]
+            return self.get_paginated_response(data)
+
+        rows = list(queryset)
+        with timed("serializer"):
+            data = [ReservationListProjection.to_representation(row) for row in rows]
+        return Response(data)
+
+    def get_retrieve_etag(self):
+        """
+        예약/일정 버전, 일정의 확정/확정 대기 인원, 사용자 정보로 상세 ETag를 만듭니다. 예약이 없으면 None
+
+        - ETag는 예약 버전으로 시작하므로 수정/삭제 요청의 If-Match 헤더로 사용할 수 있습니다.
+        - 일반 사용자는 queryset이 본인 예약으로 제한되므로 조회 권한 검사와 결과가 같습니다.
+        """
+        try:
+            row = (
+                self.filter_queryset(self.get_queryset())
+                .filter(pk=self.kwargs["pk"])
+                .values_list(
+                    "version",
+                    "id",
+                    "schedule__version",
+                    confirmed_total_expression(prefix="schedule__", schedule_ref="schedule_id"),
+                    *pending_total_expressions(prefix="schedule__", schedule_ref="schedule_id").values(),
+                    "user__username",
+                    "user__email",
+                )
+                .first()
+            )
+        except ValueError:
+            return None
+        if row is None:
+            return None
+        version, *parts = row
+        return make_versioned_etag(version, "reservation", *parts)
+
+    def retrieve(self, request, *args, **kwargs):
+        return conditional_response(
+            request,
+            self.get_retrieve_etag(),
+            lambda: super(ReservationViewSet, self).retrieve(request, *args, **kwargs),
+        )
+
+    def get_object(self, for_update=None):
+        """
+        예약을 조회하고 객체 권한을 검사합니다.
+
+        - for_update가 None이면 update, delete 등 안전하지 않은 요청에서 select_for_update를 사용합니다.
+        - 잠금을 얻은 경우 If-Match 헤더의 버전과 비교하며, 다르면 PreconditionFailed(412) 예외 발생
+        """
         queryset = self.filter_queryset(self.get_queryset())
 
-        if self.request.method not in SAFE_METHODS:
+        if for_update is None:
+            for_update = self.request.method not in SAFE_METHODS
+        if for_update:
             # 데이터 경합 방지를 위해 update, delete 시 select_for_update 사용
             queryset = queryset.select_for_update()
 
         obj = get_object_or_404(queryset, pk=self.kwargs["pk"])
         self.check_object_permissions(self.request, obj)
+        if for_update:
+            check_if_match(parse_if_match(self.request), obj.version)
         return obj
 
     def perform_create(self, serializer):
@@ -69,9 +158,41 @@ class ReservationViewSet(viewsets.ModelViewSet):
 
         super().perform_update(serializer)
 
-    @transaction.atomic
+    def update_pending(self, request, partial=False):
+        """
+        확정되지 않은 예약을 행 잠금 없이 조회하고 버전 조건부 UPDATE로 수정합니다.
+
+        - 확정된 예약이면 None을 반환하여 잠금을 사용하는 기존 경로로 처리합니다.
+        - 조회 이후 다른 요청이 예약을 변경하여 UPDATE가 실패하면, If-Match 헤더가 있으면 PreconditionFailed(412)
+          예외가 발생하고 없으면 None을 반환하여 잠금을 사용하는 경로로 다시 처리합니다.
+        """
+        if_match = parse_if_match(request)
+        reservation = self.get_object(for_update=False)
+        if reservation.is_confirmed:
+            return None
+        check_if_match(if_match, reservation.version)
+
+        serializer = self.get_serializer(reservation, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        new_expected_participants = serializer.validated_data.get(
+            "expected_participants", reservation.expected_participants
+        )
+
+        if reservation.modify_pending_participants(new_expected_participants):
+            return Response(serializer.data)
+        check_if_match(if_match, None)
+        return None
+
+    @retry_transaction("reservations.update")
     def update(self, request, *args, **kwargs):
-        return super().update(request, *args, **kwargs)
+        response = self.update_pending(request, partial=kwargs.get("partial", False))
+        if response is None:
+            response = super().update(request, *args, **kwargs)
+
+        etag = self.get_retrieve_etag()
+        if etag is not None and response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+        return response
 
     def perform_destroy(self, reservation):
         try:
@@ -80,12 +201,31 @@ class ReservationViewSet(viewsets.ModelViewSet):
         except ValueError as e:
             raise serializers.ValidationError({"detail": str(e)}) from e
 
-    @transaction.atomic
+    def destroy_pending(self, request):
+        """
+        확정되지 않은 예약을 행 잠금 없이 조회하고 버전 조건부 DELETE로 취소합니다. 취소되면 True
+
+        - 확정된 예약이거나 조회 이후 다른 요청이 예약을 변경한 경우는 update_pending과 같게 처리합니다.
+        """
+        if_match = parse_if_match(request)
+        reservation = self.get_object(for_update=False)
+        if reservation.is_confirmed:
+            return False
+        check_if_match(if_match, reservation.version)
+
+        if reservation.delete_pending():
+            return True
+        check_if_match(if_match, None)
+        return False
+
+    @retry_transaction("reservations.destroy")
     def destroy(self, request, *args, **kwargs):
+        if self.destroy_pending(request):
+            return Response(status=status.HTTP_204_NO_CONTENT)
         return super().destroy(request, *args, **kwargs)
 
     @action(detail=True, methods=["post"], url_path="confirm", permission_classes=[IsAdminUser])
-    @transaction.atomic
+    @retry_transaction("reservations.confirm")
     def confirm(self, request, pk=None):
         reservation = self.get_object()
 
@@ -96,3 +236,123 @@ class ReservationViewSet(viewsets.ModelViewSet):
 
         serializer = self.get_serializer(reservation)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="bulk-confirm", permission_classes=[IsAdminUser])
+    @retry_transaction("reservations.bulk_confirm")
+    def bulk_confirm(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data.get("ids")
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
+        elif not any(param in request.query_params for param in [*self.filterset_fields, "search"]):
+            # 조건 없이 전체 예약이 확정되는 것을 막기 위해 ID 목록 또는 필터 중 하나는 필수
+            raise serializers.ValidationError({"ids": "확정할 예약 ID 목록 또는 필터 조건이 필요합니다."})
+
+        results = Reservation.bulk_confirm(queryset)
+        if ids is not None:
+            results = {reservation_id: results.get(reservation_id, ConfirmResult.NOT_FOUND) for reservation_id in ids}
+
+        return Response(
+            {
+                "confirmed_count": sum(result == ConfirmResult.CONFIRMED for result in results.values()),
+                "results": [{"id": reservation_id, "result": result} for reservation_id, result in results.items()],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["post"], url_path="allocate", permission_classes=[IsAdminUser])
+    def allocate(self, request):
+        """
+        남은 인원을 초과하는 일정의 확정 대기 예약을 배정 정책에 따라 한 번에 확정합니다.
+
+        - `dry_run`이면 DB를 변경하지 않고 배정 계획만 반환합니다.
+        - 계획과 반영은 확정 대기 예약 행을 잠근 한 트랜잭션에서 실행되며, 교착 상태/잠금 시간 초과 시 재시도합니다.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        try:
+            plan = run_allocation(data["schedule_id"], data["policy"], dry_run=data["dry_run"])
+        except ExamSchedule.DoesNotExist as e:
+            raise serializers.ValidationError({"schedule_id": "존재하지 않는 시험 일정입니다."}) from e
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(plan.to_representation(data["dry_run"]), status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        permission_classes=[IsAdminUser],
+        renderer_classes=[CSVRenderer, NDJSONRenderer],
+    )
+    def export(self, request):
+        """
+        목록 조회와 같은 필터, 검색, 정렬을 적용한 예약 전체를 CSV/NDJSON으로 스트리밍합니다.
+
+        - `?format=csv|ndjson`(또는 Accept 헤더)으로 형식을 선택합니다.
+        - 서버 측 커서로 export_chunk_size 행씩 가져오므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+        - ASGI에서는 비동기 이터레이터로 스트리밍합니다. (동기 이터레이터는 ASGI 핸들러가 전체를 메모리로 읽음)
+        """
+        queryset = ReservationExportProjection.values(self.filter_queryset(self.get_queryset()))
+        renderer = request.accepted_renderer
+        columns = ReservationExportProjection.columns
+
+        if isinstance(request._request, ASGIRequest):
+            content = renderer.astream(self._aiterate_export_rows(queryset), columns)
+        else:
+            rows = queryset.iterator(chunk_size=self.export_chunk_size)
+            content = renderer.stream(map(ReservationExportProjection.to_representation, rows), columns)
+
+        response = StreamingHttpResponse(content, content_type=f"{renderer.media_type}; charset={renderer.charset}")
+        filename = f"reservations-{timezone.now():%Y%m%d%H%M%S}.{renderer.format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    async def _aiterate_export_rows(self, queryset):
+        async for row in queryset.aiterator(chunk_size=self.export_chunk_size):
+            yield ReservationExportProjection.to_representation(row)
+
+
+class ReservationAsyncView(AsyncReadView):
+    """
+    예약 목록/상세 조회 비동기 뷰 (ASGI)
+
+    - ReservationViewSet과 같은 권한, 필터, 페이지네이션, ETag, 응답 형태를 사용합니다.
+    - 일반 사용자는 queryset이 본인 예약으로 제한되므로 상세 조회의 객체 권한 검사와 결과가 같습니다.
+    """
+
+    view_class = ReservationViewSet
+
+    async def list(self, view, request):
+        queryset = await self.filter_queryset(view, view.get_queryset())
+        return await self.paginate(
+            view, ReservationListProjection.values(queryset), ReservationListProjection.to_representation
+        )
+
+    async def retrieve(self, view, request, pk):
+        queryset = await self.filter_queryset(view, view.get_queryset())
+        try:
+            row = await ReservationListProjection.values(queryset.filter(pk=pk)).afirst()
+        except ValueError:
+            row = None
+        if row is None:
+            raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
+        etag = make_versioned_etag(
+            row["version"],
+            "reservation",
+            row["id"],
+            row["schedule__version"],
+            row["schedule_confirmed_total"],
+            row["schedule_pending_total"],
+            row["schedule_pending_reservations_total"],
+            row["user__username"],
+            row["user__email"],
+        )
+        return conditional_response(request, etag, lambda: Response(ReservationListProjection.to_representation(row)))
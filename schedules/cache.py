@@ -0,0 +1,178 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.etag import etag_matches
+
+CACHE_KEY_PREFIX = "exam-schedules"
+GLOBAL_VERSION_KEY = f"{CACHE_KEY_PREFIX}:version"
+
+
+def _schedule_version_key(schedule_id):
+    return f"{CACHE_KEY_PREFIX}:{schedule_id}:version"
+
+
+def _initial_version():
+    # 버전 키만 축출된 경우에도 이전 버전의 캐시가 다시 사용되지 않도록 시간 기반 값으로 시작합니다.
+    return time.time_ns()
+
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def _aget_version(key):
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _initial_version(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+
+
+def _bump_versions(schedule_id):
+    _bump_version(GLOBAL_VERSION_KEY)
+    if schedule_id is not None:
+        _bump_version(_schedule_version_key(schedule_id))
+
+
+def invalidate_schedule_cache(schedule_id=None):
+    """
+    시험 일정 캐시를 무효화합니다.
+
+    - 전체 버전(목록)과 일정별 버전(상세)을 즉시 올리고, 트랜잭션 커밋 후 한 번 더 올립니다.
+    - 커밋 전에 다른 요청이 이전 데이터를 새 버전으로 캐시하더라도 커밋 후 버전 증가로 버려집니다.
+    """
+    _bump_versions(schedule_id)
+    transaction.on_commit(lambda: _bump_versions(schedule_id))
+
+
+def _start_time_key(schedule_id):
+    return f"{CACHE_KEY_PREFIX}:{schedule_id}:start-time"
+
+
+def get_cached_start_time(schedule_id):
+    """
+    캐시된 시험 시작 시간을 반환합니다. 없으면 None
+
+    - 시작 시간은 관리자가 일정을 수정할 때만 바뀌므로 확정 인원 변경과 관계없이 캐시를 유지합니다.
+    """
+    if not settings.EXAM_SCHEDULE_START_TIME_CACHE_TIMEOUT:
+        return None
+    return cache.get(_start_time_key(schedule_id))
+
+
+def set_cached_start_time(schedule_id, start_time):
+    timeout = settings.EXAM_SCHEDULE_START_TIME_CACHE_TIMEOUT
+    if timeout:
+        cache.set(_start_time_key(schedule_id), start_time, timeout=timeout)
+
+
+def invalidate_start_time_cache(schedule_id):
+    """
+    캐시된 시험 시작 시간을 지웁니다. (일정 저장/삭제 시)
+
+    - 커밋 전에 다른 요청이 이전 시작 시간을 다시 캐시할 수 있으므로 커밋 후 한 번 더 지웁니다.
+    """
+    cache.delete(_start_time_key(schedule_id))
+    transaction.on_commit(lambda: cache.delete(_start_time_key(schedule_id)))
+
+
+def _request_fingerprint(request):
+    # 페이지네이션 링크에 host가 포함되므로 host와 정렬된 쿼리 파라미터를 함께 사용합니다.
+    params = sorted((key, value) for key in request.query_params for value in request.query_params.getlist(key))
+    return hashlib.md5(f"{request.get_host()}?{params}".encode()).hexdigest()
+
+
+def _list_cache_key(request, version):
+    return f"{CACHE_KEY_PREFIX}:list:{version}:{_request_fingerprint(request)}"
+
+
+def _detail_cache_key(request, schedule_id, version):
+    return f"{CACHE_KEY_PREFIX}:detail:{schedule_id}:{version}:{_request_fingerprint(request)}"
+
+
+def get_schedule_list_cache_key(request):
+    return _list_cache_key(request, _get_version(GLOBAL_VERSION_KEY))
+
+
+def get_schedule_detail_cache_key(request, schedule_id):
+    return _detail_cache_key(request, schedule_id, _get_version(_schedule_version_key(schedule_id)))
+
+
+async def aget_schedule_list_cache_key(request):
+    return _list_cache_key(request, await _aget_version(GLOBAL_VERSION_KEY))
+
+
+async def aget_schedule_detail_cache_key(request, schedule_id):
+    return _detail_cache_key(request, schedule_id, await _aget_version(_schedule_version_key(schedule_id)))
+
+
+def get_cached_response_data(request, cache_key, build_response):
+    """
+    캐시된 응답 데이터로 Response를 만들거나, 응답을 새로 만들어 200인 경우에만 캐시합니다.
+
+    - 응답의 ETag도 함께 캐시하며, 캐시된 ETag가 If-None-Match와 일치하면 304를 반환합니다.
+    - EXAM_SCHEDULE_CACHE_TIMEOUT이 0이면 캐시를 사용하지 않습니다.
+    """
+    timeout = settings.EXAM_SCHEDULE_CACHE_TIMEOUT
+    if not timeout:
+        return build_response()
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return _build_cached_response(request, *cached)
+
+    response = build_response()
+    _set_cached_response(cache_key, response, timeout)
+    return response
+
+
+async def aget_cached_response_data(request, cache_key, abuild_response):
+    """
+    비동기 뷰에서 사용하는 get_cached_response_data (abuild_response는 코루틴 함수)
+
+    - 이벤트 루프를 막지 않도록 캐시도 비동기 API(aget/aset)로 조회/저장합니다.
+    """
+    timeout = settings.EXAM_SCHEDULE_CACHE_TIMEOUT
+    if not timeout:
+        return await abuild_response()
+
+    cached = await cache.aget(cache_key)
+    if cached is not None:
+        return _build_cached_response(request, *cached)
+
+    response = await abuild_response()
+    if response.status_code == status.HTTP_200_OK:
+        await cache.aset(cache_key, _cached_response_value(response), timeout=timeout)
+    return response
+
+
+def _build_cached_response(request, data, etag):
+    if etag and etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(data, headers={"ETag": etag} if etag else None)
+
+
+def _cached_response_value(response):
+    return response.data, response.get("ETag")
+
+
+def _set_cached_response(cache_key, response, timeout):
+    if response.status_code == status.HTTP_200_OK:
+        cache.set(cache_key, _cached_response_value(response), timeout=timeout)
@@ -0,0 +1,29 @@
+from django.core.management import BaseCommand, CommandError
+
+from schedules.models import ExamSchedule
+
+
+class Command(BaseCommand):
+    help = "Enable, resize or disable striped capacity counters for an exam schedule"
+
+    def add_arguments(self, parser):
+        parser.add_argument("schedule_id", type=int)
+        parser.add_argument("--shards", type=int, required=True, help="Number of stripes (0 disables striping)")
+
+    def handle(self, *args, **options):
+        if not 0 <= options["shards"] <= 256:
+            raise CommandError("--shards must be between 0 and 256.")
+
+        try:
+            schedule = ExamSchedule.objects.get(id=options["schedule_id"])
+        except ExamSchedule.DoesNotExist as e:
+            raise CommandError(f"Schedule {options['schedule_id']} does not exist.") from e
+
+        schedule.configure_capacity_shards(options["shards"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Schedule {schedule.id} now uses {schedule.capacity_shard_count} capacity shard(s) "
+                f"({schedule.get_confirmed_participants()} confirmed participants)."
+            )
+        )
@@ -0,0 +1,94 @@
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import F, Q
+
+from schedules.cache import invalidate_schedule_cache
+from schedules.models import ExamSchedule, ScheduleCapacityShard
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the confirmed/pending counters of exam schedules with the reservations table "
+        "and optionally repair the pending counters"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("schedule_ids", nargs="*", type=int, help="Schedules to check (default: all)")
+        parser.add_argument("--fix", action="store_true", help="Recompute mismatched pending counters")
+
+    def handle(self, *args, **options):
+        queryset = ExamSchedule.objects.all()
+        if options["schedule_ids"]:
+            queryset = queryset.filter(id__in=options["schedule_ids"])
+
+        rows = list(
+            queryset.with_counter_totals()
+            .with_reservation_totals()
+            .filter(
+                ~Q(confirmed_total=F("reserved_confirmed_participants"))
+                | ~Q(pending_total=F("reserved_pending_participants"))
+                | ~Q(pending_reservations_total=F("reserved_pending_reservations"))
+            )
+            .order_by("id")
+            .values(
+                "id",
+                "confirmed_total",
+                "reserved_confirmed_participants",
+                "pending_total",
+                "reserved_pending_participants",
+                "pending_reservations_total",
+                "reserved_pending_reservations",
+            )
+        )
+        if not rows:
+            self.stdout.write(self.style.SUCCESS("All schedule counters match the reservations."))
+            return
+
+        confirmed_mismatches = []
+        for row in rows:
+            self.stdout.write(
+                f"Schedule {row['id']}: "
+                f"confirmed {row['confirmed_total']} (reservations {row['reserved_confirmed_participants']}), "
+                f"pending {row['pending_total']} (reservations {row['reserved_pending_participants']}), "
+                f"pending reservations {row['pending_reservations_total']} "
+                f"(reservations {row['reserved_pending_reservations']})"
+            )
+            if row["confirmed_total"] != row["reserved_confirmed_participants"]:
+                confirmed_mismatches.append(row["id"])
+
+        if options["fix"]:
+            fixed = self._fix_pending_counters([row["id"] for row in rows])
+            self.stdout.write(self.style.SUCCESS(f"Pending counters of {fixed} schedule(s) recomputed."))
+        if confirmed_mismatches:
+            # 확정 인원은 최대 인원 검사와 스트라이프 배정에 사용되므로 자동 보정하지 않습니다.
+            raise CommandError(
+                f"Confirmed participants do not match the reservations for schedules {confirmed_mismatches}."
+            )
+        if not options["fix"]:
+            raise CommandError(f"{len(rows)} schedule(s) have mismatched pending counters. Run with --fix.")
+
+    @staticmethod
+    @transaction.atomic
+    def _fix_pending_counters(schedule_ids):
+        """
+        일정 행과 스트라이프를 잠근 뒤 예약 테이블 기준으로 확정 대기 인원/예약 수를 다시 계산합니다.
+
+        - 잠금 이후의 예약 생성/변경/확정/취소는 일정 카운터를 갱신하기 전에 대기하므로 재계산 결과를 덮어쓰지 않습니다.
+        - 재계산한 값은 일정의 기준값에 저장하고 스트라이프의 확정 대기 증감은 0으로 되돌립니다.
+        """
+        list(ExamSchedule.objects.select_for_update().filter(id__in=schedule_ids).values_list("id"))
+        shards = ScheduleCapacityShard.objects.select_for_update().filter(schedule_id__in=schedule_ids)
+        list(shards.values_list("id"))
+        shards.update(pending_participants=0, pending_reservations=0)
+        totals = (
+            ExamSchedule.objects.filter(id__in=schedule_ids)
+            .with_reservation_totals()
+            .values_list("id", "reserved_pending_participants", "reserved_pending_reservations")
+        )
+        for schedule_id, pending_participants, pending_reservations in totals:
+            ExamSchedule.objects.filter(id=schedule_id).update(
+                pending_participants=pending_participants,
+                pending_reservations=pending_reservations,
+            )
+            invalidate_schedule_cache(schedule_id)
+        return len(totals)
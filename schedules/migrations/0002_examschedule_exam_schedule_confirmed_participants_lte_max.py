@@ -0,0 +1,20 @@
+# Generated by Django 5.2 on 2026-10-18 18:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedules", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="examschedule",
+            # 생성 시점의 EXAM_SCHEDULE_MAX_PARTICIPANTS 값 (설정 변경 시 새 마이그레이션으로 제약 조건을 교체)
+            constraint=models.CheckConstraint(
+                condition=models.Q(("confirmed_participants__lte", 50000)),
+                name="exam_schedule_confirmed_participants_lte_max",
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-18 18:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedules", "0002_examschedule_exam_schedule_confirmed_participants_lte_max"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examschedule",
+            name="capacity_shard_count",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="ScheduleCapacityShard",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("index", models.PositiveSmallIntegerField()),
+                ("capacity", models.PositiveIntegerField(default=0)),
+                ("confirmed_participants", models.PositiveIntegerField(default=0)),
+                (
+                    "schedule",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="capacity_shards",
+                        to="schedules.examschedule",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("schedule", "index"), name="schedule_capacity_shard_unique_index"),
+                    models.CheckConstraint(
+                        condition=models.Q(("confirmed_participants__lte", models.F("capacity"))),
+                        name="schedule_capacity_shard_confirmed_participants_lte_capacity",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-18 19:31
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_pending_participants(apps, schema_editor):
+    """
+    기존 확정 대기 예약으로 확정 대기 인원/예약 수를 채웁니다.
+    """
+    ExamSchedule = apps.get_model("schedules", "ExamSchedule")
+    Reservation = apps.get_model("reservations", "Reservation")
+
+    pending = Reservation.objects.filter(schedule=OuterRef("pk"), is_confirmed=False).values("schedule")
+    ExamSchedule.objects.update(
+        pending_participants=Coalesce(
+            Subquery(pending.annotate(total=Sum("expected_participants")).values("total")), 0
+        ),
+        pending_reservations=Coalesce(Subquery(pending.annotate(total=Count("id")).values("total")), 0),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedules", "0004_examschedule_version"),
+        ("reservations", "0002_reservation_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="examschedule",
+            name="pending_participants",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="examschedule",
+            name="pending_reservations",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_pending_participants, migrations.RunPython.noop),
+    ]
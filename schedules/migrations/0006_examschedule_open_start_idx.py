@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-18 19:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedules", "0005_examschedule_pending_participants"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="examschedule",
+            # 생성 시점의 EXAM_SCHEDULE_MAX_PARTICIPANTS 값 (설정 변경 시 새 마이그레이션으로 인덱스를 교체)
+            index=models.Index(
+                condition=models.Q(("confirmed_participants__lt", 50000)),
+                fields=["start_time", "id"],
+                name="exam_schedule_open_start_idx",
+            ),
+        ),
+    ]
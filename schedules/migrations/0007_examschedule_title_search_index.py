@@ -0,0 +1,70 @@
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    # 일정 테이블을 외부 콘텐츠로 사용하는 FTS5 테이블과, 제목 변경을 반영하는 트리거
+    """
+    CREATE VIRTUAL TABLE schedules_examschedule_title_fts USING fts5(
+        title, content='schedules_examschedule', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER schedules_examschedule_title_fts_insert AFTER INSERT ON schedules_examschedule BEGIN
+        INSERT INTO schedules_examschedule_title_fts (rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    """
+    CREATE TRIGGER schedules_examschedule_title_fts_delete AFTER DELETE ON schedules_examschedule BEGIN
+        INSERT INTO schedules_examschedule_title_fts (schedules_examschedule_title_fts, rowid, title)
+        VALUES ('delete', old.id, old.title);
+    END
+    """,
+    """
+    CREATE TRIGGER schedules_examschedule_title_fts_update AFTER UPDATE OF title ON schedules_examschedule BEGIN
+        INSERT INTO schedules_examschedule_title_fts (schedules_examschedule_title_fts, rowid, title)
+        VALUES ('delete', old.id, old.title);
+        INSERT INTO schedules_examschedule_title_fts (rowid, title) VALUES (new.id, new.title);
+    END
+    """,
+    "INSERT INTO schedules_examschedule_title_fts (schedules_examschedule_title_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS schedules_examschedule_title_fts_insert",
+    "DROP TRIGGER IF EXISTS schedules_examschedule_title_fts_delete",
+    "DROP TRIGGER IF EXISTS schedules_examschedule_title_fts_update",
+    "DROP TABLE IF EXISTS schedules_examschedule_title_fts",
+]
+
+POSTGRESQL_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # icontains가 만드는 UPPER("title"::text) LIKE UPPER(%s) 조건과 같은 식의 트라이그램 인덱스
+    """
+    CREATE INDEX IF NOT EXISTS schedules_examschedule_title_trgm
+    ON schedules_examschedule USING gin (UPPER("title"::text) gin_trgm_ops)
+    """,
+]
+
+POSTGRESQL_BACKWARD = [
+    "DROP INDEX IF EXISTS schedules_examschedule_title_trgm",
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedules", "0006_examschedule_open_start_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRESQL_FORWARD}),
+            run_for_vendor({"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRESQL_BACKWARD}),
+        ),
+    ]
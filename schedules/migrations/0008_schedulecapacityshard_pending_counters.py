@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-18 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedules", "0007_examschedule_title_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="schedulecapacityshard",
+            name="pending_participants",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="schedulecapacityshard",
+            name="pending_reservations",
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -1,7 +1,137 @@
 from datetime import timedelta
 
+from django.apps import apps
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.metrics import record_capacity_rejection
+from schedules.cache import invalidate_schedule_cache, invalidate_start_time_cache
+
+
+def counter_total_expression(field, prefix="", schedule_ref="pk"):
+    """
+    일정의 카운터 `field`에 스트라이프 카운터까지 합산한 표현식을 반환합니다.
+
+    - 스트라이프 모드가 아닌 일정은 서브쿼리 없이 일정의 `field`를 그대로 사용합니다.
+    - 다른 모델에서 일정을 참조할 때는 `prefix`(예: "schedule__")와 `schedule_ref`(예: "schedule_id")를 지정합니다.
+    """
+    shard_total = (
+        ScheduleCapacityShard.objects.filter(schedule=OuterRef(schedule_ref))
+        .values("schedule")
+        .annotate(total=Sum(field))
+        .values("total")
+    )
+    return Case(
+        When(**{f"{prefix}capacity_shard_count": 0}, then=F(f"{prefix}{field}")),
+        default=F(f"{prefix}{field}") + Coalesce(Subquery(shard_total), 0),
+    )
+
+
+def confirmed_total_expression(prefix="", schedule_ref="pk"):
+    """
+    스트라이프 카운터까지 합산한 확정 인원 표현식을 반환합니다.
+    """
+    return counter_total_expression("confirmed_participants", prefix, schedule_ref)
+
+
+def pending_total_expressions(prefix="", schedule_ref="pk"):
+    """
+    스트라이프 카운터까지 합산한 확정 대기 인원/예약 수 표현식 (`pending_total`, `pending_reservations_total`)
+    """
+    return {
+        "pending_total": counter_total_expression("pending_participants", prefix, schedule_ref),
+        "pending_reservations_total": counter_total_expression("pending_reservations", prefix, schedule_ref),
+    }
+
+
+def pending_changes(participants_delta, reservations_delta):
+    """
+    확정 대기 인원/예약 수 증감을 UPDATE 인자(F 표현식)로 반환합니다. 증감이 없는 필드는 제외
+    """
+    changes = {}
+    if participants_delta:
+        changes["pending_participants"] = F("pending_participants") + participants_delta
+    if reservations_delta:
+        changes["pending_reservations"] = F("pending_reservations") + reservations_delta
+    return changes
+
+
+class ExamScheduleQuerySet(models.QuerySet):
+    def with_confirmed_total(self):
+        """
+        스트라이프 카운터까지 합산한 확정 인원을 `confirmed_total`로 annotate 합니다.
+        """
+        return self.annotate(confirmed_total=confirmed_total_expression())
+
+    def with_pending_totals(self):
+        """
+        스트라이프 카운터까지 합산한 확정 대기 인원/예약 수를 `pending_total`, `pending_reservations_total`로
+        annotate 합니다.
+        """
+        return self.annotate(**pending_total_expressions())
+
+    def with_counter_totals(self):
+        """
+        확정 인원과 확정 대기 인원/예약 수 합계를 함께 annotate 합니다. (이미 annotate 된 값은 다시 추가하지 않음)
+        """
+        queryset = self if "confirmed_total" in self.query.annotations else self.with_confirmed_total()
+        return queryset if "pending_total" in self.query.annotations else queryset.with_pending_totals()
+
+    def open_for_reservation(self, min_capacity=1, now=None):
+        """
+        예약 마감 전이고 남은 인원이 `min_capacity`명 이상인 일정만 조회합니다.
+
+        - 마감 조건은 `start_time >= 현재 + 마감 일 수` 범위 조건으로 바꿔 시작 시간 인덱스를 사용합니다.
+        - `confirmed_participants < 최대 인원`은 부분 인덱스(exam_schedule_open_start_idx)의 조건과 같으며,
+          스트라이프 모드 일정도 기준값이 최대 인원이면 남은 인원이 없으므로 항상 성립해야 하는 조건입니다.
+        - 스트라이프 모드 일정만 스트라이프 합계를 포함한 확정 인원으로 남은 인원을 검사합니다.
+        """
+        maximum = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
+        queryset = self if "confirmed_total" in self.query.annotations else self.with_confirmed_total()
+        earliest_start_time = (now or timezone.now()) + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS)
+        return queryset.filter(
+            Q(capacity_shard_count=0, confirmed_participants__lte=maximum - min_capacity)
+            | Q(capacity_shard_count__gt=0, confirmed_total__lte=maximum - min_capacity),
+            start_time__gte=earliest_start_time,
+            confirmed_participants__lt=maximum,
+        )
+
+    def with_reservation_stats(self):
+        """
+        예약 테이블을 LEFT JOIN 하여 일정별 예약 통계를 GROUP BY 한 번으로 annotate 합니다.
+
+        - `stats_reservations`, `stats_confirmed_reservations`: 전체/확정 예약 수
+        - `stats_confirmed_participants`, `stats_pending_participants`: 확정/확정 대기 예약의 예상 인원 합계
+        - 예약이 없는 일정도 0으로 포함됩니다.
+        """
+        confirmed = Q(reservations__is_confirmed=True)
+        return self.annotate(
+            stats_reservations=Count("reservations"),
+            stats_confirmed_reservations=Count("reservations", filter=confirmed),
+            stats_confirmed_participants=Coalesce(Sum("reservations__expected_participants", filter=confirmed), 0),
+            stats_pending_participants=Coalesce(Sum("reservations__expected_participants", filter=~confirmed), 0),
+        )
+
+    def with_reservation_totals(self):
+        """
+        예약 테이블에서 직접 집계한 값을 annotate 합니다. (확정/확정 대기 카운터 검증용)
+
+        - `reserved_confirmed_participants`: 확정된 예약의 예상 인원 합계
+        - `reserved_pending_participants`, `reserved_pending_reservations`: 확정 대기 예약의 예상 인원 합계, 예약 수
+        """
+        reservations = apps.get_model("reservations", "Reservation").objects.filter(schedule=OuterRef("pk"))
+
+        def total(queryset, aggregate):
+            return Coalesce(Subquery(queryset.values("schedule").annotate(total=aggregate).values("total")), 0)
+
+        return self.annotate(
+            reserved_confirmed_participants=total(reservations.filter(is_confirmed=True), Sum("expected_participants")),
+            reserved_pending_participants=total(reservations.filter(is_confirmed=False), Sum("expected_participants")),
+            reserved_pending_reservations=total(reservations.filter(is_confirmed=False), Count("id")),
+        )
 
 
 class ExamSchedule(models.Model):
@@ -9,26 +139,143 @@ class ExamSchedule(models.Model):
     description = models.TextField(blank=True)
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
-    confirmed_participants = models.PositiveIntegerField(default=0)  # 확정된 응시 인원 수
+    confirmed_participants = models.PositiveIntegerField(default=0)  # 확정된 응시 인원 수 (스트라이프 모드는 기준값)
+    capacity_shard_count = models.PositiveSmallIntegerField(default=0)  # 확정 인원 스트라이프 수 (0이면 사용 안 함)
+    # 확정 대기 예약의 예상 응시 인원 합계, 예약 수 (스트라이프 모드에서는 기준값)
+    pending_participants = models.PositiveIntegerField(default=0)
+    pending_reservations = models.PositiveIntegerField(default=0)
+    version = models.PositiveIntegerField(default=1)  # 행이 변경될 때마다 증가 (ETag 등에 사용)
+
+    objects = ExamScheduleQuerySet.as_manager()
+
+    pending_counter_fields = ["pending_participants", "pending_reservations"]
+    # 전용 조건부 UPDATE(change_*_participants, configure_capacity_shards)로만 변경되는 카운터 필드
+    counter_fields = ["confirmed_participants", "capacity_shard_count", *pending_counter_fields]
+
+    # core.search.IndexedSearchFilter가 DB별 검색 인덱스로 검색하는 필드 (마이그레이션 0007에서 인덱스 생성)
+    indexed_search_fields = ["title"]
 
     class Meta:
         ordering = ["start_time"]
         indexes = [
             models.Index(fields=["start_time", "end_time"]),
+            # 예약 가능 일정 조회(open_for_reservation)용: 최대 인원이 찬 일정을 제외한 시작 시간 순 키셋 인덱스
+            # (최대 인원은 마이그레이션에 값으로 기록되므로 EXAM_SCHEDULE_MAX_PARTICIPANTS 변경 시 makemigrations 필요)
+            models.Index(
+                fields=["start_time", "id"],
+                condition=Q(confirmed_participants__lt=settings.EXAM_SCHEDULE_MAX_PARTICIPANTS),
+                name="exam_schedule_open_start_idx",
+            ),
+        ]
+        # 최대 인원은 마이그레이션에 값으로 기록되므로 EXAM_SCHEDULE_MAX_PARTICIPANTS 변경 시 makemigrations 필요
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(confirmed_participants__lte=settings.EXAM_SCHEDULE_MAX_PARTICIPANTS),
+                name="exam_schedule_confirmed_participants_lte_max",
+            ),
         ]
 
-    def add_confirmed_participant(self, participant_count):
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            self.version += 1
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = [*kwargs["update_fields"], "version"]
+            else:
+                # 카운터는 조건부 UPDATE로만 변경되므로 전체 저장 시 읽어 둔 값으로 덮어쓰지 않습니다.
+                # (덮어쓰면 그 사이 늘어난 확정 인원이 사라져 최대 인원을 초과해 확정될 수 있음)
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name not in self.counter_fields
+                ]
+
+        super().save(*args, **kwargs)
+        invalidate_schedule_cache(self.id)
+        invalidate_start_time_cache(self.id)
+
+    def delete(self, *args, **kwargs):
+        schedule_id = self.id
+        result = super().delete(*args, **kwargs)
+        invalidate_schedule_cache(schedule_id)
+        invalidate_start_time_cache(schedule_id)
+        return result
+
+    @classmethod
+    def change_confirmed_participants(cls, schedule_id, delta, pending=0, pending_reservations=0):
         """
-        확정된 응시 인원을 추가합니다.
+        확정된 응시 인원을 조건부 UPDATE 한 번으로 증감합니다.
 
-        - 최대 인원(EXAM_SCHEDULE_MAX_PARTICIPANTS)을 초과하면 예외 발생
+        - 일정 행을 미리 잠그지 않고 `WHERE` 조건으로 최대 인원/0 미만 여부를 검사합니다.
+        - 스트라이프 모드인 일정은 일정 행 대신 스트라이프 하나만 갱신합니다.
+        - 확정 대기 인원/예약 수 증감(`pending`, `pending_reservations`)도 같은 UPDATE로 함께 반영합니다.
+        - 갱신된 행이 없으면(조건 불충족) 예외 발생
         """
-        if self.confirmed_participants + participant_count > settings.EXAM_SCHEDULE_MAX_PARTICIPANTS:
+        if delta == 0:
+            cls.change_pending_participants(schedule_id, pending, pending_reservations)
+            return
+
+        queryset = cls.objects.filter(id=schedule_id, capacity_shard_count=0)
+        if delta > 0:
+            queryset = queryset.filter(confirmed_participants__lte=settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - delta)
+        else:
+            queryset = queryset.filter(confirmed_participants__gte=-delta)
+
+        if queryset.update(
+            confirmed_participants=F("confirmed_participants") + delta,
+            **pending_changes(pending, pending_reservations),
+            version=F("version") + 1,
+        ):
+            invalidate_schedule_cache(schedule_id)
+            return
+
+        if ScheduleCapacityShard.change_confirmed_participants(schedule_id, delta, pending, pending_reservations):
+            invalidate_schedule_cache(schedule_id)
+            return
+
+        if delta > 0:
+            record_capacity_rejection()
             raise ValueError("최대 참가자 수를 초과하였습니다.")
+        raise ValueError("확정된 참가자 수보다 더 많은 참가자를 취소할 수 없습니다.")
+
+    @classmethod
+    def change_pending_participants(cls, schedule_id, participants_delta, reservations_delta):
+        """
+        확정 대기 인원과 예약 수를 UPDATE 한 번으로 증감합니다.
+
+        - 예약 생성/인원 변경/삭제와 같은 트랜잭션에서 호출되어 예약 테이블과 함께 반영됩니다.
+        - 스트라이프 모드인 일정은 일정 행 대신 임의의 스트라이프 하나만 갱신합니다.
+        - 남은 인원이 바뀌지 않으므로 일정 버전은 올리지 않습니다. (조회 ETag는 확정 대기 합계를 포함)
+        - 응답에 확정 대기 인원이 포함되므로 조회 캐시는 무효화합니다.
+        - 집계 오차를 0으로 잘라 숨기지 않으며, 일정 행의 값이 0 미만이 되면 CHECK 제약 조건 위반으로 실패합니다.
+          (오차는 reconcile_schedule_counters 명령어로 확인/보정)
+        """
+        changes = pending_changes(participants_delta, reservations_delta)
+        if not changes:
+            return
 
-        self.confirmed_participants += participant_count
+        invalidate_schedule_cache(schedule_id)
+        if cls.objects.filter(id=schedule_id, capacity_shard_count=0).update(**changes):
+            return
+        if ScheduleCapacityShard.change_pending_participants(schedule_id, changes):
+            return
 
-        self.save(update_fields=["confirmed_participants"])
+        # 스트라이프 수 변경과 겹친 경우: 변경이 끝날 때까지 일정 행을 잠근 뒤 다시 반영합니다. (일정이 없으면 무시)
+        schedule = cls.objects.select_for_update().filter(id=schedule_id).values("capacity_shard_count").first()
+        if schedule is None:
+            return
+        if not schedule["capacity_shard_count"] or not ScheduleCapacityShard.change_pending_participants(
+            schedule_id, changes
+        ):
+            cls.objects.filter(id=schedule_id).update(**changes)
+
+    def add_confirmed_participant(self, participant_count):
+        """
+        확정된 응시 인원을 추가합니다.
+
+        - 최대 인원(EXAM_SCHEDULE_MAX_PARTICIPANTS)을 초과하면 예외 발생
+        """
+        self.change_confirmed_participants(self.id, participant_count)
+        self.refresh_from_db(fields=["confirmed_participants", "capacity_shard_count", "version"])
 
     def remove_confirmed_participant(self, participant_count):
         """
@@ -36,20 +283,115 @@ class ExamSchedule(models.Model):
 
         - 현재 확정된 인원보다 많이 제거하려 하면 예외 발생
         """
-        if participant_count > self.confirmed_participants:
-            raise ValueError("확정된 참가자 수보다 더 많은 참가자를 취소할 수 없습니다.")
+        self.change_confirmed_participants(self.id, -participant_count)
+        self.refresh_from_db(fields=["confirmed_participants", "capacity_shard_count", "version"])
+
+    @transaction.atomic
+    def configure_capacity_shards(self, shard_count):
+        """
+        확정 인원 스트라이프 수를 변경합니다.
+
+        - 기존 스트라이프의 확정 인원은 일정의 기준값으로 합친 뒤 삭제합니다.
+        - 새 스트라이프들은 남은 인원을 나누어 배정받습니다. (0이면 스트라이프 모드 해제)
+        """
+        schedule = ExamSchedule.objects.select_for_update().get(id=self.id)
+        shards = ScheduleCapacityShard.objects.select_for_update().filter(schedule_id=self.id)
+
+        shard_totals = shards.aggregate(
+            **{field: Coalesce(Sum(field), 0) for field in ScheduleCapacityShard.counter_fields}
+        )
+        for field, total in shard_totals.items():
+            setattr(schedule, field, getattr(schedule, field) + total)
+        shards.delete()
 
-        self.confirmed_participants -= participant_count
+        remaining = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - schedule.confirmed_participants
+        ScheduleCapacityShard.objects.bulk_create(
+            ScheduleCapacityShard(
+                schedule_id=self.id,
+                index=index,
+                capacity=remaining // shard_count + (1 if index < remaining % shard_count else 0),
+            )
+            for index in range(shard_count)
+        )
 
-        self.save(update_fields=["confirmed_participants"])
+        schedule.capacity_shard_count = shard_count
+        schedule.save(update_fields=[*ScheduleCapacityShard.counter_fields, "capacity_shard_count"])
+        self.refresh_from_db(fields=[*ScheduleCapacityShard.counter_fields, "capacity_shard_count", "version"])
+
+    def get_confirmed_participants(self):
+        """
+        확정된 응시 인원 수를 반환합니다.
+
+        - 스트라이프 모드인 경우 기준값과 모든 스트라이프의 합계
+        """
+        if not self.capacity_shard_count:
+            return self.confirmed_participants
+
+        if hasattr(self, "confirmed_total"):
+            return self.confirmed_total
+
+        shard_total = self.capacity_shards.aggregate(total=Coalesce(Sum("confirmed_participants"), 0))["total"]
+        return self.confirmed_participants + shard_total
+
+    def get_pending_counts(self):
+        """
+        (확정 대기 인원, 확정 대기 예약 수)를 반환합니다.
+
+        - 스트라이프 모드인 경우 기준값과 모든 스트라이프의 합계 (`with_pending_totals` 값이 있으면 사용)
+        """
+        if not self.capacity_shard_count:
+            return self.pending_participants, self.pending_reservations
+
+        if hasattr(self, "pending_total"):
+            return self.pending_total, self.pending_reservations_total
+
+        shard_totals = self.capacity_shards.aggregate(
+            participants=Coalesce(Sum("pending_participants"), 0),
+            reservations=Coalesce(Sum("pending_reservations"), 0),
+        )
+        return (
+            self.pending_participants + shard_totals["participants"],
+            self.pending_reservations + shard_totals["reservations"],
+        )
+
+    def get_pending_participants(self):
+        return self.get_pending_counts()[0]
+
+    def get_pending_reservations(self):
+        return self.get_pending_counts()[1]
+
+    @staticmethod
+    def calculate_reservation_deadline(start_time):
+        """
+        시험 시작 시간으로 예약 마감 시간을 계산합니다.
+
+        - 시험 시작일 기준, 설정된 일 수(EXAM_RESERVATION_DEADLINE_DAYS) 이전
+        """
+        return start_time - timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS)
 
     def get_reservation_deadline(self):
         """
         시험 예약 마감 시간을 반환합니다.
+        """
+        return self.calculate_reservation_deadline(self.start_time)
 
-        - 시험 시작일 기준, 설정된 일 수(EXAM_RESERVATION_DEADLINE_DAYS) 이전
+    @classmethod
+    def get_admission_snapshot(cls, schedule_id):
+        """
+        예약 생성 검사에 필요한 (시험 시작 시간, 남은 인원)만 조회합니다. 일정이 없으면 None
+
+        - 설명 등 나머지 컬럼은 읽지 않으며, 남은 인원은 스트라이프를 포함한 조회 시점의 확정 인원으로 계산합니다.
         """
-        return self.start_time - timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS)
+        row = (
+            cls.objects.filter(id=schedule_id)
+            .with_confirmed_total()
+            .values_list("start_time", "confirmed_total")
+            .first()
+        )
+        if row is None:
+            return None
+        start_time, confirmed_total = row
+        return start_time, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - confirmed_total
 
     def get_remaining_capacity(self):
         """
@@ -57,4 +399,119 @@ class ExamSchedule(models.Model):
 
         - 최대 허용 인원에서 확정된 인원을 뺀 값
         """
-        return settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - self.confirmed_participants
+        return settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - self.get_confirmed_participants()
+
+
+class ScheduleCapacityShard(models.Model):
+    """
+    인기 일정의 확정 인원을 여러 행으로 나누어 관리하는 스트라이프 카운터
+
+    - 각 스트라이프는 최대 인원 중 일부(capacity)를 배정받고, 그 안에서만 확정 인원을 증가시킵니다.
+    - 일정의 기준값과 모든 스트라이프의 capacity 합은 항상 최대 인원(EXAM_SCHEDULE_MAX_PARTICIPANTS)과 같습니다.
+    """
+
+    schedule = models.ForeignKey(ExamSchedule, on_delete=models.CASCADE, related_name="capacity_shards")
+    index = models.PositiveSmallIntegerField()
+    capacity = models.PositiveIntegerField(default=0)  # 이 스트라이프에 배정된 인원 수
+    confirmed_participants = models.PositiveIntegerField(default=0)
+    # 일정 기준값에 더하는 확정 대기 인원/예약 수 증감 (다른 스트라이프에서 늘어난 예약이 여기서 줄 수 있어 음수 가능)
+    pending_participants = models.IntegerField(default=0)
+    pending_reservations = models.IntegerField(default=0)
+
+    # 일정의 기준값과 합산되는 카운터 (스트라이프 수 변경 시 일정 기준값으로 합침)
+    counter_fields = ["confirmed_participants", "pending_participants", "pending_reservations"]
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["schedule", "index"], name="schedule_capacity_shard_unique_index"),
+            models.CheckConstraint(
+                condition=Q(confirmed_participants__lte=F("capacity")),
+                name="schedule_capacity_shard_confirmed_participants_lte_capacity",
+            ),
+        ]
+
+    @classmethod
+    def change_confirmed_participants(cls, schedule_id, delta, pending=0, pending_reservations=0):
+        """
+        임의의 스트라이프 하나를 골라 확정 인원을 조건부 UPDATE로 증감합니다.
+
+        - 확정 대기 인원/예약 수 증감도 같은 스트라이프에 함께 반영합니다.
+        - 한 스트라이프로 처리할 수 없으면 전체 스트라이프를 잠그고 인원을 재배치합니다.
+        - 스트라이프가 없거나 전체 인원으로도 처리할 수 없으면 False를 반환합니다.
+        """
+        if delta > 0:
+            guard = Q(confirmed_participants__lte=F("capacity") - delta)
+        else:
+            guard = Q(confirmed_participants__gte=-delta)
+
+        candidate = cls.objects.filter(guard, schedule_id=schedule_id).order_by("?").values("id")[:1]
+        if cls.objects.filter(guard, id=Subquery(candidate)).update(
+            confirmed_participants=F("confirmed_participants") + delta,
+            **pending_changes(pending, pending_reservations),
+        ):
+            return True
+
+        return cls._rebalance(schedule_id, delta, pending, pending_reservations)
+
+    @classmethod
+    def change_pending_participants(cls, schedule_id, changes):
+        """
+        임의의 스트라이프 하나에 확정 대기 인원/예약 수 증감(`pending_changes`)을 반영합니다. 스트라이프가 없으면 False
+        """
+        candidate = cls.objects.filter(schedule_id=schedule_id).order_by("?").values("id")[:1]
+        return bool(cls.objects.filter(id=Subquery(candidate)).update(**changes))
+
+    @classmethod
+    @transaction.atomic
+    def _rebalance(cls, schedule_id, delta, pending=0, pending_reservations=0):
+        """
+        일정과 모든 스트라이프를 잠근 상태에서 인원을 재배치하여 증감을 반영합니다.
+
+        - 증가: 다른 스트라이프의 남은 배정 인원을 한 스트라이프로 모읍니다.
+        - 감소: 여러 스트라이프와 일정 기준값에서 나누어 차감합니다.
+        - 확정 대기 인원/예약 수 증감은 첫 번째 스트라이프에 반영합니다.
+        """
+        if not cls.objects.filter(schedule_id=schedule_id).exists():
+            return False
+
+        schedule = ExamSchedule.objects.select_for_update().get(id=schedule_id)
+        shards = list(cls.objects.select_for_update().filter(schedule_id=schedule_id).order_by("index"))
+
+        if delta > 0:
+            if sum(shard.free_capacity for shard in shards) < delta:
+                return False
+
+            target = max(shards, key=lambda shard: shard.free_capacity)
+            for shard in shards:
+                needed = delta - target.free_capacity
+                if needed <= 0:
+                    break
+                if shard is target:
+                    continue
+                moved = min(shard.free_capacity, needed)
+                shard.capacity -= moved
+                target.capacity += moved
+            target.confirmed_participants += delta
+        else:
+            remaining = -delta
+            if schedule.confirmed_participants + sum(shard.confirmed_participants for shard in shards) < remaining:
+                return False
+
+            for shard in shards:
+                removed = min(shard.confirmed_participants, remaining)
+                shard.confirmed_participants -= removed
+                remaining -= removed
+
+            # 기준값에서 차감한 인원은 스트라이프 배정 인원으로 돌려줍니다.
+            schedule.confirmed_participants -= remaining
+            shards[0].capacity += remaining
+            schedule.save(update_fields=["confirmed_participants"])
+
+        shards[0].pending_participants += pending
+        shards[0].pending_reservations += pending_reservations
+        cls.objects.bulk_update(shards, ["capacity", *cls.counter_fields])
+        return True
+
+    @property
+    def free_capacity(self):
+        return self.capacity - self.confirmed_participants
@@ -0,0 +1,5 @@
+from core.pagination import KeysetPagination
+
+
+class ExamScheduleCursorPagination(KeysetPagination):
+    ordering = ("start_time", "id")
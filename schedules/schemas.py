@@ -1,6 +1,12 @@
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema, extend_schema_view
-from rest_framework import status
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+    extend_schema_view,
+    inline_serializer,
+)
+from rest_framework import serializers, status
 
 from schedules.serializers import ExamScheduleSerializer
 
@@ -23,9 +29,10 @@ exam_schedule_create_schema = extend_schema(
 
 exam_schedule_list_schema = extend_schema(
     summary="시험 일정 목록 조회",
-    description="시험 일정 목록을 조회합니다.",
+    description="시험 일정 목록을 조회합니다.\n\nIf-None-Match 조건부 조회를 지원합니다.",
     responses={
         status.HTTP_200_OK: OpenApiResponse(response=ExamScheduleSerializer(many=True), description="시험 일정 목록"),
+        status.HTTP_304_NOT_MODIFIED: OpenApiResponse(description="변경되지 않았습니다."),
         status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
         status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
     },
@@ -60,14 +67,34 @@ exam_schedule_list_schema = extend_schema(
             required=False,
             type=OpenApiTypes.INT,
         ),
+        OpenApiParameter(
+            name="pagination",
+            description="`cursor`로 지정하면 시작 시간 기준 커서 페이지네이션을 사용합니다. (전체 개수 미제공)",
+            required=False,
+            type=OpenApiTypes.STR,
+            enum=["cursor"],
+        ),
+        OpenApiParameter(
+            name="cursor",
+            description="커서 페이지네이션의 다음 페이지 커서",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
+        OpenApiParameter(
+            name="page_size",
+            description="커서 페이지네이션의 페이지 크기 (최대 100)",
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
     ],
 )
 
 exam_schedule_detail_schema = extend_schema(
     summary="시험 일정 상세 조회",
-    description="시험 일정의 상세 정보를 조회합니다.",
+    description="시험 일정의 상세 정보를 조회합니다.\n\nIf-None-Match 조건부 조회를 지원합니다.",
     responses={
         status.HTTP_200_OK: OpenApiResponse(response=ExamScheduleSerializer, description="시험 일정 상세 정보"),
+        status.HTTP_304_NOT_MODIFIED: OpenApiResponse(description="변경되지 않았습니다."),
         status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
         status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
     },
@@ -103,6 +130,128 @@ exam_schedule_delete_schema = extend_schema(
     },
 )
 
+exam_schedule_available_schema = extend_schema(
+    summary="예약 가능 시험 일정 조회",
+    description="""예약 마감 전이며 남은 인원이 `min_capacity`명 이상인 시험 일정을 조회합니다.
+
+    `from`, `to`로 시험 시작 시간 구간을 지정할 수 있습니다.
+
+    시험 시작 시간 순 커서 페이지네이션으로 응답하며, 다음 페이지는 `next` 링크로 조회합니다.
+    """,
+    parameters=[
+        OpenApiParameter(
+            name="from",
+            description="조회 구간 시작 (시험 시작 시간 기준, 포함)",
+            required=False,
+            type=OpenApiTypes.DATETIME,
+        ),
+        OpenApiParameter(
+            name="to",
+            description="조회 구간 종료 (시험 시작 시간 기준, 미포함)",
+            required=False,
+            type=OpenApiTypes.DATETIME,
+        ),
+        OpenApiParameter(
+            name="min_capacity",
+            description="최소 남은 인원 (기본값 1)",
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+        OpenApiParameter(name="cursor", description="다음 페이지 커서", required=False, type=OpenApiTypes.STR),
+        OpenApiParameter(
+            name="page_size",
+            description="페이지 크기 (최대 100)",
+            required=False,
+            type=OpenApiTypes.INT,
+        ),
+    ],
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(
+            response=inline_serializer(
+                name="AvailableExamScheduleList",
+                fields={
+                    "next": serializers.URLField(allow_null=True),
+                    "results": ExamScheduleSerializer(many=True),
+                },
+            ),
+            description="예약 가능한 시험 일정 목록",
+        ),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(description="유효하지 않은 조회 조건입니다."),
+        status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
+        status.HTTP_404_NOT_FOUND: OpenApiResponse(description="유효하지 않은 커서입니다."),
+    },
+)
+
+exam_schedule_stats_fields = {
+    "schedule_id": serializers.IntegerField(),
+    "title": serializers.CharField(),
+    "start_time": serializers.DateTimeField(),
+    "end_time": serializers.DateTimeField(),
+    "reservations": serializers.IntegerField(help_text="전체 예약 수"),
+    "confirmed_reservations": serializers.IntegerField(help_text="확정된 예약 수"),
+    "pending_reservations": serializers.IntegerField(help_text="확정 대기 예약 수"),
+    "confirmed_participants": serializers.IntegerField(help_text="확정된 예약의 예상 인원 합계"),
+    "pending_participants": serializers.IntegerField(help_text="확정 대기 예약의 예상 인원 합계"),
+    "max_total_participants": serializers.IntegerField(help_text="일정의 최대 인원"),
+    "fill_ratio": serializers.FloatField(help_text="확정 인원 / 최대 인원"),
+    "reservation_deadline": serializers.DateTimeField(help_text="예약 마감 시간"),
+    "seconds_to_deadline": serializers.IntegerField(help_text="예약 마감까지 남은 초 (마감 후 음수)"),
+}
+
+exam_schedule_stats_schema = extend_schema(
+    operation_id="exam_schedules_stats_list",
+    summary="시험 일정별 예약 통계 조회",
+    description="""시험 시작 시간이 조회 구간에 속한 일정들의 예약 통계를 조회합니다.
+
+    예약 수, 확정/확정 대기 인원, 채움 비율, 예약 마감까지 남은 시간을 포함합니다.
+
+    예약 테이블을 일정별로 집계하는 쿼리 한 번으로 계산하며, 이 API는 관리자 권한이 필요합니다.
+
+    응답을 페이지로 나누지 않으므로 조회 구간(`from`, `to`)은 필수이며 최대 31일입니다.
+    """,
+    parameters=[
+        OpenApiParameter(
+            name="from",
+            description="조회 구간 시작 (시험 시작 시간 기준, 포함)",
+            required=True,
+            type=OpenApiTypes.DATETIME,
+        ),
+        OpenApiParameter(
+            name="to",
+            description="조회 구간 종료 (시험 시작 시간 기준, 미포함, 시작 후 최대 31일)",
+            required=True,
+            type=OpenApiTypes.DATETIME,
+        ),
+    ],
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(
+            response=inline_serializer(name="ExamScheduleStats", fields=exam_schedule_stats_fields, many=True),
+            description="일정별 예약 통계 (시험 시작 시간 순)",
+        ),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(description="조회 구간이 없거나 유효하지 않습니다."),
+        status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
+        status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+    },
+)
+
+exam_schedule_detail_stats_schema = extend_schema(
+    operation_id="exam_schedules_stats_retrieve",
+    summary="시험 일정 예약 통계 조회",
+    description="""시험 일정 하나의 예약 통계를 조회합니다.
+
+    이 API는 관리자 권한이 필요합니다.
+    """,
+    responses={
+        status.HTTP_200_OK: OpenApiResponse(
+            response=inline_serializer(name="ExamScheduleStats", fields=exam_schedule_stats_fields),
+            description="일정의 예약 통계",
+        ),
+        status.HTTP_401_UNAUTHORIZED: OpenApiResponse(description="인증되지 않은 요청입니다."),
+        status.HTTP_403_FORBIDDEN: OpenApiResponse(description="권한이 없습니다."),
+        status.HTTP_404_NOT_FOUND: OpenApiResponse(description="시험 일정을 찾을 수 없습니다."),
+    },
+)
+
 exam_schedule_schema_view = extend_schema_view(
     list=exam_schedule_list_schema,
     create=exam_schedule_create_schema,
@@ -110,4 +259,7 @@ exam_schedule_schema_view = extend_schema_view(
     update=exam_schedule_update_schema,
     partial_update=exam_schedule_update_schema,
     destroy=exam_schedule_delete_schema,
+    available=exam_schedule_available_schema,
+    stats=exam_schedule_stats_schema,
+    schedule_stats=exam_schedule_detail_stats_schema,
 )
@@ -1,16 +1,177 @@
+from datetime import timedelta
+
 from django.conf import settings
 from rest_framework import serializers
 
+from core.timing import TimedSerializerMixin
 from schedules.models import ExamSchedule
 
 
-class ExamScheduleSerializer(serializers.ModelSerializer):
+class ExamScheduleSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     max_total_participants = serializers.SerializerMethodField()
+    confirmed_participants = serializers.IntegerField(source="get_confirmed_participants", read_only=True)
+    pending_participants = serializers.IntegerField(source="get_pending_participants", read_only=True)
+    pending_reservations = serializers.IntegerField(source="get_pending_reservations", read_only=True)
 
     class Meta:
         model = ExamSchedule
         fields = "__all__"
-        read_only_fields = ["id", "confirmed_participants"]
+        read_only_fields = ["id", "capacity_shard_count", "version"]
 
     def get_max_total_participants(self, obj):
         return settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
+
+
+class ExamScheduleListProjection:
+    """
+    목록 조회용 읽기 전용 프로젝션
+
+    - `values()`로 필요한 컬럼만 조회하고, ExamScheduleSerializer와 같은 형태의 dict를 직접 만듭니다.
+    - 행마다 serializer 필드 트리와 모델 인스턴스를 만들지 않으므로 목록 응답의 CPU 사용량이 줄어듭니다.
+    """
+
+    datetime_field = serializers.DateTimeField()
+
+    @classmethod
+    def columns(cls, prefix=""):
+        return [
+            f"{prefix}{name}"
+            for name in [
+                "id",
+                "title",
+                "description",
+                "start_time",
+                "end_time",
+                "capacity_shard_count",
+                "version",
+            ]
+        ]
+
+    # 스트라이프 카운터까지 합산한 값 (ExamScheduleQuerySet.with_counter_totals)
+    totals = ["confirmed_total", "pending_total", "pending_reservations_total"]
+
+    @classmethod
+    def values(cls, queryset):
+        return queryset.with_counter_totals().values(*cls.columns(), *cls.totals)
+
+    @classmethod
+    def to_representation(cls, row, prefix="", totals_prefix=""):
+        to_datetime = cls.datetime_field.to_representation
+        return {
+            "id": row[f"{prefix}id"],
+            "max_total_participants": settings.EXAM_SCHEDULE_MAX_PARTICIPANTS,
+            "confirmed_participants": row[f"{totals_prefix}confirmed_total"],
+            "title": row[f"{prefix}title"],
+            "description": row[f"{prefix}description"],
+            "start_time": to_datetime(row[f"{prefix}start_time"]),
+            "end_time": to_datetime(row[f"{prefix}end_time"]),
+            "capacity_shard_count": row[f"{prefix}capacity_shard_count"],
+            "pending_participants": row[f"{totals_prefix}pending_total"],
+            "pending_reservations": row[f"{totals_prefix}pending_reservations_total"],
+            "version": row[f"{prefix}version"],
+        }
+
+
+class ExamScheduleWindowSerializer(TimedSerializerMixin, serializers.Serializer):
+    """
+    시험 시작 시간 기준 조회 구간(`from`, `to`) 쿼리 파라미터
+    """
+
+    def get_fields(self):
+        # `from`은 예약어이므로 클래스 속성 대신 get_fields로 필드를 정의합니다.
+        return {
+            "from": serializers.DateTimeField(required=False),
+            "to": serializers.DateTimeField(required=False),
+        }
+
+    def validate(self, attrs):
+        if "from" in attrs and "to" in attrs and attrs["from"] > attrs["to"]:
+            raise serializers.ValidationError({"to": "조회 종료 시간은 시작 시간 이후여야 합니다."})
+        return attrs
+
+    def filter_queryset(self, queryset):
+        if "from" in self.validated_data:
+            queryset = queryset.filter(start_time__gte=self.validated_data["from"])
+        if "to" in self.validated_data:
+            queryset = queryset.filter(start_time__lt=self.validated_data["to"])
+        return queryset
+
+
+class ExamScheduleStatsWindowSerializer(ExamScheduleWindowSerializer):
+    """
+    예약 통계 조회 구간(`from`, `to`) 쿼리 파라미터
+
+    - 응답을 페이지로 나누지 않으므로 구간은 필수이며, 너비는 EXAM_SCHEDULE_STATS_MAX_WINDOW_DAYS일 이하여야 합니다.
+    """
+
+    def get_fields(self):
+        return {
+            "from": serializers.DateTimeField(),
+            "to": serializers.DateTimeField(),
+        }
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        max_days = settings.EXAM_SCHEDULE_STATS_MAX_WINDOW_DAYS
+        if attrs["to"] - attrs["from"] > timedelta(days=max_days):
+            raise serializers.ValidationError({"to": f"조회 구간은 최대 {max_days}일입니다."})
+        return attrs
+
+
+class ExamScheduleAvailabilitySerializer(ExamScheduleWindowSerializer):
+    """
+    예약 가능 일정 조회 쿼리 파라미터 (`from`, `to`, `min_capacity`)
+    """
+
+    def get_fields(self):
+        return {
+            **super().get_fields(),
+            "min_capacity": serializers.IntegerField(
+                min_value=1, max_value=settings.EXAM_SCHEDULE_MAX_PARTICIPANTS, default=1
+            ),
+        }
+
+
+class ExamScheduleStatsProjection:
+    """
+    일정별 예약 통계 프로젝션
+
+    - `with_reservation_stats()`로 집계한 `values()` 행으로 응답 dict를 만듭니다.
+    - 채움 비율은 확정 인원 / 최대 인원, 마감까지 남은 시간은 예약 마감 시간 기준 초 단위(마감 후 음수)입니다.
+    """
+
+    datetime_field = serializers.DateTimeField()
+
+    @classmethod
+    def values(cls, queryset):
+        return queryset.with_reservation_stats().values(
+            "id",
+            "title",
+            "start_time",
+            "end_time",
+            "stats_reservations",
+            "stats_confirmed_reservations",
+            "stats_confirmed_participants",
+            "stats_pending_participants",
+        )
+
+    @classmethod
+    def to_representation(cls, row, now):
+        to_datetime = cls.datetime_field.to_representation
+        maximum = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
+        deadline = ExamSchedule.calculate_reservation_deadline(row["start_time"])
+        return {
+            "schedule_id": row["id"],
+            "title": row["title"],
+            "start_time": to_datetime(row["start_time"]),
+            "end_time": to_datetime(row["end_time"]),
+            "reservations": row["stats_reservations"],
+            "confirmed_reservations": row["stats_confirmed_reservations"],
+            "pending_reservations": row["stats_reservations"] - row["stats_confirmed_reservations"],
+            "confirmed_participants": row["stats_confirmed_participants"],
+            "pending_participants": row["stats_pending_participants"],
+            "max_total_participants": maximum,
+            "fill_ratio": round(row["stats_confirmed_participants"] / maximum, 4),
+            "reservation_deadline": to_datetime(deadline),
+            "seconds_to_deadline": int((deadline - now).total_seconds()),
+        }
@@ -1,3 +1,976 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from reservations.models import Reservation
+from schedules.models import ExamSchedule, ScheduleCapacityShard
+from schedules.serializers import ExamScheduleListProjection, ExamScheduleSerializer
+from schedules.views import ExamScheduleAsyncView
+from users.authentication import user_cache
+from users.serializers.jwt import CustomTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+def create_schedule(title="Test Exam", **kwargs):
+    return ExamSchedule.objects.create(
+        title=title,
+        start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+        end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        **kwargs,
+    )
+
+
+"""
+확정 인원 조건부 변경
+- 최대 인원 이내로 증가 - 성공
+- 최대 인원을 초과하여 증가 - 실패
+- 확정된 인원보다 많이 감소 - 실패
+- CHECK 제약 조건을 우회하여 최대 인원을 초과 저장 - 실패
+- 최대 인원 설정과 마이그레이션의 CHECK 제약 조건/부분 인덱스 조건 일치 - 성공
+- 이전에 조회한 일정을 전체 저장해도 그 사이 변경된 확정 인원/스트라이프 수 유지 - 성공
+
+확정 인원 스트라이프 카운터
+- 스트라이프 모드 전환 시 기존 확정 인원 유지 - 성공
+- 스트라이프에 나누어 증가한 인원의 합계 조회 - 성공
+- 한 스트라이프의 배정 인원을 넘는 증가 (재배치) - 성공
+- 전체 최대 인원을 초과하여 증가 - 실패
+- 스트라이프와 기준값에 걸친 감소 - 성공
+- 스트라이프 모드 해제 시 확정 인원 유지 - 성공
+- 스트라이프에 확정 대기 인원/예약 수 반영, 확정 시 같은 스트라이프 UPDATE로 이동 (일정 행/버전 변경 없음) - 성공
+- 스트라이프 모드 해제 시 스트라이프의 확정 대기 인원/예약 수를 기준값으로 합침 - 성공
+
+시험 일정 목록 조회
+- 커서 페이지네이션으로 시작 시간 순 모든 페이지 순회 - 성공
+- 목록 프로젝션 응답이 ExamScheduleSerializer 응답과 동일 (스트라이프 일정 포함) - 성공
+
+시험 일정 조회 캐시
+- 같은 목록 조회 재요청 시 DB 조회 없이 응답 - 성공
+- 검색어가 다르면 별도로 캐시 - 성공
+- 예약 확정 후 상세/목록 조회 시 변경된 확정 인원 응답 - 성공
+- 관리자의 일정 수정 후 목록 조회 시 변경된 제목 응답 - 성공
+
+시험 일정 ETag
+- 상세 조회 시 ETag 응답, 같은 ETag로 재요청 시 304 - 성공
+- 캐시된 목록의 ETag로 재요청 시 DB 조회 없이 304 - 성공
+- 예약 확정 후 상세/목록 ETag 변경 - 성공
+- 관리자의 일정 수정 후 버전 증가 및 상세 ETag 변경 - 성공
+- 관리자가 이전 ETag를 If-Match로 전달하여 일정 수정 - 실패 (412)
+
+시험 일정 비동기 조회 (ASGI)
+- 목록 조회 응답과 ETag가 동기 뷰셋과 동일 - 성공
+- 커서 페이지네이션 응답이 동기 뷰셋과 동일 - 성공
+- 상세 조회 응답이 동기 뷰셋과 동일, 동기 뷰셋의 ETag로 재요청 시 304 - 성공
+- 확정 대기 예약 생성 후 이전 ETag로 목록/상세 재요청 시 변경된 응답 - 성공
+- 목록/상세 응답을 비동기 캐시 API(aget/aset)로 캐시하고 재사용 - 성공
+- 존재하지 않는 일정 상세 조회 - 실패
+- 로그인 하지 않은 사용자가 접근 - 실패
+
+확정 대기 인원 카운터
+- 예약 생성, 인원 수정, 삭제 시 확정 대기 인원/예약 수 반영 - 성공
+- ORM(인스턴스, queryset)으로 예약 삭제 시 확정 대기 인원/예약 수 반영 - 성공
+- 사용자 삭제로 예약이 함께 삭제(CASCADE)될 때 확정 대기 인원/예약 수 반영 - 성공
+- 예약이 있는 일정 삭제 - 성공
+- 예약 확정 시 확정 대기 인원이 확정 인원으로 이동 - 성공
+- 일괄 확정 시 확정된 예약만 확정 대기에서 제외 - 성공
+- 상세/목록 조회 응답에 확정 대기 인원 포함 - 성공
+- 예약 생성/수정/삭제 시 일정 버전은 유지하고, 일정 목록/상세와 예약 상세의 ETag/캐시 응답에 확정 대기 인원 반영 - 성공
+- 스트라이프 일정의 예약 생성/확정 시 일정 행 변경 없이 상세 조회 응답에 합계 반영 - 성공
+- 카운터 검사 명령어로 불일치 확인 후 보정 - 성공
+- 확정 인원 불일치는 보정하지 않음 - 실패
+
+예약 가능 시험 일정 조회
+- 마감 전이고 남은 인원이 min_capacity 이상인 일정만 시작 시간 순으로 조회 (스트라이프 일정 포함) - 성공
+- 조회 구간에 시작하는 일정만 커서 페이지네이션으로 모든 페이지 순회 - 성공
+- 최소 남은 인원이 최대 인원을 초과 - 실패
+- 로그인 하지 않은 사용자가 접근 - 실패
+
+시험 일정 예약 통계
+- 조회 구간의 일정별 예약 수, 확정/확정 대기 인원, 채움 비율을 쿼리 한 번으로 조회 - 성공
+- 일정 하나의 예약 통계 조회 - 성공
+- 조회 구간 종료가 시작보다 이전, 조회 구간 누락, 최대 너비 초과 - 실패
+- 존재하지 않는 일정의 통계 조회 - 실패
+- 일반 사용자의 통계 조회 - 실패
+"""
+
+
+class ExamScheduleConfirmedParticipantsTests(TestCase):
+    def setUp(self):
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+        )
+
+    def test_change_confirmed_participants__success(self):
+        # When
+        ExamSchedule.change_confirmed_participants(self.schedule.id, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS)
+        ExamSchedule.change_confirmed_participants(self.schedule.id, -10)
+
+        # Then
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 10)
+
+    def test_change_confirmed_participants__fail_with_over_capacity(self):
+        # Given
+        ExamSchedule.change_confirmed_participants(self.schedule.id, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 5)
+
+        # When & Then
+        with self.assertRaises(ValueError):
+            ExamSchedule.change_confirmed_participants(self.schedule.id, 6)
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 5)
+
+    def test_change_confirmed_participants__fail_with_below_zero(self):
+        # Given
+        self.schedule.add_confirmed_participant(3)
+
+        # When & Then
+        with self.assertRaises(ValueError):
+            self.schedule.remove_confirmed_participant(4)
+        self.assertEqual(self.schedule.confirmed_participants, 3)
+
+    def test_check_constraint__success_with_migrations_in_sync(self):
+        # When & Then: 최대 인원 설정을 바꾸고 마이그레이션을 만들지 않으면 변경 사항이 감지되어 실패
+        call_command("makemigrations", "schedules", "--check", "--dry-run", stdout=StringIO())
+
+    def test_save__success_without_overwriting_counters(self):
+        # Given
+        stale = ExamSchedule.objects.get(id=self.schedule.id)
+        ExamSchedule.change_confirmed_participants(self.schedule.id, 30)
+        self.schedule.configure_capacity_shards(2)
+
+        # When
+        stale.title = "Updated Exam"
+        stale.save()
+
+        # Then
+        schedule = ExamSchedule.objects.get(id=self.schedule.id)
+        self.assertEqual(schedule.title, "Updated Exam")
+        self.assertEqual((schedule.confirmed_participants, schedule.capacity_shard_count), (30, 2))
+
+    def test_check_constraint__fail_with_over_capacity(self):
+        # Given
+        self.schedule.confirmed_participants = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS + 1
+
+        # When & Then
+        with self.assertRaises(IntegrityError):
+            self.schedule.save(update_fields=["confirmed_participants"])
+
+
+class ScheduleCapacityShardTests(TestCase):
+    def setUp(self):
+        self.schedule = ExamSchedule.objects.create(
+            title="Test Exam",
+            start_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1),
+            end_time=timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1, hours=2),
+            confirmed_participants=100,
+        )
+        self.schedule.configure_capacity_shards(4)
+
+    def get_confirmed_participants(self):
+        return ExamSchedule.objects.get(id=self.schedule.id).get_confirmed_participants()
+
+    def test_configure_capacity_shards__success(self):
+        # Then
+        shards = ScheduleCapacityShard.objects.filter(schedule=self.schedule)
+        self.assertEqual(self.schedule.capacity_shard_count, 4)
+        self.assertEqual(shards.count(), 4)
+        self.assertEqual(
+            sum(shard.capacity for shard in shards) + self.schedule.confirmed_participants,
+            settings.EXAM_SCHEDULE_MAX_PARTICIPANTS,
+        )
+        self.assertEqual(self.get_confirmed_participants(), 100)
+
+    def test_change_confirmed_participants__success_with_shards(self):
+        # When
+        for _ in range(20):
+            ExamSchedule.change_confirmed_participants(self.schedule.id, 5)
+
+        # Then
+        self.assertEqual(self.get_confirmed_participants(), 200)
+        self.assertEqual(ExamSchedule.objects.get(id=self.schedule.id).confirmed_participants, 100)
+        annotated = ExamSchedule.objects.with_confirmed_total().get(id=self.schedule.id)
+        self.assertEqual(ExamScheduleSerializer(annotated).data["confirmed_participants"], 200)
+
+    def test_change_confirmed_participants__success_with_rebalance(self):
+        # Given
+        largest_shard_capacity = ScheduleCapacityShard.objects.order_by("-capacity").first().capacity
+
+        # When
+        ExamSchedule.change_confirmed_participants(self.schedule.id, largest_shard_capacity + 1)
+
+        # Then
+        self.assertEqual(self.get_confirmed_participants(), 100 + largest_shard_capacity + 1)
+
+    def test_change_confirmed_participants__fail_with_over_capacity(self):
+        # Given
+        ExamSchedule.change_confirmed_participants(self.schedule.id, settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 100)
+
+        # When & Then
+        with self.assertRaises(ValueError):
+            ExamSchedule.change_confirmed_participants(self.schedule.id, 1)
+        self.assertEqual(self.schedule.get_remaining_capacity(), 0)
+
+    def test_change_confirmed_participants__success_with_decrease_below_shards(self):
+        # Given
+        ExamSchedule.change_confirmed_participants(self.schedule.id, 10)
+
+        # When
+        ExamSchedule.change_confirmed_participants(self.schedule.id, -50)
+
+        # Then
+        self.assertEqual(self.get_confirmed_participants(), 60)
+        shard_capacity = sum(ScheduleCapacityShard.objects.values_list("capacity", flat=True))
+        self.assertEqual(
+            ExamSchedule.objects.get(id=self.schedule.id).confirmed_participants + shard_capacity,
+            settings.EXAM_SCHEDULE_MAX_PARTICIPANTS,
+        )
+
+    def test_change_pending_participants__success_with_shards(self):
+        # Given
+        version = ExamSchedule.objects.get(id=self.schedule.id).version
+
+        # When
+        ExamSchedule.change_pending_participants(self.schedule.id, 7, 2)
+        ExamSchedule.change_confirmed_participants(self.schedule.id, 3, -3, -1)
+
+        # Then
+        schedule = ExamSchedule.objects.get(id=self.schedule.id)
+        self.assertEqual((schedule.pending_participants, schedule.pending_reservations), (0, 0))
+        self.assertEqual(schedule.version, version)
+        self.assertEqual(schedule.get_pending_counts(), (4, 1))
+        data = ExamScheduleSerializer(ExamSchedule.objects.with_counter_totals().get(id=self.schedule.id)).data
+        self.assertEqual(
+            (data["confirmed_participants"], data["pending_participants"], data["pending_reservations"]), (103, 4, 1)
+        )
+
+    def test_configure_capacity_shards__success_with_pending(self):
+        # Given
+        ExamSchedule.change_pending_participants(self.schedule.id, 7, 2)
+
+        # When
+        self.schedule.configure_capacity_shards(0)
+
+        # Then
+        self.assertEqual((self.schedule.pending_participants, self.schedule.pending_reservations), (7, 2))
+        self.assertEqual(self.schedule.get_pending_counts(), (7, 2))
+
+    def test_configure_capacity_shards__success_with_disable(self):
+        # Given
+        ExamSchedule.change_confirmed_participants(self.schedule.id, 30)
+
+        # When
+        self.schedule.configure_capacity_shards(0)
+
+        # Then
+        self.assertEqual(self.schedule.capacity_shard_count, 0)
+        self.assertEqual(self.schedule.confirmed_participants, 130)
+        self.assertFalse(ScheduleCapacityShard.objects.exists())
+
+
+class ExamScheduleListTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        start_time = timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1)
+        for index in range(5):
+            ExamSchedule.objects.create(
+                title=f"Test Exam {index}",
+                start_time=start_time + timedelta(hours=index // 2),
+                end_time=start_time + timedelta(hours=index // 2 + 2),
+            )
+        self.url = reverse("schedules:exam-schedules-list")
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_schedules__success_with_cursor(self):
+        # Given
+        url = f"{self.url}?pagination=cursor&page_size=2"
+        ids = []
+
+        # When
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        # Then
+        self.assertEqual(ids, list(ExamSchedule.objects.order_by("start_time", "id").values_list("id", flat=True)))
+
+    def test_list_projection__matches_serializer(self):
+        # Given
+        schedule = ExamSchedule.objects.first()
+        schedule.add_confirmed_participant(10)
+        schedule.configure_capacity_shards(2)
+        ExamSchedule.change_confirmed_participants(schedule.id, 5)
+        queryset = ExamSchedule.objects.with_confirmed_total()
+
+        # When
+        projected = [
+            ExamScheduleListProjection.to_representation(row) for row in ExamScheduleListProjection.values(queryset)
+        ]
+        response = self.client.get(self.url)
+
+        # Then
+        expected = ExamScheduleSerializer(queryset, many=True).data
+        self.assertEqual(projected, expected)
+        self.assertEqual(response.data["results"], expected)
+        self.assertEqual(projected[0]["confirmed_participants"], 15)
+
+
+class ExamScheduleCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = create_schedule()
+        self.list_url = reverse("schedules:exam-schedules-list")
+        self.detail_url = reverse("schedules:exam-schedules-detail", args=[self.schedule.id])
+
+    def test_list_schedules__success_from_cache(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        first_response = self.client.get(self.list_url)
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, first_response.data)
+
+    def test_list_schedules__success_with_different_search(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.list_url)
+
+        # When
+        response = self.client.get(self.list_url, {"search": "no match"})
+
+        # Then
+        self.assertEqual(response.data["count"], 0)
+
+    def test_retrieve_schedule__success_after_confirm(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        reservation = Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=7)
+        self.client.get(self.detail_url)
+        self.client.get(self.list_url)
+
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            reservation.confirm()
+        detail_response = self.client.get(self.detail_url)
+        list_response = self.client.get(self.list_url)
+
+        # Then
+        self.assertEqual(detail_response.data["confirmed_participants"], 7)
+        self.assertEqual(list_response.data["results"][0]["confirmed_participants"], 7)
+
+    def test_list_schedules__success_after_admin_update(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.list_url)
+
+        # When
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(self.detail_url, {"title": "Updated Exam"}, format="json")
+        response = self.client.get(self.list_url)
+
+        # Then
+        self.assertEqual(response.data["results"][0]["title"], "Updated Exam")
+
+
+class ExamScheduleETagTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = create_schedule()
+        self.list_url = reverse("schedules:exam-schedules-list")
+        self.detail_url = reverse("schedules:exam-schedules-detail", args=[self.schedule.id])
+
+    @override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+    def test_retrieve_schedule__success_with_not_modified(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.detail_url)["ETag"]
+
+        # When
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+
+    def test_list_schedules__success_with_not_modified_from_cache(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        etag = self.client.get(self.list_url)["ETag"]
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    @override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+    def test_etag__changed_after_confirm(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+        reservation = Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=7)
+        detail_etag = self.client.get(self.detail_url)["ETag"]
+        list_etag = self.client.get(self.list_url)["ETag"]
+
+        # When
+        reservation.confirm()
+        detail_response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        list_response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+
+        # Then
+        self.assertEqual(detail_response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(detail_response["ETag"], detail_etag)
+        self.assertEqual(detail_response.data["confirmed_participants"], 7)
+        self.assertEqual(list_response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(list_response["ETag"], list_etag)
+
+    @override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+    def test_etag__changed_after_admin_update(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        etag = self.client.get(self.detail_url)["ETag"]
+
+        # When
+        self.client.patch(self.detail_url, {"title": "Updated Exam"}, format="json")
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["version"], 2)
+
+    @override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+    def test_update_schedule__fail_with_stale_if_match(self):
+        # Given
+        self.client.force_authenticate(user=self.admin)
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.client.patch(self.detail_url, {"title": "Updated Exam"}, format="json")
+
+        # When
+        response = self.client.patch(self.detail_url, {"title": "Stale Exam"}, format="json", HTTP_IF_MATCH=etag)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.title, "Updated Exam")
+
+
+@override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+class ExamScheduleAsyncViewTests(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.schedules = [create_schedule(title=f"Test Exam {index}") for index in range(3)]
+        Reservation.objects.create(user=self.user, schedule=self.schedules[0], expected_participants=7).confirm()
+        self.list_url = reverse("schedules:exam-schedules-list")
+        self.detail_url = reverse("schedules:exam-schedules-detail", args=[self.schedules[0].id])
+        self.token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        self.client.force_authenticate(user=self.user)
+
+    def async_get(self, url, data=None, headers=None):
+        headers = {"Authorization": f"Bearer {self.token}", **(headers or {})}
+        return async_to_sync(self.async_client.get)(url, data, headers=headers)
+
+    def test_list_schedules__success(self):
+        # Given
+        sync_response = self.client.get(self.list_url)
+
+        # When
+        with mock.patch.object(
+            ExamScheduleAsyncView, "list", autospec=True, side_effect=ExamScheduleAsyncView.list
+        ) as async_list:
+            response = self.async_get(self.list_url)
+
+        # Then
+        async_list.assert_called_once()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response["ETag"], sync_response["ETag"])
+
+    def test_list_schedules__success_with_cursor(self):
+        # Given
+        params = {"pagination": "cursor", "page_size": 2, "search": "Test"}
+        sync_response = self.client.get(self.list_url, params)
+
+        # When
+        response = self.async_get(self.list_url, params)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+
+    def test_retrieve_schedule__success(self):
+        # Given
+        sync_response = self.client.get(self.detail_url)
+
+        # When
+        response = self.async_get(self.detail_url)
+        not_modified_response = self.async_get(self.detail_url, headers={"If-None-Match": sync_response["ETag"]})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), sync_response.json())
+        self.assertEqual(response.json()["confirmed_participants"], 7)
+        self.assertEqual(not_modified_response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_schedule__success_after_pending_change(self):
+        # Given
+        etags = {url: self.async_get(url)["ETag"] for url in [self.list_url, self.detail_url]}
+        Reservation.objects.create(user=self.user, schedule=self.schedules[0], expected_participants=4)
+
+        # When
+        responses = {url: self.async_get(url, headers={"If-None-Match": etag}) for url, etag in etags.items()}
+
+        # Then
+        for url, response in responses.items():
+            self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            self.assertEqual(response["ETag"], self.client.get(url)["ETag"], url)
+        self.assertEqual(responses[self.detail_url].json()["pending_participants"], 4)
+
+    @override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=60)
+    def test_list_schedules__success_with_async_cache(self):
+        # Given
+        cache.clear()
+        urls = [self.list_url, self.detail_url]
+
+        # When
+        with (
+            mock.patch.object(cache, "aget", wraps=cache.aget) as aget,
+            mock.patch.object(cache, "aset", wraps=cache.aset) as aset,
+        ):
+            responses = [self.async_get(url) for url in urls]
+            cached_responses = [self.async_get(url) for url in urls]
+
+        # Then
+        self.assertEqual(aset.call_count, len(urls))
+        self.assertGreaterEqual(aget.call_count, len(urls) * 2)
+        for response, cached_response in zip(responses, cached_responses, strict=True):
+            self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+            self.assertEqual(cached_response.json(), response.json())
+            self.assertEqual(cached_response["ETag"], response["ETag"])
+
+    def test_retrieve_schedule__fail_with_not_found(self):
+        # When
+        response = self.async_get(reverse("schedules:exam-schedules-detail", args=[0]))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_schedules__fail_with_unauthorized(self):
+        # When
+        response = async_to_sync(self.async_client.get)(self.list_url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("WWW-Authenticate", response)
+
+
+class ExamSchedulePendingParticipantsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = create_schedule()
+        self.client.force_authenticate(user=self.user)
+
+    def assertPending(self, participants, reservations):
+        self.schedule.refresh_from_db()
+        self.assertEqual(
+            (self.schedule.pending_participants, self.schedule.pending_reservations), (participants, reservations)
+        )
+
+    def create_reservation(self, expected_participants):
+        response = self.client.post(
+            reverse("reservations:reservations-list"),
+            {"schedule_id": self.schedule.id, "expected_participants": expected_participants},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def test_pending_participants__success_with_create_update_delete(self):
+        # When
+        reservation_id = self.create_reservation(5)
+        self.create_reservation(3)
+
+        # Then
+        self.assertPending(8, 2)
+
+        # When
+        url = reverse("reservations:reservations-detail", args=[reservation_id])
+        self.client.patch(url, {"expected_participants": 9})
+
+        # Then
+        self.assertPending(12, 2)
+
+        # When
+        self.client.delete(url)
+
+        # Then
+        self.assertPending(3, 1)
+
+    def test_pending_participants__success_with_orm_delete(self):
+        # Given
+        reservation = Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=5)
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=3)
+
+        # When
+        reservation.delete()
+
+        # Then
+        self.assertPending(3, 1)
+
+        # When
+        Reservation.objects.filter(schedule=self.schedule).delete()
+
+        # Then
+        self.assertPending(0, 0)
+
+    def test_pending_participants__success_with_cascade_delete(self):
+        # Given
+        other_user = User.objects.create_user(username="otheruser", password="otherpassword")
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=5)
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=4)
+        Reservation.objects.create(user=other_user, schedule=self.schedule, expected_participants=2)
+
+        # When
+        self.user.delete()
+
+        # Then
+        self.assertPending(2, 1)
+
+    def test_delete_schedule__success_with_reservations(self):
+        # Given
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=5)
+
+        # When
+        self.schedule.delete()
+
+        # Then
+        self.assertFalse(Reservation.objects.exists())
+
+    def test_pending_participants__success_with_confirm(self):
+        # Given
+        reservation_id = self.create_reservation(5)
+        self.client.force_authenticate(user=self.admin)
+
+        # When
+        response = self.client.post(reverse("reservations:reservations-confirm", args=[reservation_id]))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertPending(0, 0)
+        self.assertEqual(self.schedule.confirmed_participants, 5)
+
+    def test_pending_participants__success_with_bulk_confirm(self):
+        # Given
+        reservations = [
+            Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=count)
+            for count in [settings.EXAM_SCHEDULE_MAX_PARTICIPANTS - 1, 2]
+        ]
+        self.client.force_authenticate(user=self.admin)
+
+        # When
+        self.client.post(
+            reverse("reservations:reservations-bulk-confirm"),
+            {"ids": [reservation.id for reservation in reservations]},
+            format="json",
+        )
+
+        # Then
+        self.assertPending(2, 1)
+
+    def test_pending_participants__success_with_retrieve_and_list(self):
+        # Given
+        self.create_reservation(4)
+
+        # When
+        detail_response = self.client.get(reverse("schedules:exam-schedules-detail", args=[self.schedule.id]))
+        list_response = self.client.get(reverse("schedules:exam-schedules-list"))
+
+        # Then
+        self.assertEqual(detail_response.data["pending_participants"], 4)
+        self.assertEqual(detail_response.data["pending_reservations"], 1)
+        self.assertEqual(list_response.data["results"][0]["pending_participants"], 4)
+
+    def assertPendingResponses(self, etags, participants, reservations):
+        # 이전 ETag로 조건부 조회 시 변경된 확정 대기 인원/예약 수와 새 ETag가 응답되는지 확인하고 새 ETag를 반환합니다.
+        list_url, detail_url, reservation_url = etags
+        responses = {url: self.client.get(url, HTTP_IF_NONE_MATCH=etag) for url, etag in etags.items()}
+        for url, response in responses.items():
+            self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            self.assertNotEqual(response["ETag"], etags[url], url)
+
+        schedule_data = [
+            responses[list_url].data["results"][0],
+            responses[detail_url].data,
+            responses[reservation_url].data["schedule"],
+        ]
+        for data in schedule_data:
+            self.assertEqual((data["pending_participants"], data["pending_reservations"]), (participants, reservations))
+        return {url: response["ETag"] for url, response in responses.items()}
+
+    def test_pending_participants__success_with_conditional_get(self):
+        for cache_timeout in [60, 0]:
+            with self.subTest(cache_timeout=cache_timeout), self.settings(EXAM_SCHEDULE_CACHE_TIMEOUT=cache_timeout):
+                # Given
+                cache.clear()
+                Reservation.objects.all().delete()
+                version = ExamSchedule.objects.get(id=self.schedule.id).version
+                urls = [
+                    reverse("schedules:exam-schedules-list"),
+                    reverse("schedules:exam-schedules-detail", args=[self.schedule.id]),
+                    reverse("reservations:reservations-detail", args=[self.create_reservation(1)]),
+                ]
+                etags = {url: self.client.get(url)["ETag"] for url in urls}
+
+                # When & Then
+                other_url = reverse("reservations:reservations-detail", args=[self.create_reservation(5)])
+                etags = self.assertPendingResponses(etags, 6, 2)
+
+                self.client.patch(other_url, {"expected_participants": 2})
+                etags = self.assertPendingResponses(etags, 3, 2)
+
+                self.client.delete(other_url)
+                self.assertPendingResponses(etags, 1, 1)
+                self.assertEqual(ExamSchedule.objects.get(id=self.schedule.id).version, version)
+
+    @override_settings(EXAM_SCHEDULE_CACHE_TIMEOUT=0)
+    def test_pending_participants__success_with_shards(self):
+        # Given
+        self.schedule.configure_capacity_shards(4)
+        reservation_id = self.create_reservation(5)
+        self.create_reservation(3)
+        self.client.force_authenticate(user=self.admin)
+
+        # When
+        self.client.post(reverse("reservations:reservations-confirm", args=[reservation_id]))
+        response = self.client.get(reverse("schedules:exam-schedules-detail", args=[self.schedule.id]))
+
+        # Then
+        self.assertPending(0, 0)
+        self.assertEqual(self.schedule.confirmed_participants, 0)
+        self.assertEqual(response.data["confirmed_participants"], 5)
+        self.assertEqual((response.data["pending_participants"], response.data["pending_reservations"]), (3, 1))
+        call_command("reconcile_schedule_counters", stdout=StringIO())
+
+    def test_reconcile_schedule_counters__success_with_fix(self):
+        # Given
+        Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=6)
+        ExamSchedule.objects.filter(id=self.schedule.id).update(pending_participants=1, pending_reservations=0)
+
+        # When
+        with self.assertRaises(CommandError):
+            call_command("reconcile_schedule_counters", stdout=StringIO())
+        call_command("reconcile_schedule_counters", "--fix", stdout=StringIO())
+
+        # Then
+        self.assertPending(6, 1)
+        call_command("reconcile_schedule_counters", stdout=StringIO())
+
+    def test_reconcile_schedule_counters__fail_with_confirmed_mismatch(self):
+        # Given
+        ExamSchedule.objects.filter(id=self.schedule.id).update(confirmed_participants=10)
+
+        # When & Then
+        with self.assertRaisesMessage(CommandError, "Confirmed participants"):
+            call_command("reconcile_schedule_counters", "--fix", stdout=StringIO())
+        self.schedule.refresh_from_db()
+        self.assertEqual(self.schedule.confirmed_participants, 10)
+
+
+class ExamScheduleStatsTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.admin = User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        self.schedule = create_schedule("Math Exam")
+        self.empty_schedule = create_schedule("English Exam")
+        ExamSchedule.objects.filter(id=self.empty_schedule.id).update(start_time=F("start_time") + timedelta(days=1))
+        self.later_schedule = create_schedule("History Exam")
+        ExamSchedule.objects.filter(id=self.later_schedule.id).update(start_time=F("start_time") + timedelta(days=30))
+        reservations = [
+            Reservation.objects.create(user=self.user, schedule=self.schedule, expected_participants=count)
+            for count in [1000, 2000, 500]
+        ]
+        reservations[0].confirm()
+        reservations[1].confirm()
+        Reservation.objects.create(user=self.user, schedule=self.later_schedule, expected_participants=10)
+        self.url = reverse("schedules:exam-schedules-stats")
+        self.client.force_authenticate(user=self.admin)
+
+    def test_schedule_stats__success(self):
+        # Given
+        window = {
+            "from": self.schedule.start_time.isoformat(),
+            "to": (self.schedule.start_time + timedelta(days=7)).isoformat(),
+        }
+
+        # When
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, window)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["schedule_id"] for row in response.data], [self.schedule.id, self.empty_schedule.id])
+        stats, empty_stats = response.data
+        self.assertEqual(stats["reservations"], 3)
+        self.assertEqual(stats["confirmed_reservations"], 2)
+        self.assertEqual(stats["pending_reservations"], 1)
+        self.assertEqual(stats["confirmed_participants"], 3000)
+        self.assertEqual(stats["pending_participants"], 500)
+        self.assertEqual(stats["fill_ratio"], round(3000 / settings.EXAM_SCHEDULE_MAX_PARTICIPANTS, 4))
+        self.assertGreater(stats["seconds_to_deadline"], 0)
+        self.assertEqual(
+            (empty_stats["reservations"], empty_stats["confirmed_participants"], empty_stats["fill_ratio"]), (0, 0, 0)
+        )
+
+    def test_schedule_stats__success_with_detail(self):
+        # When
+        response = self.client.get(reverse("schedules:exam-schedules-schedule-stats", args=[self.later_schedule.id]))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "History Exam")
+        self.assertEqual(response.data["pending_participants"], 10)
+        self.assertEqual(response.data["confirmed_participants"], 0)
+
+    def test_schedule_stats__fail_with_invalid_window(self):
+        # Given
+        now = timezone.now()
+        max_width = timedelta(days=settings.EXAM_SCHEDULE_STATS_MAX_WINDOW_DAYS)
+
+        # When
+        reversed_response = self.client.get(
+            self.url, {"from": now.isoformat(), "to": (now - timedelta(days=1)).isoformat()}
+        )
+        missing_response = self.client.get(self.url, {"from": now.isoformat()})
+        wide_response = self.client.get(
+            self.url, {"from": now.isoformat(), "to": (now + max_width + timedelta(seconds=1)).isoformat()}
+        )
+
+        # Then
+        self.assertEqual(reversed_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(missing_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("to", missing_response.data)
+        self.assertEqual(wide_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("to", wide_response.data)
+
+    def test_schedule_stats__fail_with_not_found(self):
+        # When
+        response = self.client.get(reverse("schedules:exam-schedules-schedule-stats", args=[0]))
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_schedule_stats__fail_with_user(self):
+        # Given
+        self.client.force_authenticate(user=self.user)
+
+        # When
+        response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ExamScheduleAvailableTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.start_time = timezone.now() + timedelta(days=settings.EXAM_RESERVATION_DEADLINE_DAYS + 1)
+        self.schedules = []
+        for index in range(6):
+            self.schedules.append(
+                ExamSchedule.objects.create(
+                    title=f"Test Exam {index}",
+                    start_time=self.start_time + timedelta(days=index),
+                    end_time=self.start_time + timedelta(days=index, hours=2),
+                )
+            )
+        self.url = reverse("schedules:exam-schedules-available")
+        self.client.force_authenticate(user=self.user)
+
+    def collect_ids(self, params):
+        ids, url = [], self.url
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item["id"] for item in response.data["results"])
+            url, params = response.data["next"], None
+        return ids
+
+    def test_available_schedules__success(self):
+        # Given
+        maximum = settings.EXAM_SCHEDULE_MAX_PARTICIPANTS
+        past_deadline, full, almost_full, sharded_full, sharded_open, open_schedule = self.schedules
+        ExamSchedule.objects.filter(id=past_deadline.id).update(start_time=timezone.now() + timedelta(days=1))
+        full.add_confirmed_participant(maximum)
+        almost_full.add_confirmed_participant(maximum - 5)
+        sharded_full.configure_capacity_shards(2)
+        ExamSchedule.change_confirmed_participants(sharded_full.id, maximum - 5)
+        sharded_open.configure_capacity_shards(2)
+
+        # When
+        ids = self.collect_ids({"min_capacity": 10})
+        small_ids = self.collect_ids({"min_capacity": 5})
+
+        # Then
+        self.assertEqual(ids, [sharded_open.id, open_schedule.id])
+        self.assertEqual(small_ids, [almost_full.id, sharded_full.id, sharded_open.id, open_schedule.id])
+
+    def test_available_schedules__success_with_window_and_cursor(self):
+        # Given
+        params = {
+            "from": (self.start_time + timedelta(days=1)).isoformat(),
+            "to": (self.start_time + timedelta(days=5)).isoformat(),
+            "page_size": 1,
+        }
+
+        # When
+        ids = self.collect_ids(params)
+
+        # Then
+        self.assertEqual(ids, [schedule.id for schedule in self.schedules[1:5]])
+
+    def test_available_schedules__fail_with_invalid_min_capacity(self):
+        # When
+        response = self.client.get(self.url, {"min_capacity": settings.EXAM_SCHEDULE_MAX_PARTICIPANTS + 1})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("min_capacity", response.data)
+
+    def test_available_schedules__fail_with_unauthenticated_user(self):
+        # Given
+        self.client.force_authenticate(user=None)
+
+        # When
+        response = self.client.get(self.url)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
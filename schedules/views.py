@@ -1,21 +1,250 @@
-from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
+from django.db import transaction
+from django.db.models import Count, Max, Sum
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import SAFE_METHODS, IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
 
+from core.async_views import AsyncReadView
+from core.etag import (
+    aconditional_response,
+    check_if_match,
+    conditional_response,
+    make_etag,
+    make_versioned_etag,
+    parse_if_match,
+)
+from core.pagination import KeysetPaginationMixin
 from core.permissions import IsAdminUserOrReadOnly
+from core.timing import TimedPermissionsMixin, timed
+from schedules.cache import (
+    aget_cached_response_data,
+    aget_schedule_detail_cache_key,
+    aget_schedule_list_cache_key,
+    get_cached_response_data,
+    get_schedule_detail_cache_key,
+    get_schedule_list_cache_key,
+)
 from schedules.models import ExamSchedule
+from schedules.pagination import ExamScheduleCursorPagination
 from schedules.schemas import exam_schedule_schema_view
-from schedules.serializers import ExamScheduleSerializer
+from schedules.serializers import (
+    ExamScheduleAvailabilitySerializer,
+    ExamScheduleListProjection,
+    ExamScheduleSerializer,
+    ExamScheduleStatsProjection,
+    ExamScheduleStatsWindowSerializer,
+)
 
 
 @exam_schedule_schema_view
-class ExamScheduleViewSet(viewsets.ModelViewSet):
+class ExamScheduleViewSet(TimedPermissionsMixin, KeysetPaginationMixin, viewsets.ModelViewSet):
     """
     시험 일정 뷰셋
     """
 
-    queryset = ExamSchedule.objects.all()
+    queryset = ExamSchedule.objects.with_counter_totals()
     serializer_class = ExamScheduleSerializer
     permission_classes = [IsAuthenticated, IsAdminUserOrReadOnly]
     filterset_fields = ["start_time", "end_time"]
     search_fields = ["title"]
     ordering_fields = ["title", "start_time"]
+    keyset_pagination_class = ExamScheduleCursorPagination
+
+    def get_object(self):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        if self.request.method not in SAFE_METHODS:
+            # 조건부 UPDATE로 변경되는 확정 인원/버전을 덮어쓰지 않도록 update, delete 시 select_for_update 사용
+            queryset = queryset.select_for_update(of=("self",))
+
+        obj = get_object_or_404(queryset, pk=self.kwargs["pk"])
+        self.check_object_permissions(self.request, obj)
+        if self.request.method not in SAFE_METHODS:
+            # 잠금을 얻은 뒤 버전을 비교하므로, 검사 이후 커밋 전까지 다른 요청이 일정을 변경할 수 없습니다.
+            check_if_match(parse_if_match(self.request), obj.version)
+        return obj
+
+    @staticmethod
+    def get_list_etag_aggregates():
+        return {
+            "count": Count("id"),
+            "max_id": Max("id"),
+            "version": Sum("version"),
+            "confirmed": Sum("confirmed_total"),
+            "pending": Sum("pending_total"),
+            "pending_reservations": Sum("pending_reservations_total"),
+        }
+
+    def get_list_etag(self):
+        """
+        필터링된 일정들의 개수, 최대 id, 버전 합계, 확정/확정 대기 인원 합계로 목록 ETag를 만듭니다.
+
+        - 확정 대기 카운터는 일정 버전을 올리지 않고 변경되므로 합계를 직접 포함합니다.
+        """
+        summary = self.filter_queryset(self.get_queryset()).aggregate(**self.get_list_etag_aggregates())
+        return make_etag("exam-schedules", *summary.values())
+
+    def get_retrieve_etag(self):
+        """
+        일정의 버전과 (스트라이프 포함) 확정/확정 대기 인원으로 상세 ETag를 만듭니다. 일정이 없으면 None
+
+        - ETag는 일정 버전으로 시작하므로 수정/삭제 요청의 If-Match 헤더로 사용할 수 있습니다.
+        """
+        try:
+            row = (
+                self.filter_queryset(self.get_queryset())
+                .filter(pk=self.kwargs["pk"])
+                .values_list("version", "id", *ExamScheduleListProjection.totals)
+                .first()
+            )
+        except ValueError:
+            return None
+        if row is None:
+            return None
+        version, *parts = row
+        return make_versioned_etag(version, "exam-schedule", *parts)
+
+    def list(self, request, *args, **kwargs):
+        return get_cached_response_data(
+            request,
+            get_schedule_list_cache_key(request),
+            lambda: conditional_response(request, self.get_list_etag(), lambda: self._list(request, *args, **kwargs)),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return get_cached_response_data(
+            request,
+            get_schedule_detail_cache_key(request, kwargs["pk"]),
+            lambda: conditional_response(
+                request,
+                self.get_retrieve_etag(),
+                lambda: super(ExamScheduleViewSet, self).retrieve(request, *args, **kwargs),
+            ),
+        )
+
+    @transaction.atomic
+    def update(self, request, *args, **kwargs):
+        response = super().update(request, *args, **kwargs)
+        etag = self.get_retrieve_etag()
+        if etag is not None and response.status_code == status.HTTP_200_OK:
+            response["ETag"] = etag
+        return response
+
+    @action(detail=False, methods=["get"], url_path="available")
+    def available(self, request):
+        """
+        조회 구간(`from`, `to`)에 시작하고, 예약 마감 전이며 남은 인원이 `min_capacity`명 이상인 일정을 조회합니다.
+
+        - 마감/인원 조건은 SQL로 검사하며, 일정 수와 관계없이 시작 시간 순 커서 페이지네이션으로 응답합니다.
+        """
+        params = ExamScheduleAvailabilitySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        queryset = params.filter_queryset(self.filter_queryset(self.get_queryset()))
+        queryset = queryset.open_for_reservation(params.validated_data["min_capacity"])
+
+        paginator = self.keyset_pagination_class()
+        page = paginator.paginate_queryset(ExamScheduleListProjection.values(queryset), request, view=self)
+        with timed("serializer"):
+            data = [ExamScheduleListProjection.to_representation(row) for row in page]
+        return paginator.get_paginated_response(data)
+
+    @action(detail=False, methods=["get"], url_path="stats", permission_classes=[IsAdminUser])
+    def stats(self, request):
+        """
+        조회 구간(`from`, `to`)의 모든 일정에 대한 예약 통계를 예약 테이블 GROUP BY 쿼리 한 번으로 조회합니다.
+
+        - 페이지로 나누지 않으므로 조회 구간은 필수이며 EXAM_SCHEDULE_STATS_MAX_WINDOW_DAYS일 이하여야 합니다.
+        """
+        window = ExamScheduleStatsWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+        queryset = window.filter_queryset(self.filter_queryset(ExamSchedule.objects.all()))
+
+        now = timezone.now()
+        rows = list(ExamScheduleStatsProjection.values(queryset.order_by("start_time", "id")))
+        with timed("serializer"):
+            data = [ExamScheduleStatsProjection.to_representation(row, now) for row in rows]
+        return Response(data)
+
+    @action(detail=True, methods=["get"], url_path="stats", permission_classes=[IsAdminUser])
+    def schedule_stats(self, request, pk=None):
+        """
+        일정 하나의 예약 통계를 조회합니다.
+        """
+        try:
+            row = ExamScheduleStatsProjection.values(ExamSchedule.objects.filter(pk=pk)).first()
+        except ValueError:
+            row = None
+        if row is None:
+            raise Http404(f"No {ExamSchedule._meta.object_name} matches the given query.")
+        return Response(ExamScheduleStatsProjection.to_representation(row, timezone.now()))
+
+    @transaction.atomic
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
+    def _list(self, request, *args, **kwargs):
+        # 목록 조회는 serializer 대신 values() 기반 프로젝션으로 응답을 만듭니다.
+        queryset = ExamScheduleListProjection.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            with timed("serializer"):
+                data = [ExamScheduleListProjection.to_representation(row) for row in page]
+            return self.get_paginated_response(data)
+
+        rows = list(queryset)
+        with timed("serializer"):
+            data = [ExamScheduleListProjection.to_representation(row) for row in rows]
+        return Response(data)
+
+
+class ExamScheduleAsyncView(AsyncReadView):
+    """
+    시험 일정 목록/상세 조회 비동기 뷰 (ASGI)
+
+    - ExamScheduleViewSet과 같은 권한, 필터, 페이지네이션, 캐시, ETag, 응답 형태를 사용합니다.
+    """
+
+    view_class = ExamScheduleViewSet
+
+    async def list(self, view, request):
+        async def build_response():
+            queryset = await self.filter_queryset(view, view.get_queryset())
+            summary = await queryset.aaggregate(**view.get_list_etag_aggregates())
+            return await aconditional_response(
+                request,
+                make_etag("exam-schedules", *summary.values()),
+                lambda: self.paginate(
+                    view, ExamScheduleListProjection.values(queryset), ExamScheduleListProjection.to_representation
+                ),
+            )
+
+        return await aget_cached_response_data(request, await aget_schedule_list_cache_key(request), build_response)
+
+    async def retrieve(self, view, request, pk):
+        async def build_response():
+            queryset = await self.filter_queryset(view, view.get_queryset())
+            try:
+                row = await ExamScheduleListProjection.values(queryset.filter(pk=pk)).afirst()
+            except ValueError:
+                row = None
+            if row is None:
+                raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
+            return conditional_response(
+                request,
+                make_versioned_etag(
+                    row["version"],
+                    "exam-schedule",
+                    row["id"],
+                    *(row[name] for name in ExamScheduleListProjection.totals),
+                ),
+                lambda: Response(ExamScheduleListProjection.to_representation(row)),
+            )
+
+        cache_key = await aget_schedule_detail_cache_key(request, pk)
+        return await aget_cached_response_data(request, cache_key, build_response)
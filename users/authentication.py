@@ -0,0 +1,171 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+User = get_user_model()
+
+USER_MODE_DB = "db"
+USER_MODE_STATELESS = "stateless"
+USER_MODE_CACHED = "cached"
+
+
+class UserCache:
+    """
+    프로세스 내 TTL/LRU 사용자 캐시
+
+    - 항목은 timeout(초)이 지나면 만료되고, maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 워커 프로세스마다 별도로 유지되므로 다른 프로세스의 무효화는 TTL 이후에 반영됩니다.
+    """
+
+    def __init__(self):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            item = self._items.get(user_id)
+            if item is None:
+                return None
+            expires_at, user = item
+            if expires_at <= time.monotonic():
+                del self._items[user_id]
+                return None
+            self._items.move_to_end(user_id)
+        # 요청마다 같은 인스턴스를 공유하지 않도록 복사본을 반환합니다.
+        return copy.copy(user)
+
+    def set(self, user_id, user):
+        timeout = settings.JWT_AUTH_USER_CACHE_TIMEOUT
+        if not timeout:
+            return
+        with self._lock:
+            self._items[user_id] = (time.monotonic() + timeout, copy.copy(user))
+            self._items.move_to_end(user_id)
+            while len(self._items) > settings.JWT_AUTH_USER_CACHE_MAXSIZE:
+                self._items.popitem(last=False)
+
+    def delete(self, user_id):
+        with self._lock:
+            self._items.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+user_cache = UserCache()
+
+
+def invalidate_user_cache(user_id):
+    """
+    캐시된 인증 사용자를 무효화합니다.
+    """
+    user_cache.delete(str(user_id))
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    요청마다 사용자 테이블을 조회하지 않는 JWT 인증
+
+    JWT_AUTH_USER_MODE 설정에 따라 사용자를 가져옵니다.
+
+    - db: 기존 JWTAuthentication과 동일하게 매 요청마다 사용자를 조회합니다.
+    - stateless: 토큰 클레임(id, username, email, is_staff)으로 저장되지 않은 User 인스턴스를 만듭니다.
+    - cached: 조회한 사용자를 프로세스 내 TTL/LRU 캐시에 보관합니다. (사용자 수정 시 무효화)
+    - stateless 모드는 토큰 만료 전까지 비활성화/권한 변경이 반영되지 않습니다.
+    - 비동기 뷰에서는 aauthenticate로 인증하며, 사용자 조회가 필요한 경우 비동기 ORM을 사용합니다.
+    """
+
+    claim_fields = ("username", "email", "is_staff")
+
+    def get_user(self, validated_token):
+        user = self.get_user_without_query(validated_token)
+        if user is None:
+            user = super().get_user(validated_token)
+            self.cache_user(validated_token, user)
+        return user
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user = self.get_user_without_query(validated_token)
+        if user is None:
+            user = await self.aget_user_from_db(validated_token)
+            self.cache_user(validated_token, user)
+        return user
+
+    async def aget_user_from_db(self, validated_token):
+        """
+        JWTAuthentication.get_user와 같은 검사를 하는 비동기 사용자 조회
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        try:
+            user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
+
+    def get_user_without_query(self, validated_token):
+        """
+        DB 조회 없이 사용자를 가져옵니다. 조회가 필요하면 None
+        """
+        mode = settings.JWT_AUTH_USER_MODE
+        if mode == USER_MODE_STATELESS:
+            return self.get_user_from_claims(validated_token)
+        if mode == USER_MODE_CACHED:
+            return user_cache.get(self.get_cache_key(validated_token))
+        return None
+
+    def cache_user(self, validated_token, user):
+        if settings.JWT_AUTH_USER_MODE == USER_MODE_CACHED:
+            user_cache.set(self.get_cache_key(validated_token), user)
+
+    @staticmethod
+    def get_cache_key(validated_token):
+        return str(validated_token.get(api_settings.USER_ID_CLAIM))
+
+    def get_user_from_claims(self, validated_token):
+        # 클레임이 없는 이전 토큰은 DB에서 조회합니다.
+        if any(field not in validated_token for field in self.claim_fields):
+            return None
+
+        user = User(
+            **{api_settings.USER_ID_FIELD: validated_token.get(api_settings.USER_ID_CLAIM)},
+            **{field: validated_token[field] for field in self.claim_fields},
+        )
+        # 이미 저장된 사용자로 취급하여 외래 키 할당/비교에 사용할 수 있도록 합니다.
+        user._state.adding = False
+        user._state.db = "default"
+        return user
@@ -0,0 +1,104 @@
+import base64
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, pbkdf2
+from django.utils.encoding import force_bytes
+
+
+class HashingPoolBusy(Exception):
+    """
+    해싱 대기열이 가득 차 비밀번호를 해싱하지 않은 경우
+
+    - authenticate() 등 DRF 밖에서도 발생하므로 DRF 예외가 아닙니다.
+    - DRF 뷰에서는 core.exceptions.exception_handler가, 그 외 요청에서는 HashingPoolBusyMiddleware가 503으로 응답합니다.
+    """
+
+    message = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+    code = "hashing_pool_busy"
+    wait = 1  # Retry-After 헤더 (초)
+
+
+class HashingExecutor:
+    """
+    비밀번호 해싱 전용 프로세스 풀
+
+    - PASSWORD_HASHING_POOL_SIZE개의 프로세스에서 해싱하며, 0이면 현재 스레드에서 바로 해싱합니다.
+    - 실행 중 + 대기 중인 해싱이 POOL_SIZE + PASSWORD_HASHING_QUEUE_DEPTH를 넘으면 기다리지 않고 503을 반환합니다.
+    - 풀은 워커 프로세스(pid)마다 처음 사용할 때 만들어집니다. (gunicorn fork 이후 재사용 방지)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._executor = None
+        self._slots = None
+
+    def _get_pool(self, pool_size, queue_depth):
+        key = (os.getpid(), pool_size, queue_depth)
+        with self._lock:
+            if self._key != key:
+                if self._executor is not None and self._key[0] == key[0]:
+                    self._executor.shutdown(wait=False)
+                # 요청 처리 스레드가 있는 상태에서 fork하지 않도록 spawn 방식으로 프로세스를 만듭니다.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=pool_size, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._slots = threading.BoundedSemaphore(pool_size + queue_depth)
+                self._key = key
+            return self._executor, self._slots
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._key = self._executor = self._slots = None
+
+    def pbkdf2(self, password, salt, iterations, digest):
+        pool_size = settings.PASSWORD_HASHING_POOL_SIZE
+        if not pool_size:
+            return pbkdf2(password, salt, iterations, digest=digest)
+
+        executor, slots = self._get_pool(pool_size, settings.PASSWORD_HASHING_QUEUE_DEPTH)
+        if not slots.acquire(blocking=False):
+            raise HashingPoolBusy()
+        try:
+            future = executor.submit(
+                hashlib.pbkdf2_hmac, digest().name, force_bytes(password), force_bytes(salt), iterations
+            )
+            return future.result()
+        except BrokenProcessPool:
+            # 풀 프로세스가 비정상 종료된 경우 다음 요청에서 새로 만듭니다.
+            self._reset(executor)
+            raise
+        finally:
+            slots.release()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._key = self._executor = self._slots = None
+
+
+hashing_executor = HashingExecutor()
+
+
+class PooledPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    해싱 프로세스 풀에서 PBKDF2를 계산하는 해셔
+
+    - 알고리즘 이름과 결과 형식이 PBKDF2PasswordHasher와 같아 기존 비밀번호 해시를 그대로 검증합니다.
+    - authenticate()의 check_password와 set_password 모두 이 해셔를 사용합니다.
+    """
+
+    def encode(self, password, salt, iterations=None):
+        self._check_encode_args(password, salt)
+        iterations = iterations or self.iterations
+        hash = hashing_executor.pbkdf2(password, salt, iterations, digest=self.digest)
+        hash = base64.b64encode(hash).decode("ascii").strip()
+        return f"{self.algorithm}${iterations}${salt}${hash}"
@@ -0,0 +1,20 @@
+from django.http import HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+from users.hashers import HashingPoolBusy
+
+
+class HashingPoolBusyMiddleware(MiddlewareMixin):
+    """
+    관리자 로그인 등 DRF 밖의 뷰에서 해싱 대기열이 가득 찬 경우 500 대신 503으로 응답하는 미들웨어
+    """
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, HashingPoolBusy):
+            return None
+        return HttpResponse(
+            exception.message,
+            status=503,
+            content_type="text/plain; charset=utf-8",
+            headers={"Retry-After": str(exception.wait)},
+        )
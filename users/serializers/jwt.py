@@ -9,5 +9,6 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         # 사용자 정의 클레임 추가
         token["username"] = user.username
         token["email"] = user.email
+        token["is_staff"] = user.is_staff
 
         return token
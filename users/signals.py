@@ -0,0 +1,16 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.authentication import invalidate_user_cache
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_authenticated_user(sender, instance, **kwargs):
+    """
+    사용자가 수정/삭제되면 인증 사용자 캐시를 무효화합니다. (UserMeView, 관리자 페이지 등)
+    """
+    invalidate_user_cache(instance.pk)
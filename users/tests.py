@@ -1,7 +1,14 @@
+from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.authentication import user_cache
+from users.hashers import hashing_executor
+from users.serializers.jwt import CustomTokenObtainPairSerializer
 
 User = get_user_model()
 
@@ -175,3 +182,203 @@ class UserTokenRefreshTests(APITestCase):
 
         # Then
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = create_user(username="testuser", email="test@example.com", password="testpassword")
+
+    def authenticate(self, token=None):
+        token = token or CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    @override_settings(JWT_AUTH_USER_MODE="stateless")
+    def test_user_me__success_with_stateless_mode(self):
+        # Given
+        self.authenticate()
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.get(ME_URL)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"id": self.user.id, "username": "testuser", "email": "test@example.com"})
+
+    @override_settings(JWT_AUTH_USER_MODE="stateless")
+    def test_user_me__success_with_stateless_mode_without_claims(self):
+        # Given
+        self.authenticate(RefreshToken.for_user(self.user).access_token)
+
+        # When
+        with self.assertNumQueries(1):
+            response = self.client.get(ME_URL)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["email"], "test@example.com")
+
+    @override_settings(JWT_AUTH_USER_MODE="stateless")
+    def test_user_me_update__success_with_stateless_mode(self):
+        # Given
+        self.authenticate()
+
+        # When
+        response = self.client.patch(ME_URL, {"email": "new@example.com"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "new@example.com")
+        self.assertTrue(self.user.check_password("testpassword"))
+
+    @override_settings(JWT_AUTH_USER_MODE="cached")
+    def test_user_me__success_with_cached_mode(self):
+        # Given
+        self.authenticate()
+        self.client.get(ME_URL)
+
+        # When
+        with self.assertNumQueries(0):
+            response = self.client.get(ME_URL)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["username"], "testuser")
+
+    @override_settings(JWT_AUTH_USER_MODE="cached")
+    def test_user_me__success_with_cached_mode_after_update(self):
+        # Given
+        self.authenticate()
+        self.client.get(ME_URL)
+
+        # When
+        self.client.patch(ME_URL, {"email": "new@example.com"})
+        response = self.client.get(ME_URL)
+
+        # Then
+        self.assertEqual(response.data["email"], "new@example.com")
+
+    @override_settings(JWT_AUTH_USER_MODE="cached")
+    def test_user_me__fail_with_cached_mode_after_deactivate(self):
+        # Given
+        self.authenticate()
+        self.client.get(ME_URL)
+
+        # When
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get(ME_URL)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(PASSWORD_HASHING_POOL_SIZE=1, PASSWORD_HASHING_QUEUE_DEPTH=0)
+class PasswordHashingPoolTests(APITestCase):
+    def tearDown(self):
+        hashing_executor.shutdown()
+
+    def test_user_register__success_with_hashing_pool(self):
+        # Given
+        payload = {
+            "username": "testuser",
+            "email": "test@example.com",
+            "password": "testpassword",
+            "password_confirm": "testpassword",
+        }
+
+        # When
+        response = self.client.post(REGISTER_URL, payload)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get()
+        self.assertTrue(user.password.startswith("pbkdf2_sha256$"))
+        with override_settings(PASSWORD_HASHING_POOL_SIZE=0):
+            self.assertTrue(user.check_password("testpassword"))
+
+    def test_user_token__success_with_hashing_pool(self):
+        # Given
+        with override_settings(PASSWORD_HASHING_POOL_SIZE=0):
+            create_user(username="testuser", email="test@example.com", password="testpassword")
+
+        # When
+        response = self.client.post(TOKEN_URL, {"username": "testuser", "password": "testpassword"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("access", response.data)
+
+    def test_user_token__fail_with_full_hashing_pool(self):
+        # Given
+        with override_settings(PASSWORD_HASHING_POOL_SIZE=0):
+            create_user(username="testuser", email="test@example.com", password="testpassword")
+        _, slots = hashing_executor._get_pool(1, 0)
+        slots.acquire()
+
+        # When
+        try:
+            response = self.client.post(TOKEN_URL, {"username": "testuser", "password": "testpassword"})
+        finally:
+            slots.release()
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.data["detail"].code, "hashing_pool_busy")
+        self.assertEqual(response["Retry-After"], "1")
+
+    def test_admin_login__fail_with_full_hashing_pool(self):
+        # Given
+        with override_settings(PASSWORD_HASHING_POOL_SIZE=0):
+            User.objects.create_user(username="adminuser", password="adminpassword", is_staff=True)
+        _, slots = hashing_executor._get_pool(1, 0)
+        slots.acquire()
+
+        # When
+        try:
+            response = self.client.post(reverse("admin:login"), {"username": "adminuser", "password": "adminpassword"})
+        finally:
+            slots.release()
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "1")
+
+
+class UserMeAsyncTests(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = create_user(username="testuser", email="test@example.com", password="testpassword")
+
+    def test_user_me__success(self):
+        # Given
+        token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+
+        # When
+        response = async_to_sync(self.async_client.get)(ME_URL, headers={"Authorization": f"Bearer {token}"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"id": self.user.id, "username": "testuser", "email": "test@example.com"})
+
+    @override_settings(JWT_AUTH_USER_MODE="db")
+    def test_user_me__fail_with_inactive_user(self):
+        # Given
+        token = CustomTokenObtainPairSerializer.get_token(self.user).access_token
+        self.user.is_active = False
+        self.user.save()
+
+        # When
+        response = async_to_sync(self.async_client.get)(ME_URL, headers={"Authorization": f"Bearer {token}"})
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_me__fail_with_unauthorized(self):
+        # When
+        response = async_to_sync(self.async_client.get)(ME_URL)
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
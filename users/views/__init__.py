@@ -1,9 +1,10 @@
 from .jwt import JWTTokenObtainPairView, JWTTokenRefreshView
-from .users import UserRegisterView, UserMeView
+from .users import UserRegisterView, UserMeView, UserMeAsyncView
 
 __all__ = [
     "JWTTokenObtainPairView",
     "JWTTokenRefreshView",
     "UserRegisterView",
     "UserMeView",
+    "UserMeAsyncView",
 ]
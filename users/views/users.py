@@ -1,6 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import generics, permissions
+from rest_framework.response import Response
 
+from core.async_views import AsyncReadView
 from users.schemas import user_me_schema, user_me_update_schema, user_register_schema
 from users.serializers.users import UserMeSerializer, UserRegisterSerializer, UserUpdateSerializer
 
@@ -28,6 +30,9 @@ class UserMeView(generics.RetrieveUpdateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_object(self):
+        # 인증 방식에 따라 request.user가 토큰 클레임으로 만든 사용자일 수 있으므로 수정 시에는 DB에서 조회합니다.
+        if self.request.method not in permissions.SAFE_METHODS:
+            return User.objects.get(pk=self.request.user.pk)
         return self.request.user
 
     def get_serializer_class(self):
@@ -46,3 +51,15 @@ class UserMeView(generics.RetrieveUpdateAPIView):
     @user_me_update_schema
     def patch(self, request, *args, **kwargs):
         return super().patch(request, *args, **kwargs)
+
+
+class UserMeAsyncView(AsyncReadView):
+    """
+    현재 사용자 정보 조회 비동기 뷰 (ASGI)
+    """
+
+    view_class = UserMeView
+    action = "retrieve"
+
+    async def retrieve(self, view, request):
+        return Response(view.get_serializer(request.user).data)